@@ -6,7 +6,12 @@ hio.base Package
 import importlib
 
 from .tyming import Tymist, Tymee, Tymer
-from .doing import Doist, doize, doify, Doer, DoDoer
+from .doing import Doist, doize, doify, Doer, DoDoer, Waker, offload
+from .profiling import Profiler, Stat
+from .tracing import Tracer
+from .pooling import Pool, Shared
+from .watching import Watchdog
+from .metering import Meter
 from .filing import openFiler, Filer, FilerDoer
 from .webduring import WebSubDb, WebDuror, openWebDuror
 
@@ -19,6 +24,15 @@ __all__ = (
     "doify",
     "Doer",
     "DoDoer",
+    "Waker",
+    "offload",
+    "Profiler",
+    "Stat",
+    "Tracer",
+    "Pool",
+    "Shared",
+    "Watchdog",
+    "Meter",
     "openFiler",
     "Filer",
     "FilerDoer",
@@ -2,21 +2,477 @@
 """
 hio.core.doing Module
 """
+import gc
+import os
 import time
 import types
 import inspect
+import warnings
+from fractions import Fraction
+import heapq
+import itertools
+import math
+import selectors
+import weakref
 from inspect import isgeneratorfunction
 from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 import asyncio
 
 from .. import hioing
 from .basing import State
 from . import tyming
+from .tracing import NullContext
+from .profiling import Stat
 from ..help import timing, helping
 
 
 Deed = namedtuple("Deed", "dog retyme doer")
 
+
+def earliest(deeds, heap=False):
+    """Returns earliest tyme at which any deed in deeds is due to run.
+
+    The due tyme of a deed is its retyme except when its doer is a plain
+    DoDoer with zero tock that runs every pass. Then the due tyme is the later
+    of its retyme and the earliest due tyme of its own nested deeds so that
+    idle nested deeds are seen through. Subclasses of DoDoer that override
+    .recur may do work on every pass so they are due at their retyme.
+
+    Returns::
+
+        earliest (float | None): earliest due tyme of deeds.
+            None means no deed is due to run without some outside change.
+
+    Parameters::
+
+        deeds (deque | list): deque of triples (dog, retyme, doer) or when heap
+            heap list of quadruples (retyme, order, dog, doer)
+        heap (bool): True means deeds is heap list. False means deeds is deque.
+    """
+    best = None
+    if heap:  # walk heap pruning subtrees whose retyme can not be earlier
+        stack = [0]
+        while stack:
+            i = stack.pop()
+            if i >= len(deeds):
+                continue
+            retyme, order, dog, doer = deeds[i]
+            if best is not None and retyme >= best:  # children are no earlier
+                continue
+            due = _due(retyme, doer)
+            if due is not None and (best is None or due < best):
+                best = due
+            stack.extend((2 * i + 2, 2 * i + 1))
+    else:
+        for dog, retyme, doer in deeds:
+            if not dog:  # marker deed
+                continue
+            due = _due(retyme, doer)
+            if due is not None and (best is None or due < best):
+                best = due
+    return best
+
+
+def _due(retyme, doer):
+    """Returns due tyme (float | None) of deed with retyme and doer.
+    See earliest.
+    """
+    if retyme == math.inf:  # waits on outside event such as async deed task
+        return None
+    if (isinstance(doer, DoDoer) and type(doer).recur is DoDoer.recur
+            and not doer.tock):  # plain dodoer runs every pass so see through
+        nested = doer.earliest()
+        if nested is None:
+            if doer.deeds:  # nested deeds wait on outside event
+                return None
+            return None if doer.always else retyme  # must run to complete
+        return max(retyme, nested)
+    return retyme
+
+
+def _priority(doer):
+    """Returns priority (int) of doer. Its opts "priority" if any else its
+    .priority attribute if any else 0.
+    """
+    opts = getattr(doer, "opts", None)
+    priority = opts.get("priority") if opts else None
+    if priority is None:
+        priority = getattr(doer, "priority", 0)
+    return priority
+
+
+def _rank(doer, ages, dog):
+    """Returns rank (int) of ready deed with dog of doer. The rank is the
+    priority of doer plus the number of passes the deed has been deferred in
+    ages so deferred deeds sort ahead of newer ready deeds.
+
+    Parameters::
+
+        doer (Doer | Callable): doer of deed
+        ages (weakref.WeakKeyDictionary): deferred passes keyed by dog
+        dog (Generator): dog of deed
+    """
+    return _priority(doer) + ages.get(dog, 0)
+
+
+def _unranked(doer, heap):
+    """Warn when doer has a priority that a deque scheduler ignores.
+
+    Parameters::
+
+        doer (Doer | Callable): doer being entered
+        heap (bool): True means scheduler has heap so priority applies
+    """
+    if not heap and _priority(doer):
+        warnings.warn("Priority of doer {} ignored without heap.".format(doer),
+                      RuntimeWarning, stacklevel=3)
+
+
+def _send(dog, tyme, doer, profiler=None, tracer=None, watchdog=None):
+    """Returns tock yielded by dog when sent tyme with the send recorded by
+    profiler and or tracer and watched by watchdog. StopIteration and other
+    exceptions propagate.
+    """
+    if watchdog is not None:
+        watchdog.begin(doer)
+        try:
+            if profiler is None and tracer is None:
+                return dog.send(tyme)
+            return _send(dog, tyme, doer, profiler, tracer)
+        finally:
+            watchdog.end()
+    if tracer is None:
+        return profiler.send(dog, tyme, doer)
+    if profiler is None:
+        return tracer.send(dog, tyme, doer)
+    start = tracer.begin()
+    try:
+        return profiler.send(dog, tyme, doer)
+    finally:
+        tracer.complete(tracer.label(doer), start, cat="deed", tyme=tyme)
+
+
+def _close(dog, doer):
+    """Force close dog of doer which throws GeneratorExit into dog and assign
+    the done state of the forced close to doer.
+    """
+    try:
+        done = dog.close()  # force GeneratorExit returns None if already closed or Gen Return value
+    except StopIteration:
+        pass  # Hmm? Not supposed to happen!
+    else:  # set done state forced close
+        try:  # not bound method generator but doer instance or function
+            doer.done = done if done is not None else doer.done
+        except AttributeError:  # when using bound method generator
+            # writing to doer.__func__.done read from doer.done
+            doer.__func__.done = done if done is not None else doer.done
+
+
+def _purge(deeds, tombs, heap=False, ready=None):
+    """Purge deeds whose dog is in tombs from deeds and ready in place and
+    discard purged dogs from tombs. Keeps the run through once marker deed.
+
+    Parameters::
+
+        deeds (deque | list): deque of triples (dog, retyme, doer) or when heap
+            heap list of quadruples (retyme, order, dog, doer)
+        tombs (set): dogs of removed deeds
+        heap (bool): True means deeds is heap list. False means deeds is deque.
+        ready (deque | None): ready heap deeds not yet run in current recur
+    """
+    if heap:
+        purged = [deed[2] for deed in deeds if deed[2] in tombs]
+        deeds[:] = [deed for deed in deeds if deed[2] not in tombs]
+        heapq.heapify(deeds)
+        queues = (ready, ) if ready else ()
+        index = 2
+    else:
+        purged = []
+        queues = (deeds, )
+        index = 0
+    for queue in queues:  # edit in place since recur may be iterating
+        for i in range(len(queue)):
+            deed = queue.popleft()
+            if deed[index] in tombs:
+                purged.append(deed[index])
+            else:
+                queue.append(deed)
+    tombs.difference_update(purged)
+
+
+def _adog(doer, *, tymth, tock=0.0, temp=None, waker=None, **opts):
+    """Generator dog of async def doer. Runs the coroutine of doer as an
+    asyncio task on the running loop so its awaitables resolve natively and
+    returns its result as the done state of doer. Cancels the task when
+    closed such as on exit. Must be entered inside a running event loop such
+    as by Doist.ado.
+
+    When waker then the deed yields math.inf so it is not due again until
+    waker wakes it when its task is done. Otherwise it polls its task each
+    tock.
+
+    Parameters::
+
+        doer (Callable): async def function or method with attributes tock,
+            done, and opts such as from doify
+        tymth (closure): injected tymth of scheduler
+        tock (float): tock of doer
+        temp (bool | None): True means use temporary file resources if any
+        waker (Waker | None): waker of scheduler that follows the task
+        opts (dict): injected options of doer
+    """
+    loop = asyncio.get_running_loop()  # before coroutine so never unawaited
+    task = loop.create_task(doer(tymth=tymth, tock=tock, temp=temp, **opts))
+    if waker is not None:
+        waker.follow(task, doer)
+    try:
+        while not task.done():
+            yield math.inf if waker is not None else tock
+    except GeneratorExit:  # closed while running so cancel task
+        task.cancel()
+        raise
+    if task.cancelled():  # cancelled by other than close so incomplete
+        return False
+    return task.result()
+
+
+class Waker(hioing.Mixin):
+    """Waker is an I/O readiness registry owned by a Doist that wakes doers
+    when the file objects they watch are ready. Wraps a selectors selector.
+
+    A Doer watches a file object such as a socket or file descriptor with an
+    interest mask of selectors.EVENT_READ and or selectors.EVENT_WRITE.
+    When the Doist waits in real time for its next tock it waits in the
+    selector's select instead of sleeping so it wakes early when any watched
+    file object is ready. Each ready doer and its parent DoDoers are woken.
+    A woken deed runs on the next pass even when its retyme is not yet due.
+    When woken while the Doist waits for the end of its current tock the
+    woken deeds run at once without advancing .tyme so .tyme never runs ahead
+    of real time. A woken early run does not change its retyme so a
+    transport doer with a large tock runs only when its file objects are
+    ready or when its tock comes due for timeouts instead of polling every
+    tock.
+
+    Doers must unwatch file objects before or when they close them. Any
+    closed file object left registered is pruned when a select fails on it.
+
+    Doers that hand work to another doer, such as filling its transmit
+    buffers, may call .wake on that doer so it runs on the next pass.
+
+    When run by Doist.ado the waker also follows the asyncio tasks of async
+    def doers and wakes each doer when its task is done. Any wake sets .alarm
+    so that .ado stops waiting early.
+
+    Attributes::
+
+        wakes (set): doers woken since the start of the current pass.
+        woken (set): doers woken for the current pass.
+        parents (weakref.WeakKeyDictionary): parent DoDoer of nested doer
+            keyed by doer so waking a nested doer also wakes its parents.
+        tasks (set): followed asyncio tasks not yet done
+        alarm (asyncio.Event | None): set on each wake while Doist.ado runs.
+            None otherwise.
+
+    Properties::
+
+        selector (selectors.BaseSelector): selector created on demand
+
+    Methods::
+
+        watch: register or modify file object with interest mask for doer
+        unwatch: unregister file object
+        prune: unregister closed file objects
+        wake: wake doer and its parents
+        follow: follow asyncio task so its doer is woken when done
+        turn: turn wakes into woken at the start of a pass
+        wait: wait up to timeout for ready file objects and wake their doers
+        close: close selector
+
+    Hidden::
+
+        _selector (selectors.BaseSelector | None): selector if any
+    """
+
+    def __init__(self, **kwa):
+        """Initialize instance."""
+        super(Waker, self).__init__(**kwa)
+        self.wakes = set()
+        self.woken = set()
+        self.parents = weakref.WeakKeyDictionary()
+        self.tasks = set()
+        self.alarm = None
+        self._selector = None
+
+
+    @property
+    def selector(self):
+        """selector property getter, creates ._selector on demand
+        """
+        if self._selector is None:
+            self._selector = selectors.DefaultSelector()
+        return self._selector
+
+
+    def watch(self, fileobj, events, doer):
+        """Register fileobj with interest mask events for doer or modify its
+        registration. Replaces a stale registration of a closed file object
+        whose file descriptor has been reused.
+
+        Returns::
+
+            result (bool): True means watched. False means fileobj can not be
+                selected such as when closed so doer must poll.
+
+        Parameters::
+
+            fileobj (socket | int): file object or file descriptor
+            events (int): interest mask of selectors.EVENT_READ and or
+                selectors.EVENT_WRITE. Zero means unwatch.
+            doer (Doer): doer to wake when fileobj is ready
+        """
+        if not events:
+            self.unwatch(fileobj)
+            return False
+
+        selector = self.selector
+        try:
+            key = selector.get_map().get(fileobj)
+            if key is None:
+                selector.register(fileobj, events, doer)
+            elif key.fileobj is not fileobj:  # stale since fd reused
+                selector.unregister(key.fd)
+                selector.register(fileobj, events, doer)
+            elif key.events != events or key.data is not doer:
+                selector.modify(fileobj, events, doer)
+        except (ValueError, KeyError, OSError):  # closed or not selectable
+            return False
+        return True
+
+
+    def unwatch(self, fileobj):
+        """Unregister fileobj if registered.
+
+        Parameters::
+
+            fileobj (socket | int): file object or file descriptor
+        """
+        if self._selector is None:
+            return
+        try:
+            self._selector.unregister(fileobj)
+        except (ValueError, KeyError, OSError):  # closed or not registered
+            pass
+
+
+    def prune(self):
+        """Unregister every registered file object that has been closed or
+        whose file descriptor no longer matches its registration.
+
+        Returns::
+
+            pruned (int): number of file objects unregistered
+        """
+        if self._selector is None:
+            return 0
+        stale = []
+        for key in list(self._selector.get_map().values()):
+            fileobj = key.fileobj
+            try:
+                fd = fileobj if isinstance(fileobj, int) else fileobj.fileno()
+                if fd != key.fd:  # closed so -1 or fd reused
+                    raise ValueError("Stale file descriptor.")
+                os.fstat(fd)  # raises when closed
+            except (ValueError, OSError):
+                stale.append(key.fd)
+        for fd in stale:
+            try:
+                self._selector.unregister(fd)
+            except (ValueError, KeyError, OSError):
+                pass
+        return len(stale)
+
+
+    def wake(self, doer):
+        """Wake doer and its parent DoDoers so they run on the next pass.
+
+        Parameters::
+
+            doer (Doer): doer to wake
+        """
+        while doer is not None:
+            self.wakes.add(doer)
+            doer = self.parents.get(doer)
+        if self.alarm is not None:
+            self.alarm.set()
+
+
+    def follow(self, task, doer):
+        """Follow asyncio task so doer and its parents are woken when task is
+        done.
+
+        Parameters::
+
+            task (asyncio.Task): task to follow
+            doer (Callable): doer to wake when task is done
+        """
+        def done(task):
+            self.tasks.discard(task)
+            self.wake(doer)
+
+        self.tasks.add(task)
+        task.add_done_callback(done)
+
+
+    def turn(self):
+        """Turn .wakes into .woken for the current pass. Called by the Doist
+        at the start of each pass so that doers woken during a pass run on
+        the next pass.
+        """
+        if self.wakes or self.woken:
+            self.woken, self.wakes = self.wakes, set()
+
+
+    def wait(self, timeout=None):
+        """Wait up to timeout seconds for any watched file object to be ready
+        and wake the doer of each ready one. Does not wait when wakes pending.
+
+        Returns::
+
+            wakes (int): number of woken doers pending for next pass.
+                Zero means timed out.
+
+        Parameters::
+
+            timeout (float | None): seconds to wait. None means until ready.
+        """
+        if self.wakes:  # poll only since already woken
+            timeout = 0.0
+        if self._selector is None or not self._selector.get_map():
+            if timeout:  # nothing to select on all platforms
+                time.sleep(timeout)
+            return len(self.wakes)
+        try:
+            ready = self._selector.select(timeout=timeout)
+        except (ValueError, OSError):  # closed file object still registered
+            if not self.prune():  # not due to closed file object
+                raise
+            return self.wait(timeout=timeout)
+        for key, mask in ready:
+            self.wake(key.data)
+        return len(self.wakes)
+
+
+    def close(self):
+        """Close selector. A new selector is created on demand."""
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+        self.wakes.clear()
+        self.woken.clear()
+        self.tasks.clear()
+
+
 class Doist(tyming.Tymist):
     """Doist is the root coroutine scheduler
     (real python generator coroutines not fake asyncio coroutines)
@@ -39,11 +495,18 @@ class Doist(tyming.Tymist):
     use await inside. Notably .do uses time.sleep, while .ado uses await
     asyncio.sleep().
 
-    A doist instance running in an asyncio event loop does not directly execute
-    async coroutines as Doers. But regular Doers may themselves execute asyncio
-    coroutines defined with async def by emulating an await using the async
-    coroutine objects .send() method. Usually this can be wrapped try: except:
-    that catches the StopIteraction
+    A doist running in an asyncio event loop via .ado also runs async def
+    doers alongside generator doers. Each async def doer, such as one made
+    with doify, is called like a generator doer and its coroutine runs as an
+    asyncio task so it may await real asyncio I/O. Its return value is its
+    done state. When .waker the deed of a running task is not due until its
+    task is done so a tickless .ado sleeps until the next deadline or task
+    completion instead of waking every tock. Otherwise it polls its task
+    every doer tock. Async def doers can not run with .do.
+
+    Regular Doers may also execute asyncio coroutines defined with async def
+    by emulating an await using the async coroutine objects .send() method.
+    Usually this can be wrapped try: except: that catches the StopIteraction
 
     Example::
 
@@ -98,10 +561,75 @@ class Doist(tyming.Tymist):
             Used throughout the execution lifecycle. The normal
             case is use the default empty initialization performed here and
             update in .enter().
-        timer (MonoTimer): for real time intervals
+        timer (MonoTimer | NanoTimer): for real time intervals. NanoTimer of
+            absolute deadlines on the monotonic clock when .spin.
+        spin (float | None): seconds of final slice before each real time
+            deadline that .wait busy spins instead of sleeping so sleep
+            wakeup jitter does not make sub millisecond tocks late.
+            None means sleep only (default).
+        jitter (Stat | None): seconds each real time wait ended past its
+            deadline when .spin. None otherwise.
+        collector (bool): True means manage garbage collection so its pauses
+            never land inside a pass. After enter the long lived objects of
+            the doers are collected and frozen with gc.freeze and automatic
+            collection is disabled until exit. Between passes .collect runs
+            one generation at a time when its allocation threshold is
+            exceeded. When real only in the slack before the next deadline
+            including the tickless sleep window. False means automatic
+            collection (default).
+        pauses (Stat | None): seconds of each collection by .collect when
+            .collector. None otherwise.
         temp (bool): True means use temp resources such as file path.
                      When True inject into doer enters when True.
                      Otherwise do not inject into doer enters.
+        heap (bool): True means schedule deeds in a heap priority queue keyed
+            by retyme so each .recur only visits deeds that are ready to run.
+            In this case .deeds is a heap list of quadruples of form
+            (retyme, order, dog, doer) where order is the insertion order of
+            the deed. Ready deeds run in insertion order just as in the deque.
+            False means round robin .deeds deque of triples (default).
+        tickless (bool): True means skip idle tocks where no deed is due to
+            run. When real sleep through skipped tocks in one sleep instead of
+            waking every tock. When not real fast forward .tyme over skipped
+            tocks. .tyme still advances in whole tocks so doers see the
+            same tyme. False means run every tock (default).
+        waker (Waker | None): I/O readiness registry injected into doers so
+            they may watch file objects and be woken when ready. When real
+            .do waits in its select instead of sleeping.
+            None means no registry (default).
+        profiler (Profiler | None): records wall time of each send to each
+            deed and of each .recur pass. Injected into doers so nested
+            DoDoers profile their deeds too. None means no profiling (default).
+        tracer (Tracer | None): records timeline span of each send to each
+            deed and of each .recur pass. Injected into doers so nested
+            DoDoers, Boxers, and transports trace too. None means no tracing
+            (default).
+        pool (Pool | None): process pool for offload of CPU bound calls.
+            Opened before enter and closed after exit. Injected into doers so
+            nested DoDoers inject it too. None means no pool (default).
+        watchdog (Watchdog | None): watcher thread that reports any single
+            send to a deed that runs longer than its threshold with the stack
+            of the Doist thread. Started before enter and stopped after exit.
+            Injected into doers so nested DoDoers mark their sends too.
+            None means no watchdog (default).
+        meter (Meter | None): memory meter that samples tracemalloc
+            allocations attributed by doer module and class and the sizes of
+            the transport buffers of the doers once per its period between
+            passes. Started before enter and stopped after exit. None means
+            no metering (default).
+        budget (float | None): seconds of wall time per .recur pass for
+            ready deeds. Requires .heap. Ready deeds run in order of rank and
+            then insertion order. The rank of a deed is the priority of its
+            doer plus the number of passes it has been deferred. Once the
+            budget is spent the remaining ready deeds whose doer priority is
+            zero or less are deferred to the next pass, except that at least
+            one of them runs each pass. Each deferral ages a deed so it sorts
+            ahead of newer ready deeds and runs first on a later pass. Under
+            sustained overload a deed may be deferred many passes but never
+            starves. Deeds of priority above zero always run. None means no
+            budget (default). Priorities order ready deeds when .heap even
+            without a budget. Without .heap priorities are ignored with a
+            RuntimeWarning on enter.
 
     Inherited Properties::
 
@@ -125,11 +653,23 @@ class Doist(tyming.Tymist):
                 - recur: run through all deeds once each invocaton of .recur
                 - exit: cleanly exit doers upon exception
                 - extend: cleanly add more doers at runtime
+                - spawn: bulk add more doers at runtime returning handles
                 - remove: cleanly remove some or all doers at runtime
+                - earliest: earliest tyme any deed is due to run
+                - idle: number of idle tocks ahead
+                - skip: advance .tyme over idle tocks without running deeds
+                - wait: wait in real time for next tock or ready I/O
+                - asleep: async wait used by .ado for next tock or wake
+                - freeze: freeze long lived objects and disable automatic gc
+                - thaw: unfreeze and restore automatic gc
+                - collect: collect one generation in slack between passes
     """
 
     def __init__(self, *, name='doist', real=False, limit=None, doers=None,
-                          temp=False, **kwa):
+                          temp=False, heap=False, tickless=False, select=False,
+                          profiler=None, tracer=None, pool=None, budget=None,
+                          spin=None, collector=False, watchdog=None,
+                          meter=None, **kwa):
         """
         Returns::
 
@@ -154,6 +694,30 @@ class Doist(tyming.Tymist):
                 The normal case is to initialize here or in .do().
             temp (bool): True means use temp resources such as file path, inject
                          into doers when True. Otherwise do not inject.
+            heap (bool): True means schedule deeds in heap priority queue keyed
+                         by retyme. False means round robin deque of deeds.
+            tickless (bool): True means skip idle tocks. When real sleep
+                         through them. When not real fast forward through them.
+                         False means run every tock.
+            select (bool): True means create .waker I/O readiness registry.
+                         False means .waker is None.
+            profiler (Profiler | None): per deed execution profiler. When its
+                         budget is None it is set to .tock.
+            tracer (Tracer | None): timeline tracer
+            pool (Pool | None): process pool for offload of CPU bound calls.
+                         Opened before enter and closed after exit.
+            budget (float | None): seconds of wall time per .recur pass after
+                         which ready deeds of priority zero or less are
+                         deferred. Requires heap. None means no budget.
+            spin (float | None): seconds of final slice before each real time
+                         deadline to busy spin. None means sleep only.
+            collector (bool): True means manage garbage collection so it
+                         runs only between passes. False means automatic.
+            watchdog (Watchdog | None): reports sends that stall longer than
+                         its threshold with the stack of the stalled thread.
+                         Started before enter and stopped after exit.
+            meter (Meter | None): samples memory of doers between passes.
+                         Started before enter and stopped after exit.
         """
         super(Doist, self).__init__(**kwa)
         self.name = name
@@ -161,9 +725,38 @@ class Doist(tyming.Tymist):
         self.limit = abs(float(limit)) if limit is not None else None
         self.done = None
         self.doers = list(doers) if doers is not None else []  # list of Doers
-        self.deeds = deque()  # deque of deeds
-        self.timer = timing.MonoTimer(duration = self.tock)
+        self.heap = True if heap else False
+        self.deeds = [] if self.heap else deque()  # heap list or deque of deeds
+        self.spin = abs(float(spin)) if spin is not None else None
+        if self.spin is None:
+            self.timer = timing.MonoTimer(duration = self.tock)
+            self.jitter = None
+        else:  # precise absolute deadlines on monotonic clock
+            self.timer = timing.NanoTimer(duration=self.tock)
+            self.jitter = Stat()
+        self.collector = True if collector else False
+        self.pauses = Stat() if self.collector else None
+        self._pauses = [0.0, 0.0, 0.0]  # last pause of each generation
+        self._enabled = None  # automatic collection enabled before freeze
         self.temp = True if temp else False
+        self.tickless = True if tickless else False
+        self.waker = Waker() if select else None
+        self.profiler = profiler
+        if self.profiler is not None and self.profiler.budget is None:
+            self.profiler.budget = self.tock  # sends longer than tock overrun
+        self.tracer = tracer
+        self.pool = pool
+        self.watchdog = watchdog
+        self.meter = meter
+        if budget is not None and not self.heap:
+            raise ValueError("Budget requires heap.")
+        self.budget = abs(float(budget)) if budget is not None else None
+        self._order = itertools.count()  # insertion order of heap deeds
+        self._ready = deque()  # ready heap deeds not yet run in current recur
+        self._ages = weakref.WeakKeyDictionary()  # deferred passes by dog
+        self._dogs = dict()  # dog of each entered doer, None when complete
+        self._tombs = set()  # dogs of removed deeds not yet purged from deeds
+        self._orders = weakref.WeakKeyDictionary()  # heap deed order by dog
 
 
     def __call__(self, *pa, **kwa):
@@ -217,7 +810,7 @@ class Doist(tyming.Tymist):
         self.done = False
         if doers is not None:
             self.doers = list(doers)
-            self.deeds = deque()
+            self.deeds = [] if self.heap else deque()
 
         if limit is not None:  # time limt for running if any. useful in test
             self.limit = abs(float(limit))
@@ -226,20 +819,42 @@ class Doist(tyming.Tymist):
             self.tyme = tyme
 
         try:  # always clean up resources upon exception
+            if self.pool is not None:  # open before enter so doers may offload
+                self.pool.open()
+            if self.watchdog is not None:  # watch this thread
+                self.watchdog.start()
+            if self.meter is not None:  # trace allocations of enter too
+                self.meter.start()
             self.enter(temp=temp)  # runs enter context on each doer
+            if self.collector:  # freeze survivors of enter
+                self.freeze()
 
             tymer = tyming.Tymer(tymth=self.tymen(), duration=self.limit)
+            stop = self.tyme + self.limit if self.limit else None  # tymer stop
             self.timer.start()
 
             while True:  # until doers complete or exception or keyboardInterrupt
                 try:
                     self.recur()  # increments .tyme runs recur context
+                    if self.meter is not None:  # sample when period elapsed
+                        self.meter.update(self.doers, tyme=self.tyme)
 
                     if self.real:  # wait for real time to expire
-                        while not self.timer.expired:
-                            time.sleep(max(0.0, self.timer.remaining))
-                        self.timer.restart()  #  no time lost
-
+                        idles = self.idle(stop=stop) if self.tickless else 0
+                        if self.collector:  # collect in slack before deadline
+                            self.collect(slack=self.timer.remaining
+                                               + idles * self.tock)
+                        self.wait(idles=idles)  # skips idle tocks that elapse
+                    else:
+                        if self.collector:
+                            self.collect()
+                        if self.waker is not None:  # poll ready I/O
+                            self.waker.wait(timeout=0.0)
+                        if self.tickless:
+                            self.skip(stop=stop)
+
+                    if self._tombs and len(self.deeds) <= len(self._tombs):
+                        _purge(self.deeds, self._tombs, heap=self.heap)  # only tombs
                     if not self.deeds:  # no deeds
                         self.done = True
                         break  # break out of forever loop
@@ -258,6 +873,16 @@ class Doist(tyming.Tymist):
 
         finally: # finally clause always runs regardless of exception or not.
             self.exit()  # force close remaining deeds throws GeneratorExit
+            if self.waker is not None:
+                self.waker.close()
+            if self.pool is not None:  # close after exit so doers may offload
+                self.pool.close()
+            if self.watchdog is not None:
+                self.watchdog.stop()
+            if self.meter is not None:
+                self.meter.stop()
+            if self.collector:
+                self.thaw()
 
 
     async def ado(self, doers=None, limit=None, tyme=None, *, temp=None):
@@ -265,6 +890,13 @@ class Doist(tyming.Tymist):
         Uses asyncio.sleep() instead of time.sleep as well as replacing real
         time computation using asyncio.get_event_loop().time()
 
+        Runs async def doers as asyncio tasks alongside generator doers.
+        Waits between passes with .asleep so the loop is free to run tasks.
+        When .waker and nothing is due until a followed task is done, then a
+        tickless real run sleeps until the limit or the task is done and a
+        run that is not real awaits the task for up to one tock of real time
+        per pass instead of spinning so .tyme still advances to the limit.
+
         See .do method for call signature
         """
 
@@ -274,7 +906,7 @@ class Doist(tyming.Tymist):
         self.done = False
         if doers is not None:
             self.doers = list(doers)
-            self.deeds = deque()
+            self.deeds = [] if self.heap else deque()
 
         if limit is not None:  # time limt for running if any. useful in test
             self.limit = abs(float(limit))
@@ -283,23 +915,68 @@ class Doist(tyming.Tymist):
             self.tyme = tyme
 
         try:  # always clean up resources upon exception
+            if self.pool is not None:  # open before enter so doers may offload
+                self.pool.open()
+            if self.watchdog is not None:  # watch this thread
+                self.watchdog.start()
+            if self.meter is not None:  # trace allocations of enter too
+                self.meter.start()
             self.enter(temp=temp)  # runs enter context on each doer
+            if self.collector:  # freeze survivors of enter
+                self.freeze()
+
+            if self.waker is not None:  # so wakes stop .asleep early
+                self.waker.alarm = asyncio.Event()
 
             tymer = tyming.Tymer(tymth=self.tymen(), duration=self.limit)
+            stop = self.tyme + self.limit if self.limit else None  # tymer stop
             atimer = timing.AsyncTimer(duration=self.tock)
             atimer.start()
 
             while True:  # until doers complete or exception or keyboardInterrupt
                 try:
                     self.recur()  # increments .tyme runs recur context
+                    if self.meter is not None:  # sample when period elapsed
+                        self.meter.update(self.doers, tyme=self.tyme)
+
+                    if self.waker is not None:  # poll ready I/O
+                        self.waker.wait(timeout=0.0)
+                    # nothing due until followed task done so await it
+                    tasked = (self.waker is not None and self.waker.tasks
+                              and self.earliest() is None)
 
                     if self.real:  # wait for real time to expire
-                        while not atimer.expired:
-                            await asyncio.sleep(max(0.0, atimer.remaining))
-                        atimer.restart()
+                        if tasked and self.tickless:  # sleep until limit
+                            idles = (max(0, math.ceil((stop - self.tyme) / self.tock))
+                                     if stop is not None and self.tock else None)
+                        else:
+                            idles = self.idle(stop=stop) if self.tickless else 0
+                        if self.collector:  # collect in slack before deadline
+                            self.collect(slack=(atimer.remaining + idles * self.tock
+                                                if idles is not None else None))
+                        elapsed = await self.asleep(atimer, idles=idles)
+                        if tasked and self.tickless:  # none due so advance
+                            for i in range(elapsed):
+                                self.tick()
+                        elif elapsed:  # skip idle tocks that elapsed
+                            self.skip(stop=stop, most=elapsed)
                     else:
-                        await asyncio.sleep(0.0)  # allow loop to run ASAP
-
+                        if self.collector:
+                            self.collect()
+                        if self.tickless:
+                            self.skip(stop=stop)
+                        if tasked:  # await task done for at most a tock
+                            self.waker.alarm.clear()
+                            try:  # bounded so tyme advances toward limit
+                                await asyncio.wait_for(self.waker.alarm.wait(),
+                                                       timeout=self.tock or None)
+                            except asyncio.TimeoutError:
+                                pass
+                        else:
+                            await asyncio.sleep(0.0)  # allow loop to run ASAP
+
+                    if self._tombs and len(self.deeds) <= len(self._tombs):
+                        _purge(self.deeds, self._tombs, heap=self.heap)  # only tombs
                     if not self.deeds:  # no deeds
                         self.done = True
                         break  # break out of forever loop
@@ -318,6 +995,17 @@ class Doist(tyming.Tymist):
 
         finally: # finally clause always runs regardless of exception or not.
             self.exit()  # force close remaining deeds throws GeneratorExit
+            if self.waker is not None:
+                self.waker.alarm = None
+                self.waker.close()
+            if self.pool is not None:  # close after exit so doers may offload
+                self.pool.close()
+            if self.watchdog is not None:
+                self.watchdog.stop()
+            if self.meter is not None:
+                self.meter.stop()
+            if self.collector:
+                self.thaw()
 
 
     def enter(self, doers=None, *, temp=None):
@@ -362,8 +1050,8 @@ class Doist(tyming.Tymist):
         if doers is None:
             doers = self.doers
             deeds = self.deeds
-        else:
-            deeds = deque()  # when doers is provided then don't use .deeds
+        else:  # when doers is provided then don't use .deeds
+            deeds = [] if self.heap else deque()
 
         for doer in doers:
             try:
@@ -373,8 +1061,23 @@ class Doist(tyming.Tymist):
 
             temp = temp or (doer.temp if hasattr(doer, "temp") and doer.temp else None)
             opts = doer.opts if hasattr(doer, "opts") else {}
-
-            dog = doer(tymth=self.tymen(), tock=doer.tock, temp=temp, **opts)  # calls doer.do
+            _unranked(doer, self.heap)
+            if self.waker is not None and isinstance(doer, Doer):
+                doer.waker = self.waker  # inject before enter so may watch
+            if self.profiler is not None and isinstance(doer, Doer):
+                doer.profiler = self.profiler  # so nested dodoers profile
+            if self.tracer is not None and isinstance(doer, Doer):
+                doer.tracer = self.tracer  # so nested dodoers trace
+            if self.watchdog is not None and isinstance(doer, Doer):
+                doer.watchdog = self.watchdog  # so nested dodoers mark sends
+            if self.pool is not None and isinstance(doer, Doer):
+                doer.pool = self.pool  # so nested dodoers inject pool
+
+            if inspect.iscoroutinefunction(doer):  # async def runs as task
+                dog = _adog(doer, tymth=self.tymen(), tock=doer.tock, temp=temp,
+                            waker=self.waker, **opts)
+            else:
+                dog = doer(tymth=self.tymen(), tock=doer.tock, temp=temp, **opts)  # calls doer.do
             try:
                 tock = dog.send(None)  # next(dog) run enter by advancing to first yield
                 # tock ignored on enter, so can't change tock until first recur
@@ -385,12 +1088,18 @@ class Doist(tyming.Tymist):
                 except AttributeError:  # bount method generator
                     # write to doer.__func__.done read from doer.done
                     doer.__func__.done = ex.value if ex.value is not None else doer.done
+                self._dogs[doer] = None  # complete
                 continue  # don't append
-            deeds.append((dog, self.tyme, doer))  # first recur immediately
+            self._dogs[doer] = dog  # register so remove finds deed at once
+            if self.heap:  # push in insertion order to run first recur immediately
+                order = self._orders[dog] = next(self._order)
+                heapq.heappush(deeds, (self.tyme, order, dog, doer))
+            else:
+                deeds.append((dog, self.tyme, doer))  # first recur immediately
         return deeds
 
 
-    def recur(self, deeds=None):
+    def recur(self, deeds=None, *, due=True):
         """
         Recur once through deeds deque of tuples (triples) of form
         (dog, retyme, doer) and update in place
@@ -408,32 +1117,82 @@ class Doist(tyming.Tymist):
 
             deeds (deque):  tuples of form (dog, retyme, doer).
                     Parameterization here of deeds enables some special cases.
+            due (bool): True means run deeds that are due or woken and then
+                    tick. False means run only the deeds of woken doers, keep
+                    their retymes, and do not tick. Used by .wait and .asleep
+                    when woken before the current tock has ended.
 
         The Parameterization here of deeds enables some special cases
         such as manual testing or iteraton.
         The normal case is to initialize .doers in .__init__. or .do() and to
         initialize .deeds in .__init__. and then update in .enter()
+
+        When .heap is True the deeds heap is only visited for deeds whose
+        retyme is past so idle deeds cost nothing. The ready deeds are run in
+        insertion order which is the same order as the round robin deque.
+
+        When .waker then deeds of woken doers also run and keep their retyme.
+
+        When .profiler then the wall time of each send and of the whole pass
+        are recorded. When .tracer then a span of each send and of the whole
+        pass are recorded. When .watchdog then each send is marked so a stalled
+        send is reported.
         """
         if deeds is None:
             deeds = self.deeds
 
+        profiler = self.profiler
+        if profiler is not None:
+            start = time.perf_counter()
+        tracer = self.tracer
+        if tracer is not None:
+            begin = tracer.begin()
+        watchdog = self.watchdog
+
+        woken = None
+        if self.waker is not None:
+            self.waker.turn()
+            woken = self.waker.woken
+
+        if self.heap:
+            self._recurHeap(deeds=deeds, woken=woken, due=due)
+            if profiler is not None:
+                profiler.lap(time.perf_counter() - start)
+            if tracer is not None:
+                tracer.complete(self.name, begin, cat="tick", tyme=self.tyme)
+            if due:
+                self.tick()  # advance .tyme by one doist .tock
+            return
+
+        tombs = self._tombs
         deeds.append((None, None, None))  # append run through once marker
         while deeds: # do while uses explicit break to exit while
             dog, retyme, doer = deeds.popleft()  # pop it off
             if not dog:  # Marker detected so this run through once has completed
                 break  # break loop at marker signifies once through
+            if tombs and dog in tombs:  # removed and closed so purge lazily
+                tombs.discard(dog)
+                continue
 
-            if retyme <= self.tyme:  # run it now
+            if ((due and retyme <= self.tyme)
+                    or (woken and doer in woken)):  # run it now
                 try:  # send tyme. yield tock, tock may change during sended run
-                    tock = dog.send(self.tyme)  # yielded tock == 0.0 means re-run asap
+                    if profiler is None and tracer is None and watchdog is None:
+                        tock = dog.send(self.tyme)  # yielded tock == 0.0 means re-run asap
+                    else:
+                        tock = _send(dog, self.tyme, doer, profiler, tracer, watchdog)
                 except StopIteration as ex:  # returned instead of yielded
                     try:  # assign done state non forced return
                         doer.done = ex.value if ex.value is not None else doer.done
                     except AttributeError:  # bount method generator
                         # write to doer.__func__.done read from doer.done
                         doer.__func__.done = ex.value if ex.value is not None else doer.done
+                    if self._dogs.get(doer) is dog:  # not removed while running
+                        self._dogs[doer] = None  # complete
                 else:  # reappend for next pass
-                    if not tock:  # tock is None or tock == 0.0 with empty yield tock == None
+                    if retyme > self.tyme or not due:  # woken early so keep retyme
+                        pass
+                    elif not tock:  # tock is None or tock == 0.0 with empty yield tock == None
                         retyme = self.tyme + self.tock  # rerun at next recur
                     else:
                         retyme += tock  # cumulative retyme of doer tock
@@ -441,7 +1200,102 @@ class Doist(tyming.Tymist):
             else:  # not retyme yet
                 deeds.append((dog, retyme, doer))  # reappend for next pass
 
-        self.tick()  # advance .tyme by one doist .tock
+        if profiler is not None:
+            profiler.lap(time.perf_counter() - start)
+        if tracer is not None:
+            tracer.complete(self.name, begin, cat="tick", tyme=self.tyme)
+        if due:
+            self.tick()  # advance .tyme by one doist .tock
+
+
+    def _recurHeap(self, deeds, woken=None, due=True):
+        """
+        Recur once through ready deeds in heap list of quadruples of form
+        (retyme, order, dog, doer) and update heap in place. Does not tick.
+
+        Pops every deed whose retyme is past into ._ready, sorts ._ready by
+        rank and then insertion order, and runs each ready deed once. Deeds
+        that are not complete are pushed back onto the heap with their new
+        retyme. Deeds added during this pass are not run until the next pass.
+        When .budget is spent deeds of priority zero or less are deferred to
+        the next pass once one of them has run. See .budget.
+        Woken deeds not yet due run from a copy of form
+        (None, order, dog, doer) found by dog in ._orders so the heap is not
+        scanned. Their heap deeds stay put and keep their retymes. The heap
+        deed of a woken copy that completes is tombstoned and purged lazily.
+
+        Parameters::
+
+            deeds (list):  heap of quadruples of form (retyme, order, dog, doer).
+            woken (set | None): woken doers whose deeds also run now
+            due (bool): True means run due deeds too. False means only woken.
+        """
+        tyme = self.tyme
+        ready = self._ready
+        while due and deeds and deeds[0][0] <= tyme:  # pop all ready deeds
+            ready.append(heapq.heappop(deeds))
+        if woken:  # copy woken deeds not yet due, their heap deeds stay put
+            dogs = self._dogs
+            orders = self._orders
+            readied = set(deed[2] for deed in ready)
+            for doer in woken:
+                dog = dogs.get(doer)
+                if dog is not None and dog in orders and dog not in readied:
+                    ready.append((None, orders[dog], dog, doer))  # woken copy
+        ages = self._ages
+        if len(ready) > 1:  # run by rank then insertion order as deque does
+            ready = self._ready = deque(sorted(ready, key=lambda deed:
+                                        (-_rank(deed[3], ages, deed[2]), deed[1])))
+
+        profiler = self.profiler
+        tracer = self.tracer
+        watchdog = self.watchdog
+        budget = self.budget
+        if budget is not None:
+            start = time.perf_counter()
+            ran = False  # deferrable deed ran this pass
+        tombs = self._tombs
+        while ready:
+            retyme, order, dog, doer = ready.popleft()
+            if tombs and dog in tombs:  # removed and closed so purge lazily
+                if retyme is not None:  # woken copy leaves tomb to heap deed
+                    tombs.discard(dog)
+                continue
+            if budget is not None and _priority(doer) <= 0:  # deferrable
+                if ran and time.perf_counter() - start > budget:  # spent
+                    ages[dog] = ages.get(dog, 0) + 1  # age toward first
+                    if retyme is None:  # woken copy so heap deed stays woken
+                        self.waker.wake(doer)
+                    else:
+                        heapq.heappush(deeds, (retyme, order, dog, doer))
+                    continue
+                ran = True
+            ages.pop(dog, None)
+            try:  # send tyme. yield tock, tock may change during sended run
+                if profiler is None and tracer is None and watchdog is None:
+                    tock = dog.send(tyme)  # yielded tock == 0.0 means re-run asap
+                else:
+                    tock = _send(dog, tyme, doer, profiler, tracer, watchdog)
+            except StopIteration as ex:  # returned instead of yielded
+                try:  # assign done state non forced return
+                    doer.done = ex.value if ex.value is not None else doer.done
+                except AttributeError:  # bount method generator
+                    # write to doer.__func__.done read from doer.done
+                    doer.__func__.done = ex.value if ex.value is not None else doer.done
+                if self._dogs.get(doer) is dog:  # not removed while running
+                    self._dogs[doer] = None  # complete
+                if retyme is None:  # woken copy so purge its heap deed lazily
+                    tombs.add(dog)
+            else:  # repush for next pass
+                if retyme is None:  # woken copy so heap deed keeps its retyme
+                    continue
+                if retyme > tyme or not due:  # woken early so keep retyme
+                    pass
+                elif not tock:  # tock is None or tock == 0.0 with empty yield tock == None
+                    retyme = tyme + self.tock  # rerun at next recur
+                else:
+                    retyme += tock  # cumulative retyme of doer tock
+                heapq.heappush(deeds, (retyme, order, dog, doer))
 
 
     def exit(self, deeds=None):
@@ -469,68 +1323,427 @@ class Doist(tyming.Tymist):
             deeds (deque): tuples of form (dog, retyme, doer).
                 If not provided uses .deeds.
                 Parameterization here of deeds enables some special cases.
+                When .heap then heap list of tuples of form
+                (retyme, order, dog, doer).
         """
         if deeds is None:
             deeds = self.deeds
+            if self.heap:  # include ready deeds not yet run when recur raised
+                deeds.extend(deed for deed in self._ready
+                             if deed[0] is not None)  # not woken copies
+                self._ready.clear()
+            self._dogs.clear()
+            self._tombs.clear()
+
+        if self.heap:  # convert to deque in insertion order so exits nest
+            heeds = sorted(deeds, key=lambda deed: deed[1])
+            deeds.clear()
+            deeds = deque((dog, retyme, doer) for retyme, order, dog, doer in heeds)
 
         while(deeds):  # .close each remaining dog in deeds in reverse order
             dog, retime, doer = deeds.pop()  # pop it off in reverse (right side)
             if not dog:  # marker deed
                 continue  # skip marker
-            try:
-                done = dog.close()  # force GeneratorExit. Maybe log exit tock tyme
-            except StopIteration:
-                pass  # Hmm? Not supposed to happen!
-            else:  # set done state forced close
-                try:  # not bound method generator but doer instance or function
-                    doer.done = done if done is not None else doer.done
-                except AttributeError:  # when using bound method generator
-                    # writing to doer.__func__.done read from doer.done
-                    doer.__func__.done = done if done is not None else doer.done
+            _close(dog, doer)  # force GeneratorExit. Maybe log exit tock tyme
 
 
     def extend(self, doers):
         """
         Extend .doers list with doers. Ready deeds from doers and extend .doers
-        and .deeds.  Edit deeds in place so not replace deque.
+        and .deeds.  Edit deeds in place so not replace deque. See .spawn.
 
         Parameters::
 
             doers is list of doers to add as extension.
 
         """
-        doers = [doer for doer in doers if doer not in self.doers] # ensure unique
+        self.spawn(doers)
+
+
+    def spawn(self, doers):
+        """
+        Bulk spawn doers at runtime. Enters each new doer and adds its deed
+        in one batch. Each spawned doer is its own handle for .remove which
+        finds its deed in the registry of entered doers without any scan.
+        Doers already entered are skipped.
+
+        Returns::
+
+            spawned (list): doers spawned
+
+        Parameters::
+
+            doers (Iterable): doers to spawn such as generator of new doers
+        """
+        dogs = self._dogs
+        listed = set(self.doers) if not dogs else ()  # none entered yet
+        doers = [doer for doer in doers if doer not in dogs
+                 and doer not in listed]  # ensure unique
         deeds = self.enter(doers=doers)  # provide fresh deeds for new doers
         self.doers.extend(doers)
-        self.deeds.extend(deeds)
+        if self.heap:
+            if len(deeds) > len(self.deeds):  # bulk so heapify once
+                self.deeds.extend(deeds)
+                heapq.heapify(self.deeds)
+            else:
+                for deed in deeds:
+                    heapq.heappush(self.deeds, deed)
+        else:
+            self.deeds.extend(deeds)
+        return doers
 
 
     def remove(self, doers):
         """
-        Remove doers from .doers list and any associated deeds from .deeds deque.
-        Force close removed deeds.
+        Remove doers from .doers list and force close their deeds in reverse
+        order. Each deed is found by its doer in the registry of entered doers
+        and tombstoned so it is purged lazily from .deeds the next time it
+        comes up to run instead of scanning .deeds. Once tombstones are half
+        of .deeds they are purged at once so deeds of removed doers never keep
+        running. A deed that is running when removed, such as by its own
+        doer, is not closed and runs until it completes on its own. The doers
+        are taken out of .doers in one pass however many are removed.
 
         Parameters::
 
             doers is list of doers to remove.
 
         """
-        rdoers = [doer for doer in doers if doer in self.doers] # ensure in .doers
+        dogs = self._dogs
+        gone = dict()  # count of each doer to take out of .doers
         rdeeds = deque()  # fresh deque for deeds to remove
-        deeds = self.deeds  # edit update self.deeds in place
-        for i in range(len(deeds)):  # iterate once over each deed
-            dog, retyme, doer = deeds.popleft()
-            if not dog:  # reappend the run through once marker deed
-                deeds.append((dog, retyme, doer))
-            elif doer in rdoers:  # found deed to remove and close
-                rdeeds.append((dog, retyme, doer))  # add to removal deque
-            else:  # keep deed do not remove and close
-                deeds.append((dog, retyme, doer))  # reappend
+        for doer in doers:
+            gone[doer] = gone.get(doer, 0) + 1
+            if doer not in dogs:  # not entered so not running
+                continue
+            dog = dogs.pop(doer)
+            if dog is not None and not dog.gi_running:
+                self._tombs.add(dog)
+                rdeeds.append((dog, None, doer))  # add to removal deque
+
+        if gone:  # update .doers to remove first instance of each doer
+            kept = []
+            for doer in self.doers:
+                if gone.get(doer):
+                    gone[doer] -= 1
+                else:
+                    kept.append(doer)
+            self.doers[:] = kept
+
+        size = len(self.deeds) + len(self._ready)
+        if len(self._tombs) * 2 >= size:  # amortized purge of tombstones
+            _purge(self.deeds, self._tombs, heap=self.heap, ready=self._ready)
+
+        while rdeeds:  # close in reverse order so exits nest
+            dog, retyme, doer = rdeeds.pop()
+            _close(dog, doer)
+
+
+    def earliest(self, deeds=None):
+        """
+        Returns::
+
+            earliest (float | None): earliest tyme at which any deed is due to
+                run including nested deeds of plain DoDoers. None means none due.
+                When .waker has pending wakes then .tyme.
+
+        Parameters::
+
+            deeds (deque | list): deeds of .heap form. If not provided uses .deeds.
+        """
+        if self.waker is not None and self.waker.wakes:  # woken so due now
+            return self.tyme
+        return earliest(self.deeds if deeds is None else deeds, heap=self.heap)
+
+
+    def idle(self, stop=None):
+        """
+        Returns::
+
+            idles (int): number of whole idle tocks ahead where no deed is due
+                to run. See .skip. Does not change .tyme.
+
+        Parameters::
+
+            stop (float | None): tyme at which to stop counting such as the
+                stop tyme of the limit tymer. None means no stop.
+        """
+        due = self.earliest()
+        if due is None or not self.tock:  # nothing due or can't advance
+            return 0
+
+        idles, _ = self._tocks(due if stop is None else min(due, stop))
+        return idles
+
+
+    def skip(self, stop=None, most=None):
+        """
+        Advance .tyme by whole tocks through idle tocks where no deed is due to
+        run without running .recur. Skipped tocks are those where .recur would
+        run no deed. Lands on exactly the .tyme that adding .tock once per
+        skipped tock as .tick does would reach so the .tyme seen by every doer
+        is unchanged, see ._tocks, in time logarithmic not linear in the gap.
+
+        When real this lets .do sleep through idle tocks.
+        When not real this fast forwards simulated .tyme.
+
+        Returns::
+
+            skips (int): number of tocks skipped
+
+        Parameters::
+
+            stop (float | None): tyme at which to stop skipping such as the
+                stop tyme of the limit tymer. None means no stop.
+            most (int | None): maximum number of tocks to skip. None means no
+                maximum.
+        """
+        due = self.earliest()
+        if due is None or not self.tock:  # nothing due or can't advance
+            return 0
+
+        skips, tyme = self._tocks(due if stop is None else min(due, stop),
+                                  most=most)
+        if skips:
+            self.tyme = tyme
+        return skips
+
+
+    def _tocks(self, until, most=None):
+        """
+        Returns duple (tocks, tyme) of the number of tocks that adding .tock
+        to .tyme once per tock as .tick does takes to reach or pass tyme until
+        and the tyme so reached, both exactly as that float arithmetic would
+        give. Does not change .tyme.
+
+        Within one binary exponent range rounding makes every addition add the
+        same increment once the first addition has settled it so whole runs of
+        tocks are jumped with exact rational arithmetic. Only a couple of
+        additions are made per exponent range crossed.
 
-        for doer in rdoers:  # update .doers to remove rdoers
-            self.doers.remove(doer)
+        Parameters::
 
-        self.exit(deeds=rdeeds)
+            until (float): tyme to reach
+            most (int | None): maximum number of tocks. None means no maximum.
+        """
+        tyme = self.tyme
+        tock = self.tock
+        tocks = 0
+        while tyme < until and (most is None or tocks < most):
+            tyme += tock  # same float arithmetic as .tick
+            tocks += 1
+            if tyme <= 0.0 or tock <= 0.0:  # no run to jump
+                continue
+            edge = math.ldexp(1.0, math.frexp(tyme)[1])  # top of exponent range
+            if tyme >= until or tyme + tock >= edge:  # done or range ends
+                continue
+            step = (tyme + tock) - tyme  # exact increment in this range
+            after = tyme + step
+            if (step <= 0.0 or after + tock >= edge
+                    or (after + tock) - after != step):  # not settled
+                continue
+            start, step = Fraction(tyme), Fraction(step)
+            # additions starting below edge - tock stay in range
+            runs = [math.ceil((edge - Fraction(tock) - start) / step) - 1,
+                    math.ceil((Fraction(until) - start) / step)]
+            if most is not None:
+                runs.append(most - tocks)
+            run = max(0, min(runs))
+            tyme = float(start + run * step)  # exact
+            tocks += run
+        return (tocks, tyme)
+
+
+    def wait(self, idles=0):
+        """
+        Wait in real time until .timer expires at the end of the current tock
+        extended by idles more idle tocks, skip .tyme over the idle tocks that
+        elapsed, and then restart .timer with no time lost. When .waker then
+        wait in its select instead of sleeping so that any watched file object
+        that is ready wakes its doer early. Waking during idle tocks rewinds
+        .timer to the end of the last tock boundary passed and skips only the
+        idle tocks that ended. Waking before the current tock has ended runs
+        the deeds of the woken doers at once without advancing .tyme and then
+        keeps waiting so .tyme never runs ahead of real time even when a
+        watched file object stays ready. When .spin then sleep or select only
+        until .spin before the deadline, busy spin to it, and record in
+        .jitter how late the wait ended.
+
+        Returns::
+
+            elapsed (int): number of idle tocks that elapsed in real time and
+                were skipped. Less than idles when woken early.
+
+        Parameters::
+
+            idles (int): number of idle tocks to wait through after the
+                current tock.
+        """
+        timer = self.timer
+        for i in range(idles):  # extend timer over idle tocks
+            timer.restart()
+        elapsed = idles
+        spin = self.spin
+        woken = False
+        while not timer.expired:
+            remaining = max(0.0, timer.remaining)
+            if spin is not None:  # select only until final slice
+                remaining = max(0.0, remaining - spin)
+            if self.waker is None:
+                if spin is not None:  # timer.wait below sleeps then spins
+                    break
+                time.sleep(remaining)
+            elif self.waker.wait(timeout=remaining):  # woken early
+                woken = True
+                if idles and self.tock:  # rewind over idle tocks not ended
+                    left = math.ceil(max(0.0, timer.remaining) / self.tock)
+                    elapsed = max(0, idles - left)
+                    start = timer.latest - timer.elapsed  # current timer start
+                    timer.start(duration=timer.duration,
+                                start=start - (idles - elapsed) * self.tock)
+                    if elapsed:
+                        self.skip(most=elapsed)
+                    idles = 0  # already skipped
+                if not timer.expired:  # tock not ended so run woken not tick
+                    self.recur(due=False)
+            elif spin is not None:  # not woken so spin to deadline below
+                break
+        if spin is not None:  # record lateness even if overrun
+            late = timer.wait(spin=spin)
+            if not woken:
+                self.jitter.add(late)
+        if idles:  # not woken so all idle tocks elapsed
+            self.skip(most=idles)
+        timer.restart()  # no time lost
+        return elapsed
+
+
+    async def asleep(self, timer, idles=0):
+        """
+        Async version of .wait used by .ado. Awaits in real time until timer
+        expires at the end of the current tock extended by idles more idle
+        tocks and then restarts timer with no time lost. The deadline is
+        scheduled with loop.call_at so the loop runs other tasks meanwhile.
+        When .waker then any wake such as a followed task being done ends the
+        wait early. Waking during idle tocks starts timer at the end of the
+        last tock boundary passed. Waking before the current tock has ended
+        runs the deeds of the woken doers at once without advancing .tyme and
+        then keeps waiting to the end of the current tock so later tocks stay
+        in step with real time.
+
+        Returns::
+
+            elapsed (int): number of idle tocks that elapsed in real time.
+                Less than idles when woken early.
+
+        Parameters::
+
+            timer (AsyncTimer): timer of current tock
+            idles (int | None): number of idle tocks to wait through after
+                the current tock. None means until woken.
+        """
+        loop = asyncio.get_running_loop()
+        tock = timer.duration
+        end = loop.time() + timer.remaining  # end of current tock
+        deadline = end + idles * tock if idles is not None else None
+        alarm = self.waker.alarm if self.waker is not None else None
+
+        if alarm is None:
+            await asyncio.sleep(max(0.0, deadline - loop.time()))
+            elapsed = idles
+        else:
+            elapsed = None
+            while elapsed is None:
+                if self.waker.wakes:  # already woken so only let loop run
+                    await asyncio.sleep(0.0)
+                else:
+                    alarm.clear()
+                    handle = (loop.call_at(deadline, alarm.set)
+                              if deadline is not None else None)
+                    try:
+                        await alarm.wait()
+                    finally:
+                        if handle is not None:
+                            handle.cancel()
+                now = loop.time()
+                if deadline is not None and now >= deadline:
+                    elapsed = idles
+                elif now < end:  # tock not ended so run woken not tick
+                    self.recur(due=False)
+                    deadline = end  # then wait out current tock
+                    idles = 0
+                elif tock:  # whole idle tocks begun and ended
+                    elapsed = int((now - end) // tock)
+                    if idles is not None:
+                        elapsed = min(elapsed, idles)
+                else:
+                    elapsed = 0
+
+        timer.start(duration=tock, start=end + elapsed * tock)  # no time lost
+        return elapsed
+
+
+    def freeze(self):
+        """
+        Collect all generations then move surviving objects such as the
+        long lived resources created by doer enters into the permanent
+        generation with gc.freeze so later collections never traverse them.
+        Disables automatic collection so collection only runs in .collect.
+        """
+        self._enabled = gc.isenabled()
+        gc.disable()
+        start = time.perf_counter()
+        gc.collect()
+        self.pauses.add(time.perf_counter() - start)
+        gc.freeze()
+
+
+    def thaw(self):
+        """
+        Undo .freeze. Moves frozen objects back with gc.unfreeze and restores
+        automatic collection if it was enabled before .freeze.
+        """
+        if self._enabled is None:  # not frozen
+            return
+        gc.unfreeze()
+        if self._enabled:
+            gc.enable()
+        self._enabled = None
+
+
+    def collect(self, slack=None):
+        """
+        Collect the oldest generation whose allocation count exceeds its
+        threshold as automatic collection would. When slack is provided an
+        older generation whose last pause exceeded slack is put off to a
+        later call with more slack and a younger one is collected instead.
+        The youngest generation is always collected when due so memory is
+        bounded even when there is no slack. Records pause in .pauses.
+
+        Returns::
+
+            generation (int | None): generation collected. None means none due.
+
+        Parameters::
+
+            slack (float | None): seconds before next deadline.
+                None means no limit.
+        """
+        counts = gc.get_count()
+        thresholds = gc.get_threshold()
+        for generation in (2, 1, 0):
+            if thresholds[generation] and counts[generation] > thresholds[generation]:
+                break
+        else:
+            return None
+        while generation and slack is not None and self._pauses[generation] > slack:
+            generation -= 1  # put off older generation that would overrun
+        start = time.perf_counter()
+        gc.collect(generation)
+        pause = time.perf_counter() - start
+        self._pauses[generation] = pause
+        self.pauses.add(pause)
+        return generation
 
 
 def doify(f, *, name=None, tock=0.0, temp=None, **opts):
@@ -599,6 +1812,79 @@ def doize(*, tock=0.0, temp=None, **opts):
     return decorator
 
 
+_threadPool = None  # shared thread pool executor created on demand by threadPool
+
+
+def threadPool():
+    """Returns shared concurrent.futures.ThreadPoolExecutor used by offload.
+    Created on first use with default max_workers.
+    """
+    global _threadPool
+    if _threadPool is None:
+        _threadPool = ThreadPoolExecutor(thread_name_prefix="hio-offload")
+    return _threadPool
+
+
+def offload(fn, *pa, executor=None, tock=0.0, **kwa):
+    """Generator that runs blocking call fn(*pa, **kwa) in executor so the
+    Doist keeps running while it blocks. Yields tock until the call completes.
+    Use with yield from inside a generator function doer or generator .recur
+    so the Doist's tyme is sent through while waiting. Returns the result of
+    fn or raises its exception through the normal generator protocol.
+    When closed such as when its doer is closed on exit, cancels the call if
+    it has not yet started.
+
+    Usage::
+
+        def lookupDo(tymth=None, tock=0.0, **opts):
+            tyme = yield tock  # enter
+            infos = yield from offload(socket.getaddrinfo, "example.com", 80)
+            return True
+
+    Returns::
+
+        result (Any): returned by fn
+
+    Parameters::
+
+        fn (Callable): blocking callable to run
+        pa (tuple): positional arguments of fn
+        executor (concurrent.futures.Executor | None): executor that runs fn.
+            None means shared thread pool from threadPool().
+        tock (float): tock yielded while waiting. 0.0 means check again on
+            next tock.
+        kwa (dict): keyword arguments of fn
+    """
+    executor = executor if executor is not None else threadPool()
+    future = executor.submit(fn, *pa, **kwa)
+    return (yield from awaitFuture(future, tock=tock))
+
+
+def awaitFuture(future, tock=0.0):
+    """Generator that yields tock until concurrent future is done. Use with
+    yield from. Returns the result of future or raises its exception. When
+    closed such as when its doer is closed on exit, cancels future if it has
+    not yet started. Shared by offload and Pool.offload.
+
+    Returns::
+
+        result (Any): result of future
+
+    Parameters::
+
+        future (concurrent.futures.Future): future of submitted call
+        tock (float): tock yielded while waiting. 0.0 means check again on
+            next tock.
+    """
+    try:
+        while not future.done():
+            yield tock
+    except GeneratorExit:  # closed while waiting so cancel if not started
+        future.cancel()
+        raise
+    return future.result()
+
+
 class Doer(tyming.Tymee):
     """
     Doer base class for hierarchical structured async coroutine like generators.
@@ -625,6 +1911,22 @@ class Doer(tyming.Tymee):
             Otherwise incomplete. Incompletion maybe due to close or abort.
         opts (dict): injected options into its .do generator by scheduler
         temp (bool): True means use temporary file resources if any
+        priority (int): rank of deed when scheduler has a heap. Higher runs
+            first and priorities above zero are never deferred by a budget.
+        waker (Waker | None): I/O readiness registry injected by Doist or
+            DoDoer on enter when it has one. Used to watch file objects so
+            doer is woken when they are ready. None means no registry.
+        profiler (Profiler | None): execution profiler injected by Doist or
+            DoDoer on enter when it has one. Used by DoDoer to profile its
+            deeds. None means no profiling.
+        tracer (Tracer | None): timeline tracer injected by Doist or DoDoer
+            on enter when it has one. Used by .trace. None means no tracing.
+        pool (Pool | None): process pool injected by Doist or DoDoer on enter
+            when it has one. Used to offload CPU bound calls with
+            yield from self.pool.offload(fn, ...). None means no pool.
+        watchdog (Watchdog | None): stalled send watchdog injected by Doist
+            or DoDoer on enter when it has one. Used by DoDoer to mark the
+            sends to its deeds. None means no watchdog.
 
     Inherited Properties::
 
@@ -655,6 +1957,7 @@ class Doer(tyming.Tymee):
                 - exit: exit context method
                 - cease: cease context method
                 - abort: abort context method
+                - trace: context manager that traces span with .tracer if any
 
     Hidden::
 
@@ -664,7 +1967,8 @@ class Doer(tyming.Tymee):
 
     """
 
-    def __init__(self, *, tymth=None, tock=0.0, opts=None, temp=False, **kwa):
+    def __init__(self, *, tymth=None, tock=0.0, opts=None, temp=False,
+                 priority=0, **kwa):
         """
         Initialize instance.
 
@@ -678,6 +1982,8 @@ class Doer(tyming.Tymee):
             tock (float): seconds initial value of .tock
             opts (dict): injected options into its .do generator by scheduler
             temp (bool): True means use temporary file resources if any
+            priority (int): rank of deed when scheduler has a heap. Higher
+                runs first. Overridden by opts "priority" if any.
 
         """
         super(Doer, self).__init__(tymth=tymth, **kwa)
@@ -686,6 +1992,12 @@ class Doer(tyming.Tymee):
         # used for injection of options into .do by scheduler
         self.opts = opts if opts is not None else {}  # empty dict if None
         self.temp = True if temp else False
+        self.priority = priority
+        self.waker = None  # injected by Doist or DoDoer on enter if any
+        self.profiler = None  # injected by Doist or DoDoer on enter if any
+        self.tracer = None  # injected by Doist or DoDoer on enter if any
+        self.pool = None  # injected by Doist or DoDoer on enter if any
+        self.watchdog = None  # injected by Doist or DoDoer on enter if any
 
 
     def __call__(self, *pa, **kwa):
@@ -859,6 +2171,27 @@ class Doer(tyming.Tymee):
         """
 
 
+    def trace(self, name, cat="doer", **args):
+        """
+        Returns context manager that records a span named by class name and
+        name with .tracer when tracing. Otherwise does nothing.
+
+        Usage::
+
+            with self.trace("service", cat="transport"):
+                self.server.service()
+
+        Parameters::
+
+            name (str): name of span within this doer
+            cat (str): category of span
+            args (dict): additional arguments shown with span
+        """
+        if self.tracer is None:
+            return NullContext
+        return self.tracer.span(f"{type(self).__name__}.{name}", cat=cat, **args)
+
+
 class ReDoer(Doer):
     """ReDoer is an example sub class whose .recur is a generator method not a
     plain method. Its .do method detects that its .recur is a generator method
@@ -1033,6 +2366,13 @@ class DoDoer(Doer):
         always (bool): True means keep running even when all dogs in deeds
             are complete. Enables dynamically managing extending or removing
             doers and associated deeds while running.
+        heap (bool): True means schedule deeds in a heap priority queue keyed
+            by retyme so each .recur only visits deeds that are ready to run.
+            In this case .deeds is a heap list of quadruples of form
+            (retyme, order, dog, doer). See Doist.
+            False means round robin .deeds deque of triples (default).
+        budget (float | None): seconds of wall time per .recur pass for ready
+            deeds. Requires .heap. See Doist. None means no budget (default).
 
     Inherited Methods::
 
@@ -1062,10 +2402,13 @@ class DoDoer(Doer):
          - _always is hidden attribute for .always property
          - _doers is hidden attribute for .doers property
          - _deeds is hidden attribute for .deeds property
+         - _dogs is registry of dog of each entered doer, None when complete
+         - _tombs is set of dogs of removed deeds not yet purged from .deeds
 
     """
 
-    def __init__(self, doers=None, always=False, **kwa):
+    def __init__(self, doers=None, always=False, heap=False, budget=None,
+                 **kwa):
         """
         Initialize instance.
 
@@ -1088,11 +2431,28 @@ class DoDoer(Doer):
                 are complete. Enables dynamically managing extending or removing
                 doers and associated deeds while running.
 
+            heap (bool): True means schedule deeds in heap priority queue keyed
+                by retyme. False means round robin deque of deeds.
+
+            budget (float | None): seconds of wall time per .recur pass after
+                which ready deeds of priority zero or less are deferred.
+                Requires heap. None means no budget.
+
         """
         super(DoDoer, self).__init__(**kwa)
         self.doers = list(doers) if doers is not None else []
-        self.deeds = deque()
+        self.heap = True if heap else False
+        self.deeds = [] if self.heap else deque()
         self.always = always
+        if budget is not None and not self.heap:
+            raise ValueError("Budget requires heap.")
+        self.budget = abs(float(budget)) if budget is not None else None
+        self._order = itertools.count()  # insertion order of heap deeds
+        self._ready = deque()  # ready heap deeds not yet run in current recur
+        self._ages = weakref.WeakKeyDictionary()  # deferred passes by dog
+        self._dogs = dict()  # dog of each entered doer, None when complete
+        self._tombs = set()  # dogs of removed deeds not yet purged from deeds
+        self._orders = weakref.WeakKeyDictionary()  # heap deed order by dog
 
 
     @property
@@ -1119,6 +2479,8 @@ class DoDoer(Doer):
         """
         deeds property getter, get ._deeds
         .deeds is deque of triples, each of form (dog, retyme, doer).
+        When .heap then .deeds is heap list of quadruples, each of form
+        (retyme, order, dog, doer).
         """
         return self._deeds
 
@@ -1126,9 +2488,12 @@ class DoDoer(Doer):
     @deeds.setter
     def deeds(self, deeds):
         """
-        set ._deeds to deeds deque
+        set ._deeds to deeds deque or to deeds heap list when .heap
         """
-        if not isinstance(deeds, deque):
+        if self.heap:
+            if not isinstance(deeds, list):
+                raise TypeError("Expected list, got {}.".format(type(deeds)))
+        elif not isinstance(deeds, deque):
             raise TypeError("Expected deque, got {}.".format(type(deeds)))
         self._deeds = deeds
 
@@ -1181,7 +2546,7 @@ class DoDoer(Doer):
         always = always if always is not None else self.always
         if doers is not None:
             self.doers = list(doers)
-            self.deeds = deque()
+            self.deeds = [] if self.heap else deque()
 
         try:
             # enter context
@@ -1254,7 +2619,7 @@ class DoDoer(Doer):
             doers = self.doers
             deeds = self.deeds
         else:
-            deeds = deque()
+            deeds = [] if self.heap else deque()
 
         for doer in doers:
             try:
@@ -1263,8 +2628,26 @@ class DoDoer(Doer):
                 doer.__func__.done = False  # False at enter.  False signals incomplete
             temp = temp or (doer.temp if hasattr(doer, "temp") and doer.temp else None)
             opts = doer.opts if hasattr(doer, "opts") else {}
-
-            dog = doer(tymth=self.tymth, tock=doer.tock, temp=temp, **opts)  # calls doer.do
+            _unranked(doer, self.heap)
+            if self.waker is not None and isinstance(doer, Doer):
+                doer.waker = self.waker  # inject before enter so may watch
+                self.waker.parents[doer] = self  # so waking doer wakes self
+            if self.profiler is not None and isinstance(doer, Doer):
+                doer.profiler = self.profiler
+            if self.tracer is not None and isinstance(doer, Doer):
+                doer.tracer = self.tracer
+            if self.watchdog is not None and isinstance(doer, Doer):
+                doer.watchdog = self.watchdog
+            if self.pool is not None and isinstance(doer, Doer):
+                doer.pool = self.pool
+
+            if inspect.iscoroutinefunction(doer):  # async def runs as task
+                if self.waker is not None:
+                    self.waker.parents[doer] = self  # so waking doer wakes self
+                dog = _adog(doer, tymth=self.tymth, tock=doer.tock, temp=temp,
+                            waker=self.waker, **opts)
+            else:
+                dog = doer(tymth=self.tymth, tock=doer.tock, temp=temp, **opts)  # calls doer.do
             try:
                 next(dog)  # run enter by advancing to first yield
             except StopIteration as ex:  # return not yield
@@ -1280,8 +2663,14 @@ class DoDoer(Doer):
                     #doer.__func__.done = ex.value if ex.value else False  # assign done state
 
 
+                self._dogs[doer] = None  # complete
                 continue  # don't append already complete
-            deeds.append((dog, self.tyme, doer))
+            self._dogs[doer] = dog  # register so remove finds deed at once
+            if self.heap:  # push in insertion order
+                order = self._orders[dog] = next(self._order)
+                heapq.heappush(deeds, (self.tyme, order, dog, doer))
+            else:
+                deeds.append((dog, self.tyme, doer))
         return deeds
 
 
@@ -1301,27 +2690,54 @@ class DoDoer(Doer):
         Cycle once through deeds deque and update in place
 
         Each cycle checks all generators dogs in deeds deque and runs if retyme past.
+
+        When .heap is True only the deeds in the deeds heap whose retyme is
+        past are visited. See Doist.recur.
+
+        When .waker then deeds of woken doers also run. See Doist.recur.
         """
         if deeds is None:
             deeds = self.deeds
 
+        woken = self.waker.woken if self.waker is not None else None
+        profiler = self.profiler
+        tracer = self.tracer
+        watchdog = self.watchdog
+
+        if self.heap:
+            self._recurHeap(tyme=tyme, deeds=deeds, woken=woken)
+            if self._tombs and len(deeds) <= len(self._tombs):  # only tombs
+                _purge(deeds, self._tombs, heap=True)
+            return (not deeds)  # True if deeds heap is empty
+
+        tombs = self._tombs
         deeds.append((None, None, None))  # append run through once marker
         while deeds:  # do while uses explicit break to exit while
             dog, retyme, doer = deeds.popleft()  # pop it off
             if not dog:  # Marker detected so this run through once has completed
                 break  # break loop at marker signifies once through
+            if tombs and dog in tombs:  # removed and closed so purge lazily
+                tombs.discard(dog)
+                continue
 
-            if retyme <= tyme:  # run it now
+            if retyme <= tyme or (woken and doer in woken):  # run it now
                 try:  # send tyme. yield tock, tock may change during sended run
-                    tock = dog.send(tyme)  # yielded tock == 0.0 means re-run asap
+                    if profiler is None and tracer is None and watchdog is None:
+                        tock = dog.send(tyme)  # yielded tock == 0.0 means re-run asap
+                    else:
+                        tock = _send(dog, tyme, doer, profiler, tracer, watchdog)
                 except StopIteration as ex:  # returned instead of yielded
                     try:  # assign done state non forced return
                         doer.done = ex.value if ex.value is not None else doer.done
                     except AttributeError:  # bount method generator
                         # write to doer.__func__.done read from doer.done
                         doer.__func__.done = ex.value if ex.value is not None else doer.done
+                    if self._dogs.get(doer) is dog:  # not removed while running
+                        self._dogs[doer] = None  # complete
                 else:  # reappend for next pass
-                    if not tock:  # tock is None or tock == 0.0 with empty yield tock == None
+                    if retyme > tyme:  # woken early so keep retyme
+                        pass
+                    elif not tock:  # tock is None or tock == 0.0 with empty yield tock == None
                         retyme = tyme + self.tock  # rerun at next recur
                     else:
                         retyme += tock  # cumulative retyme of doer tock
@@ -1332,6 +2748,85 @@ class DoDoer(Doer):
         return (not deeds)  # True if deeds deque is empty
 
 
+    def _recurHeap(self, tyme, deeds, woken=None):
+        """
+        Recur once through ready deeds in heap list of quadruples of form
+        (retyme, order, dog, doer) and update heap in place.
+        Equivalent of Doist._recurHeap
+
+        Parameters::
+
+            tyme (float): current tyme fed by parent doist or dodoer
+            deeds (list):  heap of quadruples of form (retyme, order, dog, doer).
+            woken (set | None): woken doers whose deeds also run now
+        """
+        ready = self._ready
+        while deeds and deeds[0][0] <= tyme:  # pop all ready deeds
+            ready.append(heapq.heappop(deeds))
+        if woken:  # copy woken deeds not yet due, their heap deeds stay put
+            dogs = self._dogs
+            orders = self._orders
+            readied = set(deed[2] for deed in ready)
+            for doer in woken:
+                dog = dogs.get(doer)
+                if dog is not None and dog in orders and dog not in readied:
+                    ready.append((None, orders[dog], dog, doer))  # woken copy
+        ages = self._ages
+        if len(ready) > 1:  # run by rank then insertion order as deque does
+            ready = self._ready = deque(sorted(ready, key=lambda deed:
+                                        (-_rank(deed[3], ages, deed[2]), deed[1])))
+
+        profiler = self.profiler
+        tracer = self.tracer
+        watchdog = self.watchdog
+        budget = self.budget
+        if budget is not None:
+            start = time.perf_counter()
+            ran = False  # deferrable deed ran this pass
+        tombs = self._tombs
+        while ready:
+            retyme, order, dog, doer = ready.popleft()
+            if tombs and dog in tombs:  # removed and closed so purge lazily
+                if retyme is not None:  # woken copy leaves tomb to heap deed
+                    tombs.discard(dog)
+                continue
+            if budget is not None and _priority(doer) <= 0:  # deferrable
+                if ran and time.perf_counter() - start > budget:  # spent
+                    ages[dog] = ages.get(dog, 0) + 1  # age toward first
+                    if retyme is None:  # woken copy so heap deed stays woken
+                        self.waker.wake(doer)
+                    else:
+                        heapq.heappush(deeds, (retyme, order, dog, doer))
+                    continue
+                ran = True
+            ages.pop(dog, None)
+            try:  # send tyme. yield tock, tock may change during sended run
+                if profiler is None and tracer is None and watchdog is None:
+                    tock = dog.send(tyme)  # yielded tock == 0.0 means re-run asap
+                else:
+                    tock = _send(dog, tyme, doer, profiler, tracer, watchdog)
+            except StopIteration as ex:  # returned instead of yielded
+                try:  # assign done state non forced return
+                    doer.done = ex.value if ex.value is not None else doer.done
+                except AttributeError:  # bount method generator
+                    # write to doer.__func__.done read from doer.done
+                    doer.__func__.done = ex.value if ex.value is not None else doer.done
+                if self._dogs.get(doer) is dog:  # not removed while running
+                    self._dogs[doer] = None  # complete
+                if retyme is None:  # woken copy so purge its heap deed lazily
+                    tombs.add(dog)
+            else:  # repush for next pass
+                if retyme is None:  # woken copy so heap deed keeps its retyme
+                    continue
+                if retyme > tyme:  # woken early so keep retyme
+                    pass
+                elif not tock:  # tock is None or tock == 0.0 with empty yield tock == None
+                    retyme = tyme + self.tock  # rerun at next recur
+                else:
+                    retyme += tock  # cumulative retyme of doer tock
+                heapq.heappush(deeds, (retyme, order, dog, doer))
+
+
     def exit(self, deeds = None):
         """
         Do 'exit' context actions.
@@ -1341,71 +2836,137 @@ class DoDoer(Doer):
             deeds (deque): of deed tuples of form (dog, retyme, doer)
                 If not provided uses .deeds.
                 Parameterization here of deeds enables some special cases.
+                When .heap then heap list of tuples of form
+                (retyme, order, dog, doer).
 
         See: https://stackoverflow.com/questions/40528867/setting-attributes-on-func
         For setting attributes on bound methods.
         """
         if deeds is None:
             deeds = self.deeds
+            if self.heap:  # include ready deeds not yet run when recur raised
+                deeds.extend(deed for deed in self._ready
+                             if deed[0] is not None)  # not woken copies
+                self._ready.clear()
+            self._dogs.clear()
+            self._tombs.clear()
+
+        if self.heap:  # convert to deque in insertion order so exits nest
+            heeds = sorted(deeds, key=lambda deed: deed[1])
+            deeds.clear()
+            deeds = deque((dog, retyme, doer) for retyme, order, dog, doer in heeds)
 
         while(deeds):  # .close each remaining dog in deeds in reverse order
             dog, retime, doer = deeds.pop()  # pop it off in reverse (right side)
             if not dog:  # marker deed
                 continue  # skip marker
-            try:
-                done = dog.close()  # force GeneratorExit returns None if already closed or Gen Return value
-            except StopIteration:
-                pass  # Hmm? Not supposed to happen!
-            else:  # set done state forced exit
-                try:  # not bound method generator but doer instance or function
-                    doer.done = done if done is not None else doer.done
-                except AttributeError:  # when using bound method generator
-                    # writing to doer.__func__.done read from doer.done
-                    doer.__func__.done = done if done is not None else doer.done
+            _close(dog, doer)  # force GeneratorExit
 
 
     def extend(self, doers):
         """
         Extend .doers list with doers. Ready deeds from doers and extend .doers
-        and .deeds.  Edit deeds in place so not replace deque.
+        and .deeds.  Edit deeds in place so not replace deque. See .spawn.
 
         Parameters::
 
             doers is list of doers to add as extension.
 
         """
-        doers = [doer for doer in doers if doer not in self.doers] # ensure unique
+        self.spawn(doers)
+
+
+    def spawn(self, doers):
+        """
+        Bulk spawn doers at runtime. Enters each new doer and adds its deed
+        in one batch. Each spawned doer is its own handle for .remove which
+        finds its deed in the registry of entered doers without any scan.
+        Doers already entered are skipped.
+
+        Returns::
+
+            spawned (list): doers spawned
+
+        Parameters::
+
+            doers (Iterable): doers to spawn such as generator of new doers
+        """
+        dogs = self._dogs
+        listed = set(self.doers) if not dogs else ()  # none entered yet
+        doers = [doer for doer in doers if doer not in dogs
+                 and doer not in listed]  # ensure unique
         deeds = self.enter(doers=doers)  # provide fresh deeds for new doers
         self.doers.extend(doers)
-        self.deeds.extend(deeds)
+        if self.heap:
+            if len(deeds) > len(self.deeds):  # bulk so heapify once
+                self.deeds.extend(deeds)
+                heapq.heapify(self.deeds)
+            else:
+                for deed in deeds:
+                    heapq.heappush(self.deeds, deed)
+        else:
+            self.deeds.extend(deeds)
+        return doers
 
 
     def remove(self, doers):
         """
-        Remove doers from .doers list and any associated deeds from .deeds deque.
-        Force close removed deeds.
+        Remove doers from .doers list and force close their deeds in reverse
+        order. Each deed is found by its doer in the registry of entered doers
+        and tombstoned so it is purged lazily from .deeds the next time it
+        comes up to run instead of scanning .deeds. Once tombstones are half
+        of .deeds they are purged at once so deeds of removed doers never keep
+        running. A deed that is running when removed, such as by its own
+        doer, is not closed and runs until it completes on its own. The doers
+        are taken out of .doers in one pass however many are removed.
 
         Parameters::
 
             doers is list of doers to remove.
 
         """
-        rdoers = [doer for doer in doers if doer in self.doers] # ensure in .doers
+        dogs = self._dogs
+        gone = dict()  # count of each doer to take out of .doers
         rdeeds = deque()  # fresh deque for deeds to remove
-        deeds = self.deeds  # edit update self.deeds in place
-        for i in range(len(deeds)):  # iterate once over each deed
-            dog, retyme, doer = deeds.popleft()
-            if not dog:  # reappend the run through once marker deed
-                deeds.append((dog, retyme, doer))
-            elif doer in rdoers:  # found deed to remove and close
-                rdeeds.append((dog, retyme, doer))  # add to removal deque
-            else:  # keep deed do not remove and close
-                deeds.append((dog, retyme, doer))  # reappend
-
-        for doer in rdoers:  # update .doers to remove rdoers
-            self.doers.remove(doer)
-
-        self.exit(deeds=rdeeds)
+        for doer in doers:
+            gone[doer] = gone.get(doer, 0) + 1
+            if doer not in dogs:  # not entered so not running
+                continue
+            dog = dogs.pop(doer)
+            if dog is not None and not dog.gi_running:
+                self._tombs.add(dog)
+                rdeeds.append((dog, None, doer))  # add to removal deque
+
+        if gone:  # update .doers to remove first instance of each doer
+            kept = []
+            for doer in self.doers:
+                if gone.get(doer):
+                    gone[doer] -= 1
+                else:
+                    kept.append(doer)
+            self.doers[:] = kept
+
+        size = len(self.deeds) + len(self._ready)
+        if len(self._tombs) * 2 >= size:  # amortized purge of tombstones
+            _purge(self.deeds, self._tombs, heap=self.heap, ready=self._ready)
+
+        while rdeeds:  # close in reverse order so exits nest
+            dog, retyme, doer = rdeeds.pop()
+            _close(dog, doer)
+
+
+    def earliest(self, deeds=None):
+        """
+        Returns::
+
+            earliest (float | None): earliest tyme at which any deed is due to
+                run including nested deeds of plain DoDoers. None means none due.
+
+        Parameters::
+
+            deeds (deque | list): deeds of .heap form. If not provided uses .deeds.
+        """
+        return earliest(self.deeds if deeds is None else deeds, heap=self.heap)
 
 
 def bareDo(tymth=None, tock=0.0, *, temp=None, **opts):
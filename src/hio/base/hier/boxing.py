@@ -14,6 +14,7 @@ from typing import Type
 
 from ..tyming import Tymee
 from ..doing import Doer
+from ..tracing import NullContext
 from ...hioing import Mixin, HierError
 from .hiering import Nabes, WorkDom
 from .holding import Hold
@@ -369,6 +370,8 @@ class Boxer(Tymee):
         first (Box | None):  beginning box
         box (Box | None):  active box
         durable (bool): default value for durable arg to .make
+        tracer (Tracer | None): timeline tracer of nabe phases injected by
+            BoxerDoer on enter. None means no tracing.
 
     Properties::
 
@@ -410,6 +413,7 @@ class Boxer(Tymee):
         self.first = None  # box to start in
         self.box = None  # current active box  whose pile is active pile
         self.durable = True if durable else False
+        self.tracer = None  # injected by BoxerDoer if any
 
 
     @property
@@ -545,19 +549,21 @@ class Boxer(Tymee):
 
             transit = False
             for box in self.box.pile:  # top down afdos and godos after tyme tick
-                box.afdo()   # afdo nabe
-
-                for goact in box.goacts:  # godo nabe top down
-                    if dest := goact():  # transition condition satisfied
-                        exdos, endos, rendos, rexdos = self.exen(box, dest)
-                        if not self.predo(endos):  # godo not satisfied
-                            continue  # keep trying
-                        self.exdo(exdos)  # exdo bottom up
-                        self.rexdo(rexdos)  # rexdo bottom up  (boxes retained)
-                        self.box = dest  # set new active box
-                        self.hold[activeKey].value = self.box.name  # active box name
-                        transit = True
-                        break
+                with self.span("afdo"):
+                    box.afdo()   # afdo nabe
+
+                with self.span("godo"):
+                    for goact in box.goacts:  # godo nabe top down
+                        if dest := goact():  # transition condition satisfied
+                            exdos, endos, rendos, rexdos = self.exen(box, dest)
+                            if not self.predo(endos):  # godo not satisfied
+                                continue  # keep trying
+                            self.exdo(exdos)  # exdo bottom up
+                            self.rexdo(rexdos)  # rexdo bottom up  (boxes retained)
+                            self.box = dest  # set new active box
+                            self.hold[activeKey].value = self.box.name  # active box name
+                            transit = True
+                            break
 
                 if transit:
                     break
@@ -606,10 +612,11 @@ class Boxer(Tymee):
 
         """
         met = True
-        for box in predos:
-            met = box.predo()
-            if not met:
-                break
+        with self.span("predo"):
+            for box in predos:
+                met = box.predo()
+                if not met:
+                    break
         return met
 
 
@@ -622,8 +629,9 @@ class Boxer(Tymee):
 
             rendos (list[Box]): boxes to be rendo (re-entered)
         """
-        for box in rendos:
-            box.rendo()
+        with self.span("rendo"):
+            for box in rendos:
+                box.rendo()
 
 
     def endo(self, endos):
@@ -635,13 +643,15 @@ class Boxer(Tymee):
             endos (list[Box]): boxes to be endo (entered)
 
         """
-        for box in endos:
-            box.endo()
+        with self.span("endo"):
+            for box in endos:
+                box.endo()
 
     def redo(self):
         """Action redo nabe for current .box.pile in top down order"""
-        for box in self.box.pile:
-            box.redo()
+        with self.span("redo"):
+            for box in self.box.pile:
+                box.redo()
 
 
     def exdo(self, exdos):
@@ -652,8 +662,9 @@ class Boxer(Tymee):
             exdos (list[Box]): boxes to be exdo in bottom up order
 
         """
-        for box in exdos:
-            box.exdo()
+        with self.span("exdo"):
+            for box in exdos:
+                box.exdo()
 
 
     def rexdo(self, rexdos):
@@ -664,8 +675,23 @@ class Boxer(Tymee):
 
             rexdos (list[Box]): boxes to be re-exdo in bottom up order
         """
-        for box in rexdos:
-            box.rexdo()
+        with self.span("rexdo"):
+            for box in rexdos:
+                box.rexdo()
+
+
+    def span(self, nabe):
+        """Returns context manager that records span of nabe phase with
+        .tracer when tracing. Otherwise does nothing.
+
+        Parameters::
+
+            nabe (str): name of nabe phase
+        """
+        if self.tracer is None:
+            return NullContext
+        return self.tracer.span(f"{self.name}.{nabe}", cat="nabe",
+                                box=self.box.name if self.box else None)
 
 
     def resolve(self):
@@ -1483,6 +1509,7 @@ class BoxerDoer(Doer):
         if not self.tymth:
             raise HierError(f"Unable to wind boxer with doer's tymth")
         self.boxer.wind(self.tymth)  # ensures are bags in boxer.mine are wound
+        self.boxer.tracer = self.tracer  # trace nabe phases when tracing
 
 
     def recur(self, tock=None):
@@ -0,0 +1,320 @@
+# -*- encoding: utf-8 -*-
+"""
+hio.base.metering Module
+
+Memory metering of Doist doers with tracemalloc attribution and buffer sizes
+"""
+import time
+import inspect
+import tracemalloc
+from collections import deque, namedtuple
+
+from .. import hioing
+from .profiling import label
+
+
+Sample = namedtuple("Sample", "tyme current peak doers buffers")
+"""
+Sample is one memory sample taken by a Meter.
+
+Fields::
+
+    tyme (float | None): tyme of Doist when taken
+    current (int): bytes currently traced by tracemalloc
+    peak (int): peak bytes traced by tracemalloc
+    doers (dict): bytes of live allocations keyed by label of doer module and
+        class whose source allocated them. A doer module label holds the
+        allocations of its module outside of any doer class.
+    buffers (dict): size of known buffer keyed by path of doer attributes.
+        Size is length in bytes of bytes like buffers and count of entries
+        of deque and dict buffers.
+"""
+
+
+class Meter(hioing.Mixin):
+    """
+    Meter takes periodic memory samples of the doers of a Doist so leaks can
+    be caught before an out of memory. Each sample attributes the live
+    allocations traced by tracemalloc to the module and class of the doers
+    whose source allocated them and records the sizes of the known transport
+    buffers held by the doers such as Memoer .rxgs .txgs .rxms, Remoter .rxbs
+    .txbs, and HTTP Server .reqs .reps.
+
+    Buffers are found by walking the doers, the nested doers of DoDoers, and
+    the transport components in .Components of each doer such as .peer,
+    .server, .client, and .servant. The buffers of the remoters in the .ixes
+    of a server are summed.
+
+    A Doist with a meter starts tracemalloc before entering its doers and
+    stops it after exiting them when the meter started it. Between passes
+    the Doist calls .update which samples once per .period seconds.
+
+    Usage::
+
+        meter = Meter(period=60.0, callback=lambda sample: print(sample.buffers))
+        doist = Doist(real=True, meter=meter)
+        doist.do(doers=doers)
+        for label, size in meter.latest.doers.items():
+            print(label, size)
+
+    Class Attributes::
+
+        Components (tuple): attribute names of transport components of doers
+        Buffers (tuple): attribute names of known buffers of components
+
+    Attributes::
+
+        period (float): seconds of real time between samples
+        frames (int): frames of traceback stored by tracemalloc per allocation
+        callback (Callable | None): called as callback(sample) after each sample
+        samples (deque): most recent Samples
+
+    Properties::
+
+        latest (Sample | None): most recent sample. None when none.
+
+    Methods::
+
+        start: start tracemalloc tracing when not already tracing
+        stop: stop tracemalloc tracing when started by .start
+        update: take sample when .period has elapsed since last sample
+        sample: take sample now
+        attribute: bytes of snapshot attributed by doer module and class
+        buffers: sizes of known buffers of doers
+
+    Hidden::
+
+        _started (bool): True means .start started tracemalloc
+        _last (float | None): monotonic time of last sample
+        _spans (dict): source spans of doer classes keyed by class
+    """
+    Components = ("peer", "server", "client", "servant")
+    Buffers = ("rxgs", "txgs", "rxms", "txms", "rxbs", "txbs", "reqs", "reps")
+
+    def __init__(self, period=60.0, frames=1, size=64, callback=None, **kwa):
+        """
+        Initialize instance.
+
+        Parameters::
+
+            period (float): seconds of real time between samples
+            frames (int): frames of traceback stored per allocation
+            size (int): maximum number of recent samples kept
+            callback (Callable | None): called as callback(sample)
+        """
+        super(Meter, self).__init__(**kwa)
+        self.period = abs(float(period))
+        self.frames = frames
+        self.callback = callback
+        self.samples = deque(maxlen=size)
+        self._started = False
+        self._last = None
+        self._spans = dict()
+
+
+    @property
+    def latest(self):
+        """
+        latest property getter
+        Returns most recent Sample or None when none
+        """
+        return self.samples[-1] if self.samples else None
+
+
+    def start(self):
+        """
+        Start tracemalloc tracing when not already tracing. Sampling period
+        starts now.
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started = True
+        self._last = time.monotonic()
+
+
+    def stop(self):
+        """
+        Stop tracemalloc tracing when started by .start
+        """
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+
+
+    def update(self, doers, tyme=None):
+        """
+        Returns Sample when .period has elapsed since the last sample and one
+        is taken. Otherwise None.
+
+        Parameters::
+
+            doers (Iterable): doers to sample
+            tyme (float | None): tyme of Doist
+        """
+        now = time.monotonic()
+        if self._last is not None and now - self._last < self.period:
+            return None
+        self._last = now
+        return self.sample(doers, tyme=tyme)
+
+
+    def sample(self, doers, tyme=None):
+        """
+        Returns Sample of doers taken now and appends it to .samples. Doer
+        attribution is empty when tracemalloc is not tracing.
+
+        Parameters::
+
+            doers (Iterable): doers to sample
+            tyme (float | None): tyme of Doist
+        """
+        doers = list(self._walk(doers))
+        if tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            attribution = self.attribute(snapshot, doers)
+        else:
+            current = peak = 0
+            attribution = dict()
+        sample = Sample(tyme=tyme, current=current, peak=peak,
+                        doers=attribution, buffers=self.buffers(doers))
+        self.samples.append(sample)
+        if self.callback is not None:
+            self.callback(sample)
+        return sample
+
+
+    def attribute(self, snapshot, doers):
+        """
+        Returns dict of bytes of live allocations in snapshot keyed by label
+        of the doer module and class whose source line allocated them.
+        Allocations in a doer module outside of any doer class are keyed by
+        the module label.
+
+        Parameters::
+
+            snapshot (tracemalloc.Snapshot): snapshot to attribute
+            doers (Iterable): doers whose modules and classes are attributed
+        """
+        files = dict()  # spans keyed by filename
+        for doer in doers:
+            span = self._span(doer)
+            if span is not None and span not in files.get(span[0], ()):
+                files.setdefault(span[0], []).append(span)
+
+        attribution = dict()
+        for stat in snapshot.statistics("lineno"):
+            frame = stat.traceback[0]  # most recent frame is allocation site
+            spans = files.get(frame.filename)
+            if not spans:
+                continue
+            label = spans[0][4]  # module label when outside any class
+            for filename, first, last, name, module in spans:
+                if first <= frame.lineno <= last:
+                    label = name
+                    break
+            attribution[label] = attribution.get(label, 0) + stat.size
+        return attribution
+
+
+    def buffers(self, doers):
+        """
+        Returns dict of sizes of known buffers of doers keyed by path of
+        attributes from doer label to buffer. Sizes of the buffers of the
+        remoters in the .ixes of a server are summed.
+
+        Parameters::
+
+            doers (Iterable): doers whose buffers are sized
+        """
+        sizes = dict()
+        for doer in doers:
+            self._size(doer, self.label(doer), sizes, depth=2)
+        return sizes
+
+
+    def _size(self, obj, path, sizes, depth):
+        """
+        Add sizes of known buffers of obj and of its components to sizes
+
+        Parameters::
+
+            obj (Any): doer or component
+            path (str): path of attributes to obj
+            sizes (dict): sizes of buffers keyed by path
+            depth (int): remaining depth of components to walk
+        """
+        for name in self.Buffers:
+            buf = getattr(obj, name, None)
+            if buf is not None:
+                key = f"{path}.{name}"
+                sizes[key] = sizes.get(key, 0) + _length(buf)
+        ixes = getattr(obj, "ixes", None)
+        if isinstance(ixes, dict):
+            for ix in list(ixes.values()):
+                self._size(ix, f"{path}.ixes", sizes, depth=0)
+        if depth > 0:
+            for name in self.Components:
+                component = getattr(obj, name, None)
+                if component is not None and component is not obj:
+                    self._size(component, f"{path}.{name}", sizes, depth - 1)
+
+
+    def _span(self, doer):
+        """
+        Returns source span tuple of form (filename, first, last, name, module)
+        of class of doer or of doer function. None when no source.
+
+        Parameters::
+
+            doer (Doer | Callable): doer
+        """
+        kind = doer if inspect.isroutine(doer) else type(doer)
+        kind = getattr(kind, "__func__", kind)  # bound method
+        if kind in self._spans:
+            return self._spans[kind]
+        try:
+            filename = inspect.getsourcefile(kind)
+            lines, first = inspect.getsourcelines(kind)
+        except (TypeError, OSError):  # builtin or no source
+            span = None
+        else:
+            module = getattr(kind, "__module__", None) or "__main__"
+            span = (filename, first, first + len(lines) - 1,
+                    f"{module}.{kind.__qualname__}", module)
+        self._spans[kind] = span
+        return span
+
+
+    @staticmethod
+    def _walk(doers):
+        """
+        Yields doers and nested doers of DoDoers depth first
+
+        Parameters::
+
+            doers (Iterable): doers
+        """
+        stack = list(doers)[::-1]
+        while stack:
+            doer = stack.pop()
+            yield doer
+            nested = getattr(doer, "doers", None)
+            if isinstance(nested, list):  # DoDoer
+                stack.extend(nested[::-1])
+
+
+    label = staticmethod(label)  # readable label str of doer
+
+
+def _length(buf):
+    """
+    Returns size of buffer. Length in bytes of bytes like buffer. Length of
+    first item of tuple buffer such as (gram, dst). Otherwise count of entries.
+    """
+    if isinstance(buf, tuple):
+        return _length(buf[0]) if buf else 0
+    try:
+        return len(buf)
+    except TypeError:
+        return 0
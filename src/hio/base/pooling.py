@@ -0,0 +1,297 @@
+# -*- encoding: utf-8 -*-
+"""
+hio.base.pooling Module
+
+Process pool offload of CPU bound calls from doers
+"""
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from .. import hioing
+from .doing import awaitFuture
+
+
+class Shared(hioing.Mixin):
+    """
+    Shared is picklable handle to a block of shared memory that is passed to
+    a pool worker in place of a large bytes like argument so its contents are
+    not pickled and piped to the worker. The worker attaches to the block by
+    name and passes a read only memoryview of its first size bytes to the
+    called function.
+
+    Attributes::
+
+        name (str): name of shared memory block
+        size (int): number of bytes of contents at front of block
+
+    """
+
+    def __init__(self, name, size, **kwa):
+        """
+        Initialize instance.
+
+        Parameters::
+
+            name (str): name of shared memory block
+            size (int): number of bytes of contents at front of block
+        """
+        super(Shared, self).__init__(**kwa)
+        self.name = name
+        self.size = size
+
+
+    def __reduce__(self):
+        return (Shared, (self.name, self.size))
+
+
+    def __repr__(self):
+        return f"Shared(name={self.name!r}, size={self.size})"
+
+
+def _call(fn, pa, kwa):
+    """
+    Returns result of fn(*pa, **kwa) run in pool worker process after
+    replacing each Shared handle in pa and kwa with a read only memoryview of
+    its attached shared memory block. The views are released and the blocks
+    detached when fn returns so fn must copy any part it keeps.
+
+    Parameters::
+
+        fn (Callable): picklable callable to run
+        pa (tuple): positional arguments of fn
+        kwa (dict): keyword arguments of fn
+    """
+    blocks = []
+    views = []
+
+    def attach(arg):
+        if not isinstance(arg, Shared):
+            return arg
+        block = shared_memory.SharedMemory(name=arg.name, track=False)
+        blocks.append(block)
+        view = block.buf[:arg.size].toreadonly()
+        views.append(view)
+        return view
+
+    try:
+        pa = tuple(attach(arg) for arg in pa)
+        kwa = {key: attach(arg) for key, arg in kwa.items()}
+        return fn(*pa, **kwa)
+    finally:
+        del pa, kwa
+        for view in views:
+            view.release()
+        for block in blocks:
+            block.close()
+
+
+class Pool(hioing.Mixin):
+    """
+    Pool offloads CPU bound calls from doers to a process pool so they do not
+    hold the GIL and stall the Doist. Lighter than Bosser and Crewer for one
+    off calls such as signature batches, compression, or parsing.
+
+    The called function and its arguments are pickled to the worker process
+    so must be picklable such as module level functions. Large bytes like
+    arguments are copied once into shared memory instead of being pickled and
+    piped. An argument that already is a SharedMemory block is passed by name
+    without any copy.
+
+    A Doist given a pool opens it before entering its doers and closes it
+    after exiting them and injects it into its Doers on enter so nested
+    DoDoers inject it too.
+
+    Usage::
+
+        class SignDoer(Doer):
+            def recur(self, tock=None):
+                sigs = yield from self.pool.offload(signBatch, self.msgs)
+                return True
+
+        pool = Pool(workers=4, limit=8)
+        doist = Doist(real=True, pool=pool)
+        doist.do(doers=[SignDoer()])
+
+    Attributes::
+
+        workers (int | None): number of worker processes.
+            None means os.process_cpu_count()
+        limit (int | None): maximum number of calls outstanding at once.
+            Offloads beyond limit wait their turn. None means no limit.
+        share (int | None): minimum size in bytes of bytes like argument that
+            is passed in shared memory. None means never.
+        context (multiprocessing.context.BaseContext | None): start method
+            context of worker processes. None means default.
+        executor (ProcessPoolExecutor | None): pool when opened else None
+        futures (set): futures of outstanding calls
+
+    Properties::
+
+        opened (bool): True means executor is open
+
+    Methods::
+
+        open: open process pool
+        close: close process pool and cancel calls not yet started
+        offload: generator that runs call in process pool
+
+    """
+
+    def __init__(self, workers=None, limit=None, share=1 << 20, context=None,
+                 **kwa):
+        """
+        Initialize instance.
+
+        Parameters::
+
+            workers (int | None): number of worker processes
+            limit (int | None): maximum number of outstanding calls
+            share (int | None): minimum bytes of argument passed in shared memory
+            context (BaseContext | None): start method context of workers
+        """
+        super(Pool, self).__init__(**kwa)
+        self.workers = workers
+        self.limit = limit
+        self.share = share
+        self.context = context
+        self.executor = None
+        self.futures = set()
+
+
+    @property
+    def opened(self):
+        """
+        opened property getter
+        Returns True when executor is open
+        """
+        return self.executor is not None
+
+
+    def open(self):
+        """
+        Open process pool when not already opened. Worker processes start on
+        demand when calls are submitted.
+        """
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                mp_context=self.context)
+
+
+    def close(self):
+        """
+        Close process pool. Cancels calls not yet started and waits for
+        running calls to finish so their shared memory is released.
+        """
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+        self.futures.clear()
+
+
+    def offload(self, fn, *pa, tock=0.0, **kwa):
+        """
+        Generator that runs fn(*pa, **kwa) in the process pool so the Doist
+        keeps running while it computes. Yields tock while waiting for a free
+        slot under .limit and then while the call runs. Use with yield from.
+        Returns the result of fn or raises its exception through the normal
+        generator protocol. When closed such as when its doer is closed on
+        exit, cancels the call if it has not yet started.
+
+        Bytes like arguments of at least .share bytes are passed to fn as read
+        only memoryviews of shared memory. SharedMemory arguments are passed
+        as read only memoryviews of their whole block. Either is valid only
+        until fn returns.
+
+        Returns::
+
+            result (Any): returned by fn
+
+        Parameters::
+
+            fn (Callable): picklable callable to run in worker process
+            pa (tuple): positional arguments of fn
+            tock (float): tock yielded while waiting. 0.0 means check again
+                on next tock.
+            kwa (dict): keyword arguments of fn
+
+        Raises::
+
+            MultiError: when pool is not opened
+        """
+        if self.executor is None:
+            raise hioing.MultiError("Pool not opened.")
+
+        while self.limit is not None and len(self.futures) >= self.limit:
+            yield tock  # wait for free slot
+
+        if self.executor is None:  # closed while waiting
+            raise hioing.MultiError("Pool closed.")
+
+        blocks = []  # shared memory created here so unlinked when done
+        try:
+            pa = tuple(self._share(arg, blocks) for arg in pa)
+            kwa = {key: self._share(arg, blocks) for key, arg in kwa.items()}
+            future = self.executor.submit(_call, fn, pa, kwa)
+        except BaseException:
+            self._unlink(blocks)
+            raise
+
+        self.futures.add(future)
+        future.add_done_callback(lambda future: self._done(future, blocks))
+        return (yield from awaitFuture(future, tock=tock))
+
+
+    def _share(self, arg, blocks):
+        """
+        Returns Shared handle in place of arg when arg is SharedMemory or a
+        bytes like object of at least .share bytes. Otherwise returns arg.
+        Appends any shared memory block created here to blocks.
+
+        Parameters::
+
+            arg (Any): argument of offloaded call
+            blocks (list): SharedMemory blocks created here
+        """
+        if isinstance(arg, shared_memory.SharedMemory):
+            return Shared(arg.name, arg.size)
+        if self.share is None or not isinstance(arg, (bytes, bytearray, memoryview)):
+            return arg
+        view = memoryview(arg).cast("B")
+        if view.nbytes < self.share:
+            return arg
+        block = shared_memory.SharedMemory(create=True, size=view.nbytes)
+        blocks.append(block)
+        block.buf[:view.nbytes] = view
+        return Shared(block.name, view.nbytes)
+
+
+    def _done(self, future, blocks):
+        """
+        Done callback of future of offloaded call. Forgets future and unlinks
+        shared memory blocks created for its arguments.
+
+        Parameters::
+
+            future (Future): future of offloaded call
+            blocks (list): SharedMemory blocks created for call
+        """
+        self.futures.discard(future)
+        self._unlink(blocks)
+
+
+    @staticmethod
+    def _unlink(blocks):
+        """
+        Close and unlink shared memory blocks
+
+        Parameters::
+
+            blocks (list): SharedMemory blocks
+        """
+        while blocks:
+            block = blocks.pop()
+            block.close()
+            try:
+                block.unlink()
+            except FileNotFoundError:
+                pass
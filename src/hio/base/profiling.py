@@ -0,0 +1,254 @@
+# -*- encoding: utf-8 -*-
+"""
+hio.base.profiling Module
+
+Per deed execution profiling of Doist and DoDoer recurs
+"""
+import time
+import math
+import weakref
+from collections import deque
+
+from .. import hioing
+
+
+def label(doer):
+    """
+    Returns readable label str of doer shared by profiler, tracer, watchdog
+    and meter
+
+    Parameters::
+
+        doer (Doer | Callable): doer
+    """
+    name = getattr(doer, "__qualname__", None)  # function or method
+    if name is None:  # doer instance
+        name = type(doer).__qualname__
+    return name
+
+
+class Stat(hioing.Mixin):
+    """
+    Stat is execution statistics of the sends to one doer's dog.
+
+    Attributes::
+
+        count (int): number of sends
+        total (float): total wall time in seconds of all sends
+        max (float): maximum wall time in seconds of any send
+        overruns (int): number of sends whose wall time exceeded budget
+        samples (deque): most recent wall times in seconds used for percentiles
+
+    Properties::
+
+        mean (float): mean wall time in seconds of sends
+
+    Methods::
+
+        add: add wall time of one send
+        percentile: wall time at percentile of recent samples
+
+    """
+
+    def __init__(self, size=1024, **kwa):
+        """
+        Initialize instance.
+
+        Parameters::
+
+            size (int): maximum number of recent samples kept for percentiles
+        """
+        super(Stat, self).__init__(**kwa)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.overruns = 0
+        self.samples = deque(maxlen=size)
+
+
+    def __repr__(self):
+        return ("Stat(count={}, total={:.6f}, max={:.6f}, overruns={})"
+                "".format(self.count, self.total, self.max, self.overruns))
+
+
+    @property
+    def mean(self):
+        """
+        mean property getter
+        Returns mean wall time in seconds of sends. 0.0 when none
+        """
+        return (self.total / self.count) if self.count else 0.0
+
+
+    def add(self, elapsed, overrun=False):
+        """
+        Add wall time of one send
+
+        Parameters::
+
+            elapsed (float): wall time in seconds of send
+            overrun (bool): True means send exceeded budget
+        """
+        self.count += 1
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+        if overrun:
+            self.overruns += 1
+        self.samples.append(elapsed)
+
+
+    def percentile(self, q):
+        """
+        Returns wall time in seconds at percentile q of recent samples using
+        nearest rank. 0.0 when no samples.
+
+        Parameters::
+
+            q (float): percentile in range 0 to 100 inclusive
+        """
+        if not self.samples:
+            return 0.0
+        samples = sorted(self.samples)
+        rank = max(1, math.ceil(q / 100 * len(samples)))
+        return samples[min(rank, len(samples)) - 1]
+
+
+class Profiler(hioing.Mixin):
+    """
+    Profiler records the wall time of each send to each deed's dog by a Doist
+    or DoDoer recur. Profiling is off when a Doist has no profiler so costs
+    only a None check per send. A Doist with a profiler injects it into its
+    Doers on enter so nested DoDoers profile their own deeds. The time of a
+    DoDoer's send includes the time of the sends to its nested deeds.
+
+    Usage::
+
+        profiler = Profiler()
+        doist = Doist(real=True, profiler=profiler)
+        doist.do(doers=doers)
+        for doer, stat in profiler.report():
+            print(profiler.label(doer), stat.mean, stat.percentile(99))
+
+    Attributes::
+
+        budget (float | None): seconds a send may take before it counts as an
+            overrun. Doist sets it to its .tock when None.
+        callback (Callable | None): called as callback(doer, stat, elapsed)
+            after each send is recorded. None means no callback.
+        size (int): maximum number of recent samples per doer for percentiles
+        stats (weakref.WeakKeyDictionary): Stat of each doer keyed by doer.
+            Weakly keyed so the Stat of a doer is dropped once the doer is
+            no longer referenced elsewhere such as after it is removed.
+        laps (Stat): Stat of each whole Doist recur pass. Its overruns are
+            passes that exceeded the budget so real time fell behind.
+
+    Methods::
+
+        send: send tyme to dog of doer and record its wall time
+        record: record wall time of send to dog of doer
+        lap: record wall time of whole recur pass
+        stat: Stat of doer
+        report: doers with stats sorted by total wall time
+        label: readable label of doer
+        clear: clear all stats
+
+    """
+
+    def __init__(self, budget=None, callback=None, size=1024, **kwa):
+        """
+        Initialize instance.
+
+        Parameters::
+
+            budget (float | None): seconds a send may take before overrun
+            callback (Callable | None): called as callback(doer, stat, elapsed)
+            size (int): maximum recent samples per doer for percentiles
+        """
+        super(Profiler, self).__init__(**kwa)
+        self.budget = abs(float(budget)) if budget is not None else None
+        self.callback = callback
+        self.size = size
+        self.stats = weakref.WeakKeyDictionary()
+        self.laps = Stat(size=size)
+
+
+    def send(self, dog, tyme, doer):
+        """
+        Returns tock yielded by dog when sent tyme and records wall time of
+        the send for doer. StopIteration and other exceptions propagate.
+
+        Parameters::
+
+            dog (Generator): generator of doer
+            tyme (float): tyme to send
+            doer (Doer | Callable): doer of dog
+        """
+        start = time.perf_counter()
+        try:
+            return dog.send(tyme)
+        finally:
+            self.record(doer, time.perf_counter() - start)
+
+
+    def record(self, doer, elapsed):
+        """
+        Record wall time of send to dog of doer
+
+        Parameters::
+
+            doer (Doer | Callable): doer of dog
+            elapsed (float): wall time in seconds of send
+        """
+        stat = self.stats.get(doer)
+        if stat is None:
+            stat = self.stats[doer] = Stat(size=self.size)
+        stat.add(elapsed, overrun=self.budget is not None and elapsed > self.budget)
+        if self.callback is not None:
+            self.callback(doer, stat, elapsed)
+
+
+    def lap(self, elapsed):
+        """
+        Record wall time of whole recur pass
+
+        Parameters::
+
+            elapsed (float): wall time in seconds of pass
+        """
+        self.laps.add(elapsed, overrun=self.budget is not None and elapsed > self.budget)
+
+
+    def stat(self, doer):
+        """
+        Returns Stat of doer or None when not yet recorded
+
+        Parameters::
+
+            doer (Doer | Callable): doer
+        """
+        return self.stats.get(doer)
+
+
+    def report(self, key=None):
+        """
+        Returns list of duples (doer, stat) sorted in descending order so
+        the doers that take the most time are first.
+
+        Parameters::
+
+            key (Callable | None): returns sort value given Stat.
+                None means sort by total wall time.
+        """
+        key = key if key is not None else (lambda stat: stat.total)
+        return sorted(self.stats.items(), key=lambda item: key(item[1]),
+                      reverse=True)
+
+
+    label = staticmethod(label)  # readable label str of doer
+
+
+    def clear(self):
+        """Clear all stats"""
+        self.stats.clear()
+        self.laps = Stat(size=self.size)
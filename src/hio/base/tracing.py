@@ -0,0 +1,184 @@
+# -*- encoding: utf-8 -*-
+"""
+hio.base.tracing Module
+
+Timeline tracing of Doist execution in Chrome trace event format
+viewable in chrome://tracing or https://ui.perfetto.dev
+"""
+import os
+import time
+import json
+import threading
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
+from .. import hioing
+from .profiling import label
+
+
+NullContext = nullcontext()  # reusable do nothing context when not tracing
+
+
+class Tracer(hioing.Mixin):
+    """
+    Tracer records a timeline of spans in Chrome trace event format into a
+    bounded ring buffer that is flushed to trace event JSON on demand.
+
+    Each span is a complete event (ph 'X') with begin timestamp ts and
+    duration dur in microseconds so the begin and end of a span are never
+    split apart when the ring buffer drops its oldest events. Spans nest by
+    time so a viewer shows nested DoDoer deed sends, Boxer nabe phases, and
+    transport service calls inside the deed send that ran them.
+
+    A Doist with a tracer injects it into its Doers on enter so nested
+    DoDoers trace their deeds too. Tracing is off when a Doist has no tracer.
+
+    Usage::
+
+        tracer = Tracer()
+        doist = Doist(real=True, tracer=tracer)
+        doist.do(doers=doers)
+        tracer.flush("doist.trace.json")
+
+    Attributes::
+
+        events (deque): ring buffer of trace event dicts
+        size (int): maximum number of events in ring buffer
+        pid (int): process id of events
+        tid (int): thread id of events
+        drops (int): number of events dropped from full ring buffer
+
+    Methods::
+
+        begin: begin timestamp of span
+        complete: record complete span from begin timestamp
+        span: context manager that records complete span
+        send: send tyme to dog of doer and record span
+        mark: record instant event
+        flush: write buffered events as trace event JSON and clear buffer
+        label: readable label of doer
+
+    """
+
+    def __init__(self, size=65536, pid=None, tid=None, **kwa):
+        """
+        Initialize instance.
+
+        Parameters::
+
+            size (int): maximum number of events in ring buffer
+            pid (int | None): process id of events. None means os.getpid()
+            tid (int | None): thread id of events.
+                None means threading.get_native_id()
+        """
+        super(Tracer, self).__init__(**kwa)
+        self.size = size
+        self.events = deque(maxlen=size)
+        self.pid = pid if pid is not None else os.getpid()
+        self.tid = tid if tid is not None else threading.get_native_id()
+        self.drops = 0
+
+
+    @staticmethod
+    def begin():
+        """
+        Returns begin timestamp (float) of span in microseconds
+        """
+        return time.perf_counter() * 1e6
+
+
+    def complete(self, name, start, cat="doer", **args):
+        """
+        Record complete span event from start to now
+
+        Parameters::
+
+            name (str): name of span
+            start (float): begin timestamp in microseconds from .begin
+            cat (str): category of span such as deed, nabe, or transport
+            args (dict): additional arguments shown with span
+        """
+        if len(self.events) == self.size:
+            self.drops += 1
+        self.events.append(dict(name=name, cat=cat, ph="X", ts=start,
+                                dur=self.begin() - start, pid=self.pid,
+                                tid=self.tid, args=args))
+
+
+    @contextmanager
+    def span(self, name, cat="doer", **args):
+        """
+        Context manager that records complete span of its body
+
+        Parameters::
+
+            name (str): name of span
+            cat (str): category of span
+            args (dict): additional arguments shown with span
+        """
+        start = self.begin()
+        try:
+            yield self
+        finally:
+            self.complete(name, start, cat=cat, **args)
+
+
+    def send(self, dog, tyme, doer):
+        """
+        Returns tock yielded by dog when sent tyme and records span of the
+        send for doer. StopIteration and other exceptions propagate.
+
+        Parameters::
+
+            dog (Generator): generator of doer
+            tyme (float): tyme to send
+            doer (Doer | Callable): doer of dog
+        """
+        start = self.begin()
+        try:
+            return dog.send(tyme)
+        finally:
+            self.complete(self.label(doer), start, cat="deed", tyme=tyme)
+
+
+    def mark(self, name, cat="doer", **args):
+        """
+        Record instant event
+
+        Parameters::
+
+            name (str): name of event
+            cat (str): category of event
+            args (dict): additional arguments shown with event
+        """
+        if len(self.events) == self.size:
+            self.drops += 1
+        self.events.append(dict(name=name, cat=cat, ph="i", s="t",
+                                ts=self.begin(), pid=self.pid, tid=self.tid,
+                                args=args))
+
+
+    def flush(self, file=None):
+        """
+        Returns trace (dict) in trace event JSON object format of buffered
+        events and clears the ring buffer. Writes trace as JSON to file when
+        provided.
+
+        Parameters::
+
+            file (str | io.TextIOBase | None): path or text file to write.
+                None means do not write.
+        """
+        trace = dict(traceEvents=list(self.events), displayTimeUnit="ms",
+                     otherData=dict(drops=self.drops))
+        self.events.clear()
+        self.drops = 0
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, "w") as f:
+                json.dump(trace, f)
+        elif file is not None:
+            json.dump(trace, file)
+        return trace
+
+
+    label = staticmethod(label)  # readable label str of doer
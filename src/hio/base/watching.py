@@ -0,0 +1,191 @@
+# -*- encoding: utf-8 -*-
+"""
+hio.base.watching Module
+
+Watchdog thread that reports stalled deed sends of a Doist with stack capture
+"""
+import sys
+import time
+import threading
+import traceback
+
+from .. import hioing, help
+from .profiling import label
+
+logger = help.ogler.getLogger()
+
+
+class Watchdog(hioing.Mixin):
+    """
+    Watchdog runs a daemon thread that watches the deed send that is running
+    in the thread of its Doist. When a single send of a deed's dog runs longer
+    than .threshold, such as when a doer blocks in a sync call inside its
+    recur, the watchdog captures the Python stack of the Doist's thread with
+    sys._current_frames and reports it through the hio ogler logger and
+    .callback so stalls are found where they happen instead of from
+    downstream timeouts. Each stalled send is reported once.
+
+    A Doist with a watchdog starts it before entering its doers and stops it
+    after exiting them and injects it into its Doers on enter so nested
+    DoDoers mark their sends too. The innermost running send is watched.
+    The watcher thread only reads the current send so costs the Doist no
+    more than marking the begin and end of each send.
+
+    Usage::
+
+        def stalled(doer, elapsed, stack):
+            print(Watchdog.label(doer), elapsed, stack)
+
+        watchdog = Watchdog(threshold=0.25, callback=stalled)
+        doist = Doist(real=True, watchdog=watchdog)
+        doist.do(doers=doers)
+
+    Attributes::
+
+        threshold (float): seconds a single send may run before it stalls
+        interval (float): seconds between checks by watcher thread
+        callback (Callable | None): called as callback(doer, elapsed, stack)
+            from the watcher thread for each stalled send. None means log only.
+        stalls (int): number of stalled sends reported
+        ident (int | None): thread identifier of watched Doist thread
+        thread (threading.Thread | None): watcher thread when started
+
+    Properties::
+
+        started (bool): True means watcher thread is running
+
+    Methods::
+
+        start: start watcher thread watching the calling thread
+        stop: stop watcher thread
+        begin: mark begin of send to dog of doer
+        end: mark end of most recent send
+        check: report current send when stalled
+        label: readable label of doer
+
+    Hidden::
+
+        _sends (list): nested running sends each list of form
+            [doer, start, reported]
+        _halt (threading.Event): set to stop watcher thread
+    """
+
+    def __init__(self, threshold=1.0, interval=None, callback=None, **kwa):
+        """
+        Initialize instance.
+
+        Parameters::
+
+            threshold (float): seconds a single send may run before it stalls
+            interval (float | None): seconds between checks by watcher thread.
+                None means a quarter of threshold.
+            callback (Callable | None): called as callback(doer, elapsed, stack)
+        """
+        super(Watchdog, self).__init__(**kwa)
+        self.threshold = abs(float(threshold))
+        self.interval = (abs(float(interval)) if interval is not None
+                         else self.threshold / 4)
+        self.callback = callback
+        self.stalls = 0
+        self.ident = None
+        self.thread = None
+        self._sends = []
+        self._halt = threading.Event()
+
+
+    @property
+    def started(self):
+        """
+        started property getter
+        Returns True when watcher thread is running
+        """
+        return self.thread is not None
+
+
+    def start(self, ident=None):
+        """
+        Start watcher thread when not already started.
+
+        Parameters::
+
+            ident (int | None): thread identifier of thread to watch.
+                None means the calling thread.
+        """
+        if self.thread is not None:
+            return
+        self.ident = ident if ident is not None else threading.get_ident()
+        self._sends.clear()
+        self._halt.clear()
+        self.thread = threading.Thread(target=self._run, name="hio-watchdog",
+                                       daemon=True)
+        self.thread.start()
+
+
+    def stop(self):
+        """
+        Stop watcher thread and wait for it to finish.
+        """
+        if self.thread is None:
+            return
+        self._halt.set()
+        self.thread.join()
+        self.thread = None
+        self._sends.clear()
+
+
+    def _run(self):
+        """Watcher thread loop checks current send each .interval"""
+        while not self._halt.wait(self.interval):
+            self.check()
+
+
+    def begin(self, doer):
+        """
+        Mark begin of send to dog of doer
+
+        Parameters::
+
+            doer (Doer | Callable): doer of dog
+        """
+        self._sends.append([doer, time.perf_counter(), False])
+
+
+    def end(self):
+        """
+        Mark end of most recent send
+        """
+        if self._sends:
+            self._sends.pop()
+
+
+    def check(self):
+        """
+        Returns elapsed seconds of current send when it is newly stalled and
+        reported. Otherwise None. Captures the stack of the watched thread and
+        reports it through the logger and .callback. Safe to call from the
+        watcher thread while the watched thread runs.
+        """
+        try:
+            send = self._sends[-1]
+        except IndexError:  # no send running
+            return None
+        doer, start, reported = send
+        elapsed = time.perf_counter() - start
+        if reported or elapsed <= self.threshold:
+            return None
+
+        frame = sys._current_frames().get(self.ident)
+        stack = "".join(traceback.format_stack(frame)) if frame is not None else ""
+        del frame
+        if not self._sends or self._sends[-1] is not send:  # ended meanwhile
+            return None
+        send[2] = True
+        self.stalls += 1
+        logger.warning("Watchdog: send to %s stalled for %.3f seconds.\n%s",
+                       self.label(doer), elapsed, stack)
+        if self.callback is not None:
+            self.callback(doer, elapsed, stack)
+        return elapsed
+
+
+    label = staticmethod(label)  # readable label str of doer
@@ -5,6 +5,8 @@ hio.core.coring Module
 
 import subprocess
 import socket
+import errno
+import ssl
 import platform
 
 #import netifaces  # netifaces2
@@ -45,6 +47,28 @@ def normalizeHost(host):
     host = info[0][4][0]
     return host
 
+def pending(sock):
+    """
+    Returns True when data or a close is waiting to be received on nonblocking
+    socket sock without consuming it. Used by greedy receive loops stopped by
+    a Budget to tell whether they stopped with work left. A TLS socket also
+    counts plaintext already decrypted into its buffer. Returns False when
+    sock is None.
+
+    Parameters:
+        sock (socket.socket | None): nonblocking socket
+    """
+    if sock is None:
+        return False
+    if isinstance(sock, ssl.SSLSocket) and sock.pending():
+        return True
+    try:  # peek raw socket since TLS socket refuses flags
+        socket.socket.recv(sock, 1, socket.MSG_PEEK)
+    except OSError as ex:  # datagram too large for peek still pending
+        return ex.args[0] not in (errno.EAGAIN, errno.EWOULDBLOCK)
+    return True  # data or empty on close
+
+
 # netifaces not fully supported on macos anymore only linux
 #def getDefaultHost():
     #"""
@@ -1330,7 +1330,8 @@ class ClientDoer(doing.Doer):
 
     def recur(self, tyme):
         """Service the client once per cycle."""
-        self.client.service()
+        with self.trace("service", cat="transport"):
+            self.client.service()
 
 
     def exit(self):
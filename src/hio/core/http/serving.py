@@ -1345,7 +1345,8 @@ class ServerDoer(doing.Doer):
 
     def recur(self, tyme):
         """Service the HTTP server once per recurrence."""
-        self.server.service()
+        with self.trace("service", cat="transport"):
+            self.server.service()
 
 
     def exit(self):
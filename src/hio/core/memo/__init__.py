@@ -4,8 +4,8 @@ hio.core.memo Package
 """
 
 
-from .memoing import (Versionage, Sizage, Keyage,
-                      MemoDex, ZeroDex, GramDex, AuthDex, SureDex, AckDex,
+from .memoing import (Versionage, Sizage, Keyage, Outcome, Delivery, Congestion,
+                      MemoDex, ZeroDex, GramDex, AuthDex, SureDex, AckDex, ChainDex,
                       openMemoer, Memoer, MemoerDoer,
                       openAM, AuthMemoer, AuthMemoerDoer)
 
@@ -10,6 +10,7 @@ which messages are larger than  a single datagram in the underlying transport.
 """
 
 import socket
+import selectors
 import errno
 import math
 import uuid
@@ -19,7 +20,7 @@ from collections import deque, namedtuple
 from contextlib import contextmanager
 from base64 import urlsafe_b64encode as encodeB64
 from base64 import urlsafe_b64decode as decodeB64
-from dataclasses import dataclass, astuple, asdict
+from dataclasses import dataclass, astuple, asdict, field
 
 import pysodium
 
@@ -41,6 +42,13 @@ Keyage = namedtuple("Keyage", "qvk qss")
 #keyage = Keyage(qvk="xyy", qss="abc", )
 #keep = dict("ABCXYZ"=keyage)  # qualified vid as label, Keyage instance as value
 
+# outcome of reliable (sure) memo delivery:
+#    mid = memo ID of sent memo
+#    dst = destination address of memo
+#    memo = memo as given to .memoit
+#    delivered = True when all grams acked, False when retries exhausted
+Outcome = namedtuple("Outcome", "mid dst memo delivered")
+
 """Design Discusssion of Memo and Gram Sizing and Encoding:
 
 Each GramCode (tv) Typing/Version code uses a base64 two char code.
@@ -233,6 +241,54 @@ Signing and verifying the over the wire serialization format is more efficient s
 ince the signatures in qb2 are computed over fewer bytes and
 there is no conversion needed to verify the signature.
 
+Chained signing policy: the chained gram codes sign only the zeroth gram. Its
+authenticator part is a 44 char root digest followed by the 88 char signature
+and the signature covers the fore head, body, and root. The root is a backward
+blake2b-256 hash chain over the bodies of the non-zeroth grams in order:
+
+    link = 32 zero bytes
+    for body in reversed(bodies):  link = blake2b(body + link)
+    root = link
+
+Each non-zeroth chained gram carries no vid and no signature. Its authenticator
+part is instead the 44 char next link, that is the link of the gram after it
+or 32 zero bytes when last, so its overhead is 76 chars instead of 120 and it
+costs one fast hash instead of a signature verification. The link of gram 1 is
+the signed root and gram n is authentic when blake2b(body + next link) equals
+the link of gram n, which then authenticates the next link for gram n + 1.
+
+Each gram is verified on receipt as soon as its link is known. A gram that
+arrives before its link is known is held as a pending candidate and verified
+once the chain reaches it. A gram that does not match its link is dropped
+alone so a later genuine copy of it is still accepted and an injected forged
+gram can not alter or poison a memo. Unchained grams of a chained memo are
+never accepted.
+
+Sure delivery policy: the sure gram codes ask the receiver to acknowledge the
+grams of a memo. The receiver answers each service pass in which sure grams of
+a memo arrived with one ack gram (Ack or AckAuth when it has its own vid). The
+ack neck is the cumulative gram number, every gram number below it has been
+received, and the ack body is a list of received ranges above it as pairs of
+3 byte big endian gram numbers [start, end). Once fused the memo is acked with
+its gram count as cumulative and is remembered so retransmitted grams are only
+acked again, never delivered twice.
+
+The sender only applies acks of a memo from its destination so the destination
+must be given in the same form as the transport reports sources. When the sure
+code is signed an ack must also be an AckAuth signed by the vid expected for the
+destination in .ackvids, or else by the vid that signed the memo, so a spoofed
+ack can not end a delivery.
+
+The sender pulls the grams of each sure memo lazily from its stream as the
+window of its destination opens and keeps each pulled gram only until it is
+acked so a huge memo is never held as grams. At most
+.window grams per destination are in flight. A gram in flight that was sent
+before a gram that is now acked is deemed lost and is retransmitted. A retry
+tymer per memo with timeout estimated from round trip times per destination
+as per RFC 6298 retransmits all grams still in flight when it expires and backs
+off. After .retries consecutive expiries without progress the memo fails.
+Each memo ends with an Outcome in .outcomes.
+
 """
 
 """Sizage: namedtuple for gram header part size entries in Memoer code tables
@@ -283,6 +339,8 @@ class MemoGramCodex:
     GramSureAuth:    str = 'bAAH'  # non-zeroth reliable authenticated gram code (acked & signed)
     Ack:     str = 'bAAI'  # ack code to enable reliable grams
     AckAuth:    str = 'bAAJ'  # authenticated ack code to enable reliable grams (signed)
+    GramChainZero:     str = 'bAAK'  # zeroth chained authenticated gram code (signed root)
+    GramChain:    str = 'bAAL'  # non-zeroth chained authenticated gram code (hashed)
 
     def __iter__(self):
         return iter(astuple(self))
@@ -300,6 +358,7 @@ class ZeroGramCodex:
     GramAuthZero:     str = 'bAAC'  # zeroth authenticated gram code (signed)
     GramSureZero:     str = 'bAAE'  # zeroth reliable gram code (acked)
     GramSureAuthZero:     str = 'bAAG'  # zeroth reliable authenticated gram code (acked & signed)
+    GramChainZero:     str = 'bAAK'  # zeroth chained authenticated gram code (signed root)
 
     def __iter__(self):
         return iter(astuple(self))
@@ -316,6 +375,7 @@ class GramCodex:
     GramAuth:    str = 'bAAD'  # non-zeroth authenticated gram code (signed)
     GramSure:    str = 'bAAF'  # non-zeroth reliable gram code (acked)
     GramSureAuth:    str = 'bAAH'  # non-zeroth reliable authenticated gram code (acked & signed)
+    GramChain:    str = 'bAAL'  # non-zeroth chained authenticated gram code (hashed)
 
     def __iter__(self):
         return iter(astuple(self))
@@ -334,12 +394,29 @@ class AuthGramCodex:
     GramSureAuthZero:     str = 'bAAG'  # zeroth reliable authenticated gram code (acked & signed)
     GramSureAuth:    str = 'bAAH'  # non-zeroth reliable authenticated gram code (acked & signed)
     AckAuth:    str = 'bAAJ'  # authenticated ack code to enable reliable grams (signed)
+    GramChainZero:     str = 'bAAK'  # zeroth chained authenticated gram code (signed root)
+    GramChain:    str = 'bAAL'  # non-zeroth chained authenticated gram code (hashed)
 
     def __iter__(self):
         return iter(astuple(self))
 
 AuthDex = AuthGramCodex()  # Make instance
 
+
+@dataclass(frozen=True)
+class ChainGramCodex:
+    """ChainGramCodex is codex of all ChainGram (signed once hash chained) Both Codes.
+    Only provide defined codes.
+    Undefined are left out so that inclusion(exclusion) via 'in' operator works.
+    """
+    GramChainZero:     str = 'bAAK'  # zeroth chained authenticated gram code (signed root)
+    GramChain:    str = 'bAAL'  # non-zeroth chained authenticated gram code (hashed)
+
+    def __iter__(self):
+        return iter(astuple(self))
+
+ChainDex = ChainGramCodex()  # Make instance
+
 @dataclass(frozen=True)
 class SureGramCodex:
     """SureGramCodex is codex of all SureGram (reliable) Both Codes.
@@ -372,6 +449,65 @@ class AckCodex:
 AckDex = AckCodex()  # Make instance
 
 
+@dataclass
+class Delivery:
+    """Delivery is sender state of sure memo until all its grams are acked.
+
+    Attributes:
+        mid (str): memo ID
+        dst (str): destination address
+        memo (Any): memo as given to .memoit
+        stream (Generator[bytes] or None): lazy grams of memo not yet pulled in
+            gram number order. None once exhausted
+        count (int): gram count of memo
+        rended (int): grams pulled from .stream so far. The next gram pulled
+            has this gram number
+        grams (dict): grams pulled and not yet acked keyed by gram number
+        queue (deque): gram numbers of pulled grams waiting to be resent
+        inflight (dict): keyed by gram number of grams sent and not yet acked
+            with value duple of form (tyme: float, first: bool) where tyme
+            is when sent and first is True when sent only once
+        retried (set): gram numbers sent more than once
+        cum (int): cumulative gram number from acks. All below are acked
+        tries (int): consecutive retry tymer expiries without progress
+        ackvid (str or None): vid that must sign acks when sure code is
+            signed. None means unsigned acks are applied
+    """
+    mid: str
+    dst: str
+    memo: object
+    stream: object
+    count: int
+    rended: int = 0
+    grams: dict = field(default_factory=dict)
+    queue: deque = field(default_factory=deque)
+    inflight: dict = field(default_factory=dict)
+    retried: set = field(default_factory=set)
+    cum: int = 0
+    tries: int = 0
+    ackvid: str | None = None
+
+
+@dataclass
+class Congestion:
+    """Congestion is sender congestion control and pacing state of sure grams
+    per destination.
+
+    Attributes:
+        cwnd (float): congestion window. Max sure grams in flight
+        ssthresh (float): slow start threshold of cwnd
+        tokens (float): pacing tokens. Each admits one gram into .txgs
+        tyme (float or None): tyme of last token refill
+        recover (float or None): tyme of last window reduction. Losses of
+            grams sent at or before it do not reduce the window again
+    """
+    cwnd: float
+    ssthresh: float = math.inf
+    tokens: float = math.inf
+    tyme: float | None = None
+    recover: float | None = None
+
+
 class Memoer(Tymee):
     """Memoer base class subclass of Tymee that adds memogram support to a
     transport class.
@@ -458,11 +594,22 @@ class Memoer(Tymee):
         Codes (dict): maps codex names to codex values
         Names (dict): maps codex values to codex names
         Sodex (SGDex): dataclass ref to signed gram codex
+        Chadex (ChainDex): dataclass ref to chained gram codex
         Sizes (dict): gram head part sizes Sizage instances keyed by gram codes
+        Roots (dict): size of root digest that leads the authenticator part
+            keyed by chained gram codes. Root of non-zeroth is its next link.
         MaxMemoSize (int): absolute max memo size
         MaxGramCount (int): absolute max gram count
         BufSize (int): used to set default buffer size for transport datagram buffers
         Tymeout (float): default timeout for retry tymer(s) if any
+        Sudex (SureDex): dataclass ref to sure (acked) gram codex
+        Window (int): default max sure grams in flight per destination
+        Retries (int): default max retry tymer expiries of a sure memo
+        Rto (float): initial retry tymeout when .tymeout is 0.0
+        MinRto (float): min retry tymeout
+        MaxRto (float): max retry tymeout
+        Cwnd (float): initial congestion window of sure grams per destination
+        Burst (int): min pacing burst of sure grams per destination
 
 
     Stubbed Attributes::
@@ -524,6 +671,69 @@ class Memoer(Tymee):
         tymeout (float): default timeout for retry tymer(s) if any
         tymers (dict): keys are tid and values are Tymers for retry tymers for
                        each inflight tx
+        budget (Budget or None): bounds each greedy serviceReceives call by
+            count of grams, bytes, or microseconds so a flood can not starve
+            other doers. Remaining grams are received on the next call.
+            None means unbounded.
+        hwm (int or None): high water mark of grams in .txgs. When not None
+            memos are streamed lazily into .txgs only while it holds fewer
+            grams so sending throttles partitioning. None means each memo is
+            partitioned whole into .txgs.
+        txgen (tuple or None): duple of form (grams: Generator, dst: str) of
+            memo being streamed into .txgs when .hwm. None means none.
+        bytic (bool): True means fused rx memos in .rxms are bytes without
+            utf-8 decode such as binary CESR. False means str.
+        roots (dict): keyed by mid (memoID) that holds the raw root digest
+            from the verified zeroth chained gram for the memo. The root is
+            the link of gram 1.
+        chained (set): mids of partial memos with chained grams. Only grams
+            authenticated by their links are saved in .rxgs for these.
+        links (dict): keyed by mid of dicts of the raw authenticated link of
+            each chained gram not yet received keyed by gram number.
+        pends (dict): keyed by mid of dicts of lists of (body, link) duples
+            of chained grams received before their links were known keyed by
+            gram number. Pending bodies count against the caps.
+        readies (deque): mids of complete memos in .rxgs ready to be fused.
+            A mid is queued once when its last missing gram is received.
+        rxtymeout (float or None): seconds a partial memo may wait for its
+            missing grams before it is evicted. None means no timeout.
+            Tymers only run once .tymth is injected.
+        rxcap (int or None): max total bytes of bodies of partial memos.
+            Oldest partial memos are evicted first. None means unbounded.
+        srccap (int or None): max bytes of bodies of partial memos from any
+            one source so a flooding source only evicts its own oldest
+            partial memos. None means unbounded.
+        rxtymers (dict): reassembly Tymers keyed by mid of partial memos in
+            creation order.
+        rxloads (dict): keyed by src with value dict of bytes of bodies held
+            keyed by mid of partial memo from src in creation order.
+        rxsizes (dict): total bytes of bodies held keyed by src.
+        rxsize (int): total bytes of bodies of partial memos held.
+        stats (dict): counts of evicted partial memos keyed by reason
+            "rxtymeout", "rxcap", or "srccap".
+        window (int): max sure grams in flight per destination
+        retries (int): max consecutive retry tymer expiries without progress
+            before a sure memo fails
+        deliveries (dict): Delivery of each sure memo being sent keyed by mid
+        ackvids (dict): vid expected to sign the acks of each destination
+            keyed by dst when sure code is signed. Missing means the vid that
+            signed the memo.
+        flights (dict): count of sure grams in flight keyed by dst
+        rtts (dict): round trip estimate keyed by dst with value list of form
+            [srtt: float or None, rttvar: float or None, rto: float]
+        outcomes (deque): Outcome of each sure memo sent once delivered or
+            failed
+        rate (float or None): max pacing rate of sure grams per second per
+            destination. None means paced only by congestion window over
+            smoothed round trip time.
+        congs (dict): Congestion of each destination keyed by dst
+        acks (dict): src keyed by mid of sure memos to be acked on next pass
+        sacks (dict): keyed by mid of sure memos in .rxgs with value list of
+            form [cum: int, above: set] where cum is the cumulative gram number
+            and above holds the received gram numbers above cum
+        dones (dict): keyed by mid of recently fused sure memos with value
+            duple of form (gc: int, vid: str or None) so retransmits are
+            verified and acked again but not delivered twice
 
     Inherited Properties (Tymee)::
         tyme (float or None):  relative cycle time of associated Tymist which is
@@ -571,6 +781,21 @@ class Memoer(Tymee):
         _echoic (bool): see echoic property
         _keep (dict): see keep property
         _oid (str or None): see vid property
+        _sigkeys (dict): cache of expanded signing keys keyed by vid. Each
+            value is duple of form (sigkey: bytes, keyage: Keyage) where keyage
+            is the entry in .keep the sigkey was derived from. Stale when
+            .keep[vid] is no longer that keyage.
+        _verkeys (dict): cache of decoded verification keys keyed by vid. Each
+            value is duple of form (verkey: bytes, keyage: Keyage or None)
+            where keyage is the entry in .keep the verkey was decoded from or
+            None when decoded from a nontransferable vid. Stale when keyage
+            is not None and .keep[vid] is no longer that keyage.
+        _unknowns (dict): negative cache of vids that are undecodable or
+            missing from .keep so floods of bogus grams are rejected without
+            decoding. Values are None. A missing vid is forgotten as soon as
+            it is added to .keep.
+        _templates (dict): rend header templates keyed by (code, curt)
+        _layouts (dict): parse header offsets keyed by (code, curt)
     """
     Version = Versionage(major=0, minor=0)  # default version
     Codex = MemoDex
@@ -578,6 +803,8 @@ class Memoer(Tymee):
     Names = {val : key for key, val in Codes.items()} # invert map code to code name
     Zedex = ZeroDex  # only zeroth gram codes for rending
     Audex = AuthDex  # signed gram codex
+    Chadex = ChainDex  # chained gram codex
+    Sudex = SureDex  # sure (acked) gram codex
 
     # dict of gram header part sizes keyed by gram codes: bz nz mz vz az
     Sizes = {
@@ -591,13 +818,23 @@ class Memoer(Tymee):
                 'bAAH': Sizage(bz=4, nz=4, mz=24, vz=0, az=88),
                 'bAAI': Sizage(bz=4, nz=4, mz=24, vz=0, az=0),
                 'bAAJ': Sizage(bz=4, nz=4, mz=24, vz=44, az=88),
+                'bAAK': Sizage(bz=4, nz=4, mz=24, vz=44, az=132),
+                'bAAL': Sizage(bz=4, nz=4, mz=24, vz=0, az=44),
              }
 
+    # size of root digest part that leads authenticator part az: root + sig
+    # non-zeroth chained root part is the next link without sig
+    Roots = {
+                'bAAK': 44,
+                'bAAL': 44,
+            }
+
     Pairs = dict()  # pair the zeroth code with the non-zeroth code of same type
     Pairs[MemoDex.GramZero] = MemoDex.Gram
     Pairs[MemoDex.GramAuthZero] = MemoDex.GramAuth
     Pairs[MemoDex.GramSureZero] = MemoDex.GramSure
     Pairs[MemoDex.GramSureAuthZero] = MemoDex.GramSureAuth
+    Pairs[MemoDex.GramChainZero] = MemoDex.GramChain
 
     # Base2 Binary index representation of Text Base64 Char Codes
     #Bodes = ({helping.codeB64ToB2(c): c for n, c in Codes.items()})
@@ -607,6 +844,14 @@ class Memoer(Tymee):
     MaxGramSize = 65535  # (2**16-1) absolute max gram size overridden in subclass
     BufSize = 65535  # (2**16-1)  default buffersize
     Tymeout = 0.0  # tymeout in seconds, tymeout of 0.0 means ignore tymeout
+    CacheSize = 1024  # max entries of each key cache, oldest evicted first
+    Window = 64  # max sure grams in flight per destination
+    Retries = 8  # max consecutive retry tymer expiries before sure memo fails
+    Rto = 1.0  # initial retry tymeout in seconds when .tymeout is 0.0
+    MinRto = 0.2  # min retry tymeout in seconds
+    MaxRto = 60.0  # max retry tymeout in seconds
+    Cwnd = 4.0  # initial congestion window of sure grams per destination
+    Burst = 4  # min pacing burst of sure grams per destination
 
     @classmethod
     def makeMID(cls, code='0A'):
@@ -964,6 +1209,96 @@ class Memoer(Tymee):
         return raw, code  # qualified base64 sigseed
 
 
+    @classmethod
+    def _encodeDIG(cls, raw, code='F'):
+        """Utility method for use with chained headers that encodes raw root
+        digest as CESR compatible fully qualified B64 text domain str using CESR
+        compatible text code
+
+        Parameters:
+            raw (bytes): digest to be encoded with code
+            code (str): code for type of raw digest CESR compatible
+                Blake2b_256: str = 'F'  # Blake2b 256 bit digest derivation.
+
+        Returns:
+           qb64 (str): fully qualified base64 digest
+        """
+        if code not in ('F', ):
+            raise hioing.MemoerError(f"Invalid digest {code=}")
+
+        rz = len(raw)  # raw size
+        if rz != 32:
+            raise hioing.MemoerError(f"Invalid raw size {rz=} not 32")
+
+        pz = (3 - ((rz) % 3)) % 3  # net pad size for raw
+        b64 = encodeB64(bytes([0] * pz) + raw)[pz:] # prepad, convert, and prestrip
+        return code + b64.decode()  # fully qualified base64 with prefix code
+
+
+    @classmethod
+    def _decodeDIG(cls, qb64):
+        """Utility method for use with chained headers that decodes qualified
+        base64 root digest to raw domain bytes from CESR compatible text code
+
+        Allowed Codes:  (CESR compatible)
+            Blake2b_256: str = 'F'  # Blake2b 256 bit digest derivation.
+
+        Parameters:
+            qb64 (str or bytes): qualified base64 digest to be decoded with code
+
+        Returns:
+            tuple(raw, code) where:
+                raw (bytes): digest
+                code (str): CESR compatible code from qb64
+        """
+        if hasattr(qb64, "decode"):  # bytes
+            qb64 = qb64.decode()  # convert to str
+
+        hz = 1  # only support qb64 length 44
+        code = qb64[:hz]
+        if code not in ('F', ):
+            raise hioing.MemoerError(f"Invalid digest {code=}")
+
+        qz = len(qb64)  # text size
+        if qz != 44:
+            raise hioing.MemoerError(f"Invalid digest text size {qz=} not 44")
+
+        pz = hz % 4  # net pad size given hz
+        base =  pz * b'A' + qb64[hz:].encode()  # strip code from b64 and prepad pz 'A's
+        paw = decodeB64(base)  # now should have pz leading sextexts of zeros
+        raw = paw[pz:]  # remove prepad midpad bytes to invert back to raw
+        if int.from_bytes(paw[:pz], "big") != 0:
+            raise hioing.MemoerError(f"Nonzero midpad bytes in digest.")
+
+        return raw, code
+
+
+    @staticmethod
+    def _chain(bodies):
+        """Returns raw root digest of backward blake2b-256 hash chain over
+        bodies in gram number order. The root of no bodies is 32 zero bytes.
+
+        Parameters:
+            bodies (Sequence[bytes]): bodies of non-zeroth grams in order
+        """
+        link = bytes(32)
+        for body in reversed(bodies):
+            link = Memoer._link(body, link)
+        return link
+
+
+    @staticmethod
+    def _link(body, link):
+        """Returns raw blake2b-256 digest of body followed by next link of
+        backward hash chain
+
+        Parameters:
+            body (bytes | memoryview): body of non-zeroth gram
+            link (bytes): raw digest of next link or 32 zero bytes when last
+        """
+        return pysodium.crypto_generichash(bytes(body) + link, outlen=32)
+
+
     def __init__(self, *,
                  tymeout=None,
                  name=None,
@@ -985,6 +1320,16 @@ class Memoer(Tymee):
                  echoic=False,
                  keep=None,
                  vid=None,
+                 budget=None,
+                 hwm=None,
+                 bytic=False,
+                 rxtymeout=None,
+                 rxcap=None,
+                 srccap=None,
+                 window=None,
+                 retries=None,
+                 ackvids=None,
+                 rate=None,
                  **kwa
                 ):
         """Setup instance
@@ -1061,6 +1406,26 @@ class Memoer(Tymee):
                               overridden in subclass for real world key management.
             vid (str or None): own vid defaults used to lookup keys to sign on tx
             tymeout (float): default for retry tymer if any
+            budget (Budget or None): bounds each greedy serviceReceives call
+                by count of grams, bytes, or microseconds. None means unbounded
+            hwm (int or None): high water mark of grams in .txgs when streaming
+                memos. None means each memo is partitioned whole into .txgs
+            bytic (bool): True means fused rx memos are bytes without decode.
+                False means fused rx memos are decoded to utf-8 str
+            rxtymeout (float or None): seconds a partial memo may wait for its
+                missing grams before it is evicted. None means no timeout.
+            rxcap (int or None): max total bytes of bodies of partial memos in
+                .rxgs. None means unbounded.
+            srccap (int or None): max bytes of bodies of partial memos in .rxgs
+                from any one source. None means unbounded.
+            window (int or None): max sure grams in flight per destination.
+                None means use .Window
+            retries (int or None): max retry tymer expiries of a sure memo.
+                None means use .Retries
+            ackvids (dict or None): vid expected to sign the acks of each
+                destination keyed by dst when sure code is signed
+            rate (float or None): max pacing rate of sure grams per second
+                per destination. None means no fixed cap.
 
         """
 
@@ -1078,6 +1443,13 @@ class Memoer(Tymee):
 
         self.echos = deque()  # only used in testing as echoed tx
         self.inbox = deque()  # holds complete receive memos for testing
+        self.roots = dict()  # signed root digests of chained memos by mid
+        self.chained = set()  # mids of partial memos with chained grams
+        self.links = dict()  # authenticated links of chained grams by mid
+        self.pends = dict()  # unauthenticated chained grams by mid
+        self.readies = deque(mid for mid, grams in self.rxgs.items()
+                             if mid in self.counts
+                             and len(grams) >= self.counts[mid])  # complete
 
         self.code = code
         self.curt = curt
@@ -1089,6 +1461,30 @@ class Memoer(Tymee):
         self.tymeout = tymeout if tymeout is not None else self.Tymeout
         self.tymers = {}
         #Tymer(tymth=self.tymth, duration=self.tymeout) # retry tymer
+        self.budget = budget
+        self.hwm = max(1, int(hwm)) if hwm is not None else None
+        self.txgen = None  # (grams generator, dst) of memo being streamed
+        self.bytic = True if bytic else False
+        self.rxtymeout = abs(float(rxtymeout)) if rxtymeout is not None else None
+        self.rxcap = max(0, int(rxcap)) if rxcap is not None else None
+        self.srccap = max(0, int(srccap)) if srccap is not None else None
+        self.rxtymers = dict()  # reassembly tymers of partial memos by mid
+        self.rxloads = dict()  # bytes of partial memos by mid by src
+        self.rxsizes = dict()  # total bytes of partial memos by src
+        self.rxsize = 0  # total bytes of partial memos
+        self.stats = dict(rxtymeout=0, rxcap=0, srccap=0)  # eviction counts
+        self.window = max(1, int(window)) if window is not None else self.Window
+        self.retries = max(0, int(retries)) if retries is not None else self.Retries
+        self.deliveries = dict()  # sender state of sure memos by mid
+        self.ackvids = ackvids if ackvids is not None else dict()
+        self.flights = dict()  # sure grams in flight by dst
+        self.rtts = dict()  # round trip estimates by dst
+        self.outcomes = deque()  # Outcome of each sure memo sent
+        self.rate = abs(float(rate)) if rate is not None else None
+        self.congs = dict()  # Congestion by dst
+        self.acks = dict()  # srcs of sure memos to ack by mid
+        self.sacks = dict()  # [cum, above] of sure memos in .rxgs by mid
+        self.dones = dict()  # (gc, vid) of recently fused sure memos by mid
 
         if not hasattr(self, "name"):  # stub so mixin works in isolation.
             self.name = name if name is not None else "main"  # mixed with subclass should provide this.
@@ -1106,6 +1502,11 @@ class Memoer(Tymee):
             self.bs = self.BufSize
 
         self._echoic = True if echoic else False
+        self._sigkeys = dict()
+        self._verkeys = dict()
+        self._unknowns = dict()
+        self._templates = dict()  # rend header templates keyed by (code, curt)
+        self._layouts = dict()  # parse header offsets keyed by (code, curt)
         self._keep = keep if keep is not None else dict()
         self.vid = vid if vid else None
 
@@ -1226,6 +1627,41 @@ class Memoer(Tymee):
         """
         return self._keep
 
+
+    @keep.setter
+    def keep(self, keep):
+        """Property setter for ._keep that invalidates cached keys
+
+        Parameters:
+            keep (dict or None): labels are vids and values are Keyage instances
+        """
+        self._keep = keep if keep is not None else dict()
+        self.flushKeys()
+
+
+    def flushKeys(self):
+        """Clear caches of expanded signing keys, decoded verification keys,
+        and unknown vids. Entries are revalidated against .keep on each use so
+        this is only needed to release memory or after mutating a Keyage in
+        place.
+        """
+        self._sigkeys.clear()
+        self._verkeys.clear()
+        self._unknowns.clear()
+
+
+    def _cache(self, cache, key, value):
+        """Add entry to cache evicting oldest entry when full
+
+        Parameters:
+            cache (dict): one of ._sigkeys, ._verkeys, or ._unknowns
+            key (str): vid
+            value (Any): cached value
+        """
+        if key not in cache and len(cache) >= self.CacheSize:
+            del cache[next(iter(cache))]  # oldest by insertion order
+        cache[key] = value
+
     @property
     def vid(self):
         """Property getter for ._vid
@@ -1272,6 +1708,38 @@ class Memoer(Tymee):
         self.opened = False
 
 
+    def watch(self, waker, doer):
+        """Watch socket .ls of socket transport subclass with waker so doer is
+        woken when it is receivable, or also sendable while transmits are
+        pending. Give doer a larger tock so it only runs when woken or its
+        tock comes due. Call again after each service so the interest in
+        sends follows the transmits. Does nothing when waker is None or there
+        is no opened socket.
+
+        Parameters:
+            waker (Waker | None): I/O readiness registry injected into doer
+            doer (Doer): doer woken when socket is ready
+        """
+        ls = getattr(self, "ls", None)
+        if waker is None or not ls:
+            return
+        events = selectors.EVENT_READ
+        if self.txms or self.txgs or self.txbs[0]:
+            events |= selectors.EVENT_WRITE
+        waker.watch(ls, events, doer)
+
+
+    def unwatch(self, waker):
+        """Unwatch socket .ls with waker before it is closed. See .watch
+
+        Parameters:
+            waker (Waker | None): I/O readiness registry injected into doer
+        """
+        ls = getattr(self, "ls", None)
+        if waker is not None and ls:
+            waker.unwatch(ls)
+
+
     def wind(self, tymth):
         """
         Inject new tymist.tymth as new ._tymth. Changes tymist.tyme base.
@@ -1280,15 +1748,37 @@ class Memoer(Tymee):
         super().wind(tymth)  # wind Tymee superclass
         for tid, tymer in self.tymers.items():
             tymer.wind(tymth)
+        for mid, tymer in self.rxtymers.items():
+            tymer.wind(tymth)
 
 
     def serviceTymers(self):
-        """Service all retry tymers
-
-        Must be overriden in subclass.
-        This is a stub.
-        """
-        pass
+        """Service all retry tymers of sure memos being sent. When a tymer
+        expires the grams of its memo still in flight are queued first for
+        retransmit and the retry tymeout of its destination is doubled up to
+        .MaxRto. After .retries consecutive expiries without progress the
+        memo fails.
+        """
+        for mid, tymer in list(self.tymers.items()):
+            if not tymer.expired:
+                continue
+            delivery = self.deliveries.get(mid)
+            if delivery is None:
+                del self.tymers[mid]
+                continue
+            dst = delivery.dst
+            if not delivery.inflight:  # waiting on window not acks
+                tymer.start(duration=self._rto(dst))
+                continue
+            delivery.tries += 1
+            if delivery.tries > self.retries:
+                self._deliver(delivery, False)
+                continue
+            rtt = self.rtts.setdefault(dst, [None, None, self._rto(dst)])
+            rtt[2] = min(2 * rtt[2], self.MaxRto)  # back off
+            self._collapse(dst)
+            self._requeue(delivery, sorted(delivery.inflight))
+            tymer.start(duration=rtt[2])
 
     def wiff(self, gram):
         """Determines encoding of gram bytes header when parsing grams.
@@ -1357,11 +1847,7 @@ class Memoer(Tymee):
         if hasattr(vid, "decode"):  # bytes
             vid = vid.decode()  # make str
 
-        verkey, code = Memoer._decodeVID(vid)
-        if code not in ('B', ):  # not non-trans so lookup in keep
-            if not (keyage := self.keep.get(vid)):
-                raise hioing.MemoerVerifyError(f"Missing keyage in keep for {vid=}")
-            verkey, _ = Memoer._decodeQVK(keyage.qvk)  #
+        verkey = self._verkey(vid)  # raises MemoerVerifyError if unknown
 
         try:  # may be correct size but not validly encoded
             rawsig, code = Memoer._decodeSGN(sig)
@@ -1383,11 +1869,78 @@ class Memoer(Tymee):
         return True
 
 
+    def _verkey(self, vid):
+        """Returns raw verification key for vid from cache or else decoded
+        from vid when nontransferable or from .keep and then cached.
+
+        Raises MemoerVerifyError when vid is undecodable or missing from .keep
+        and caches vid as unknown so repeats are rejected without decoding.
+
+        Parameters:
+            vid (str): qualified base64 of verifier ID
+        """
+        keep = self.keep
+        if vid in self._unknowns:
+            if vid not in keep:  # still unknown
+                raise hioing.MemoerVerifyError(f"Missing keyage in keep for {vid=}")
+            del self._unknowns[vid]  # added to keep since
+
+        if (cached := self._verkeys.get(vid)) is not None:
+            verkey, keyage = cached
+            if keyage is None or keep.get(vid) is keyage:  # not stale
+                return verkey
+
+        try:
+            verkey, code = Memoer._decodeVID(vid)
+        except hioing.MemoerError as ex:
+            self._cache(self._unknowns, vid, None)
+            raise hioing.MemoerVerifyError(f"Undecodable {vid=}") from ex
+
+        keyage = None
+        if code not in ('B', ):  # not non-trans so lookup in keep
+            if not (keyage := keep.get(vid)):
+                self._verkeys.pop(vid, None)
+                self._cache(self._unknowns, vid, None)
+                raise hioing.MemoerVerifyError(f"Missing keyage in keep for {vid=}")
+            verkey, _ = Memoer._decodeQVK(keyage.qvk)
+
+        self._cache(self._verkeys, vid, (verkey, keyage))
+        return verkey
+
+
     def pick(self, gram):
         """Strips header from gram bytearray leaving only gram body in gram and
-        returns (mid, gn, gc). Raises MemoerError if unrecognized or invalid
+        returns (mid, vid, gn, gc). Raises MemoerError if unrecognized or invalid
         header this includes signature verification failure when signed.
 
+        Compatible wrapper of .parse that copies the body back into gram.
+        The receive path uses .parse directly which does not copy.
+
+        Returns:
+            result (tuple): tuple of form:
+                (mid: str, vid: str, gn: int, gc: int or None)
+                see .parse
+
+        Parameters:
+            gram (bytearray): memo gram from which to parse and strip its header.
+        """
+        mid, vid, gn, gc, code, body = self.parse(gram)
+        body, view = bytes(body), body
+        view.release()  # release export so gram may be resized
+        gram[:] = body  # strip header and auth part leaving body
+        return (mid, vid, gn, gc)
+
+
+    def parse(self, gram):
+        """Parses header of gram without copying and returns
+        (mid, vid, gn, gc, code, body) where body is memoryview slice of gram.
+        Raises MemoerError if unrecognized or invalid header this includes
+        signature verification failure when signed.
+
+        Header fields are sliced at the offsets given by the layout of the
+        gram code and header encoding, see ._layout. Only the signed part of a
+        signed gram is copied to verify its signature.
+
         When signed the signature is computed on the body of the gram as is when
         gramified for transmission whether the body be in domain qb64b or qb2.
         The body is assumed to always be in the raw domain ser when signed.
@@ -1404,113 +1957,130 @@ class Memoer(Tymee):
 
         Returns:
             result (tuple): tuple of form:
-                (mid: str, vid: str, gn: int, gc: int or None) where:
+                (mid: str, vid: str, gn: int, gc: int or None, code: str,
+                 body: memoryview) where:
                 mid is fully qualified memoID,
                 vid is verifier ID used to look up signature verification key,
-                gn is gram number,
-                gc is gram count.
-                When first gram (zeroth) returns (mid, vid, 0, gc).
-                When other gram returns (mid, vid, gn, None)
+                gn is gram number or cumulative gram number when ack,
+                gc is gram count,
+                code is gram code,
+                body is gram body part as memoryview slice of gram.
+                When first gram (zeroth) returns (mid, vid, 0, gc, code, body).
+                When other gram returns (mid, vid, gn, None, code, body)
                 When code has empty vid then vid is None
                 Otherwise raises MemoerError error.
 
-        When valid recognized header, strips header bytes from front of gram
-        leaving the gram body part bytearray.
+        When chained, the verified root of a zeroth gram is saved in .roots.
+        The body of a non-zeroth chained gram is authenticated by its next
+        link on receipt, see ._unchain.
 
         Parameters:
-            gram (bytearray): memo gram from which to parse and strip its header.
+            gram (bytes | bytearray | memoryview): memo gram to parse. Body
+                view holds gram so gram must not be changed while body is held.
+        """
+        view = memoryview(gram)
+        if not len(view):
+            raise hioing.MemoerError("Empty gram.")
+        curt = self.wiff(view)  # rx gram encoding True=B2 or False=B64
+        if len(view) < (3 if curt else 4):  # code is 3 triplets or 4 sextets
+            raise hioing.MemoerError(f"Gram length={len(view)} to short to "
+                                     f"hold code.")
+        if curt:  # base2 binary encoding in triplets
+            code = helping.codeB2ToB64(view, 4)  # code from first 4 sextets
+        else:  # base64 text encoding in quadlets
+            try:
+                code = bytes(view[:4]).decode()
+            except UnicodeDecodeError as ex:
+                raise hioing.MemoerError("Undecodable gram code.") from ex
+        if self.authic and code not in self.Audex:  # must be signed
+            raise hioing.MemoerError(f"Unsigned gram {code =} when signed "
+                                     f"required.")
+
+        oz, nx, mx, vx, hx, rz, sz = self._layout(code, curt)
+        if len(view) < oz:  # not big enough for overhead
+            raise hioing.MemoerError(f"Not enough rx bytes for "
+                                     f"{'b2' if curt else 'b64'} gram < {oz}.")
+
+        if curt:
+            gn = int.from_bytes(view[nx:mx])  # gram number/count convert to int
+            mid = encodeB64(view[mx:vx])  # convert to b64b
+            vid = encodeB64(view[vx:hx])  # convert to b64b
+        else:
+            gn = helping.b64ToInt(bytes(view[nx:mx]))  # qb64b short part of neck
+            mid = bytes(view[mx:vx])  # qb64b with prefix
+            vid = bytes(view[vx:hx])  # qb64b
+        if code in ZeroDex: # first (zeroth) gram so get gram count
+            gc = gn  # zeroth so gcnt in neck where gnum
+            gn = 0   # zeroth so gnum must be zero
+        elif code in GramDex:
+            gc = None # not provided in this gram
+            if not vid:
+                vid = self.vids.get(mid.decode()) # if not then get from .vids
+                if vid is None and (done := self.dones.get(mid.decode())):
+                    vid = done[1]  # retransmit of fused sure memo
+                vid = vid.encode() if vid is not None else b""
+        elif code in AckDex:
+            gc = None
+        else:
+            raise hioing.MemoerError(f"Invalid {code=}")
 
+        ez = len(view) - sz  # end of signed part
+        body = view[hx:ez - rz]  # between fore head and auth part
+        sig = view[ez:]  # last sz bytes are signature if any
+        root = view[ez - rz:ez]  # root leads auth part if any
+        sig, root = (encodeB64(sig), encodeB64(root)) if curt else (bytes(sig), bytes(root))
 
-        """
-        curt = self.wiff(gram)  # rx gram encoding True=B2 or False=B64
-        if curt:  # base2 binary encoding in triplets
-            if len(gram) < 3:  # assumes len(code) must be 3 triplets (4 sextexts)
-                raise hioing.MemoerError(f"Gram length={len(gram)} to short to "
-                                         f"hold code.")
-            code = helping.codeB2ToB64(gram, 4)  # code from first 4 sextets
-            if self.authic and code not in self.Audex:  # must be signed
-                raise hioing.MemoerError(f"Unsigned gram {code =} when signed "
-                                         f"required.")
+        if sig:  # signature not empty when Auth code sig is never empty
+            self.verify(vid, sig, bytes(view[:ez]))  # raises MemoerVerifyError if invalid
 
-            bz, nz, mz, vz, az = self.Sizes[code]  # bz nz mz vz az
-            # head encoced as b2 means bz head part sizes (bizes) are smaller by 3/4
-            bz = 3 * bz // 4
-            nz = 3 * nz // 4
-            mz = 3 * mz // 4
-            vz = 3 * vz // 4
-            az = 3 * az // 4
-
-            oz =  bz + mz + nz + vz + az
-
-            if len(gram) < oz :  # not big enough for overhead
-                raise hioing.MemoerError(f"Not enough rx bytes for b2 gram"
-                                         f" < {oz}.")
-
-
-            gnum = gram[bz:bz+nz]  # bytearray to bytes gnum
-            gn = int.from_bytes(gnum)  # gram number/count convert to int
-            mid = encodeB64(gram[bz+nz:bz+nz+mz])  # convert to b64b
-            vid = encodeB64(gram[bz+nz+mz:bz+nz+mz+vz])  # convert to b64b
-            if code in ZeroDex: # first (zeroth) gram so get gram count
-                gc = gn  # zeroth so gcnt in neck where gnum
-                gn = 0   # zeroth so gnum must be zero
-            elif code in GramDex:
-                gc = None # not provided in this gram
-                if not vid:
-                    vid = self.vids.get(mid.decode()) # if not then get from .vids
-                    vid = vid.encode() if vid is not None else b""
-            elif code in AckDex:
-                pass
-            else:
-                raise hioing.MemoerError(f"Invalid {code=}")
+        if code in self.Chadex and gc is not None:  # zeroth so root verified by signature
+            raw, _ = self._decodeDIG(root)
+            if mid.decode() not in self.roots:  # first only no replay
+                self.roots[mid.decode()] = raw
 
+        return (mid.decode(), vid.decode() if vid else None, gn, gc, code, body)
 
-            sig = encodeB64(gram[-az if az else len(gram):])   # last ss bytes are signature
-            del gram[-az if az else len(gram):]  # strip sig if any
-            sgram = bytes(gram[:])  # signed raw part make bytes copy to sign
-            del gram[:oz-az]  # strip off fore head leaving body in gram
 
-        else:  # base64 text encoding in quadlets
-            if len(gram) < 4:  # assumes len(code) must be 4
-                raise hioing.MemoerError(f"Gram length={len(gram)} to short to "
-                                         f"hold code.")
-            code = gram[:4].decode()  # assumes len(code) must be 2
-            if self.authic and code not in self.Audex:  # must be signed
-                raise hioing.MemoerError(f"Unsigned gram {code =} when signed "
-                                         f"required.")
-            bz, nz, mz, vz, az = self.Sizes[code]  # bz nz mz vz az
-            oz =  bz + nz + mz  + vz + az
-
-            if len(gram) < (oz):  # not big enough for overhead
-                raise hioing.MemoerError(f"Not enough rx bytes for b64 gram"
-                                         f" < {oz}.")
-
-            gnum = bytes(gram[bz:bz+nz])  # qb64b short part of neck
-            gn = helping.b64ToInt(gnum)
-            mid = bytes(gram[bz+nz:bz+nz+mz])  # bytearray to bytes qb64b with prefix
-            vid = bytes(gram[bz+mz+nz:bz+mz+nz+vz]) #bytearry to bytes qb64b convert to qb64
-            if code in ZeroDex: # first (zeroth) gram so get gram count
-                gc = gn  # zeroth so gcnt in neck where gnum
-                gn = 0   # zeroth so gnum must be zero
-            elif code in GramDex:
-                gc = None # not provided in this gram
-                if not vid:
-                    vid = self.vids.get(mid.decode()) # if not then get from .vids
-                    vid = vid.encode() if vid is not None else b""
-            elif code in AckDex:
-                pass
-            else:
-                raise hioing.MemoerError(f"Invalid {code=}")
+    def _layout(self, code, curt):
+        """Returns offset tuple for parsing grams with gram code and header
+        encoding curt. Layouts are computed once per (code, curt) and cached
+        in ._layouts.
 
-            sig = bytes(gram[-az if az else len(gram):])  # last az bytes signature
-            del gram[-az if az else len(gram):]  # strip sig if any
-            sgram = bytes(gram[:]) # signed raw part make bytes copy to sign
-            del gram[:oz-az]  # strip of fore head leaving body in gram
+        Layout tuple of form:
+            (oz, nx, mx, vx, hx, rz, sz) where sizes and offsets are in chars
+            or bytes when curt:
+            oz is overhead size of header and auth part,
+            nx is offset of neck part,
+            mx is offset of mid part,
+            vx is offset of vid part,
+            hx is offset of body after fore head,
+            rz is root part size of auth part,
+            sz is signature part size of auth part.
 
-        if sig:  # signature not empty when Auth code sig is never empty
-            self.verify(vid, sig, sgram)  # raises MemoerVerifyError if invalid
+        Raises MemoerError when code is unrecognized.
+
+        Parameters:
+            code (str): gram code
+            curt (bool): True means base2 header. False means base64 header.
+        """
+        layout = self._layouts.get((code, curt))
+        if layout is not None:
+            return layout
+
+        try:
+            bz, nz, mz, vz, az = self.Sizes[code]  # bz nz mz vz az
+        except KeyError as ex:
+            raise hioing.MemoerError(f"Unrecognized {code=}") from ex
+        rz = self.Roots.get(code, 0)  # root leads auth part if any
+        if curt:  # head encoded as b2 means part sizes smaller by 3/4
+            bz, nz, mz, vz, az, rz = (3 * z // 4 for z in (bz, nz, mz, vz, az, rz))
 
-        return (mid.decode(), vid.decode() if vid else None, gn, gc)
+        mx = bz + nz
+        vx = mx + mz
+        hx = vx + vz
+        layout = (hx + az, bz, mx, vx, hx, rz, az - rz)
+        self._layouts[(code, curt)] = layout
+        return layout
 
 
     def receive(self, *, echoic=False) -> (bytes, str or tuple or None):
@@ -1551,6 +2121,21 @@ class Memoer(Tymee):
         return result
 
 
+    def pending(self, *, echoic=False):
+        """Returns True when a gram is waiting to be received without
+        receiving it so a serviceReceives stopped by .budget knows it has
+        grams left. Uses .echos when echoic.
+
+        Must be overridden in subclass.
+        This is a stub to define mixin interface.
+
+        Parameters:
+            echoic (bool): True means use .echos. See .receive
+        """
+        echoic = echoic or self.echoic  # use parm when True else default .echoic
+        return bool(self.echos) if echoic else False
+
+
     def _serviceOneReceived(self, *, echoic=False):
         """Service one received duple (raw, src) raw packet data. Always returns
         complete datagram.
@@ -1588,37 +2173,266 @@ class Memoer(Tymee):
         if not gram:  # no received data
             return False  # so try again later
 
-        gram = bytearray(gram)  # make copy bytearray so can strip off header
+        if self.budget is not None:
+            self.budget.spend(len(gram))
+
+        if isinstance(gram, bytearray):  # mutable so copy once to keep views valid
+            gram = bytes(gram)
 
         try:
-            mid, vid, gn, gc = self.pick(gram)  # parse and strip off head leaving body
+            mid, vid, gn, gc, code, body = self.parse(gram)  # body is view without head
         except hioing.MemoerError as ex: # invalid gram so drop
             # may be bad signature when signed or unrecognized header format
             logger.error("Invalid Memoer gram from %s.\n %s.", src, ex)
             return True  # did receive data so can try again now
 
-        if mid not in self.rxgs:
-            self.rxgs[mid] = dict()
-
-        # save stripped gram to be fused later
-        if gn not in self.rxgs[mid]:  # make idempotent first only no replay
-            self.rxgs[mid][gn] = gram  # index body by its gram number
-
-        if gc is not None:
-            if mid not in self.counts:  # make idempotent first only no replay
-                self.counts[mid] = gc  # save gram count for mid
+        if code in AckDex:  # ack of sure memo sent by this memoer
+            self._acked(mid, gn, body, src, vid)
+            return True
 
-        if mid not in self.vids:
-            self.vids[mid] = vid
+        if code in self.Sudex:  # sure gram so ack on next pass
+            self.acks[mid] = src
+            if mid in self.dones:  # already fused so only ack again
+                return True
+            self.sacks.setdefault(mid, [0, set()])
 
-        # assumes unique mid across all possible sources. No replay by different
-        # source only first source for a given mid is ever recognized
-        if mid not in self.sources:  # make idempotent first only no replay
+        chain = code in self.Chadex
+        if chain and gc is None:  # non-zeroth so next link ends gram
+            try:
+                link = self._nextLink(gram)
+            except hioing.MemoerError as ex:
+                logger.error("Invalid Memoer gram from %s.\n %s.", src, ex)
+                return True
+        if chain and mid not in self.chained:
+            if mid in self.rxgs:  # unauthenticated unchained grams so drop them
+                root = self.roots.get(mid)
+                self._forget(mid)
+                if root is not None:  # keep root verified by this gram
+                    self.roots[mid] = root
+            self.chained.add(mid)
+        elif not chain and mid in self.chained:
+            logger.error("Unchained Memoer gram of chained memo %s from %s "
+                         "dropped.", mid, src)
+            return True
+
+        grams = self.rxgs.get(mid)
+        if grams is None:  # new partial memo
+            grams = self.rxgs[mid] = dict()
+            # assumes unique mid across all possible sources. No replay by different
+            # source only first source for a given mid is ever recognized
             self.sources[mid] = src  # save source for later
+            self.rxloads.setdefault(src, dict())[mid] = 0
+            self.rxsizes.setdefault(src, 0)
+            if self.rxtymeout is not None and self.tymth:  # reassembly tymer
+                self.rxtymers[mid] = Tymer(tymth=self.tymth,
+                                           duration=self.rxtymeout)
+        elif (chain and gc is not None and 0 not in grams
+                and self.sources.get(mid) != src):  # signed zeroth so its source
+            self._rehome(mid, src)
+        cnt = self.counts.get(mid)
+        fresh = False  # True when gram or count is new
+
+        if gc is not None and cnt is None:  # make idempotent first only no replay
+            cnt = self.counts[mid] = gc  # save gram count for mid
+            fresh = True
+            for n in [n for n in grams if n >= cnt]:  # out of range so drop
+                del grams[n]
+
+        bodies = [(gn, body)]
+        if chain and gn not in grams and (cnt is None or gn < cnt):
+            bodies = self._unchain(mid, gn, body, link if gn else None)
+
+        # save body view of gram to be fused later
+        for gn, body in bodies:
+            if gn not in grams and (cnt is None or gn < cnt):  # first only no replay
+                grams[gn] = body  # index body by its gram number
+                self._charge(mid, len(body))
+                fresh = True
+                if (sack := self.sacks.get(mid)) is not None:  # advance cumulative
+                    if gn > sack[0]:
+                        sack[1].add(gn)
+                    while sack[0] in grams:
+                        sack[1].discard(sack[0])
+                        sack[0] += 1
+
+        if fresh and cnt is not None and len(grams) == cnt:  # last missing gram
+            self.readies.append(mid)  # so fuse once on next service pass
+
+        if self.vids.get(mid) is None:  # zeroth vid replaces None from earlier
+            self.vids[mid] = vid  # unsigned non-zeroth chained gram
+
+        if fresh:  # evict oldest partial memos until within caps
+            origin = self.sources.get(mid)
+            if self.srccap is not None:
+                while self.rxsizes.get(origin, 0) > self.srccap:
+                    self._evict(next(iter(self.rxloads[origin])), "srccap")
+            if self.rxcap is not None:
+                while self.rxsize > self.rxcap:
+                    self._evict(next(iter(self.rxgs)), "rxcap")
 
         return True  # received valid so can try again now
 
 
+    def _nextLink(self, gram):
+        """Returns raw next link digest from the root part that ends non-zeroth
+        chained gram. Raises MemoerError when malformed.
+
+        Parameters:
+            gram (bytes | memoryview): non-zeroth chained gram
+        """
+        rz = self.Roots[self.Chadex.GramChain]
+        if self.wiff(gram):  # base2 root part smaller by 3/4
+            link = encodeB64(gram[-(3 * rz // 4):])
+        else:
+            link = bytes(gram[-rz:])
+        raw, _ = self._decodeDIG(link)
+        return raw
+
+
+    def _unchain(self, mid, gn, body, link):
+        """Returns list of (gn, body) duples of the chained grams of memo mid
+        authenticated in gram number order by receipt of gram gn. Empty when
+        gram gn is dropped or pending.
+
+        The signed zeroth gram authenticates its root as the link of gram 1.
+        A non-zeroth gram whose link is known is authentic when the hash of its
+        body and next link equals its link and is dropped alone otherwise. A
+        non-zeroth gram whose link is not yet known is held in .pends. Each
+        authenticated gram authenticates its next link so pending grams are
+        verified in turn and the first authentic candidate of each is kept.
+
+        Parameters:
+            mid (str): memo ID of chained memo
+            gn (int): gram number
+            body (memoryview): body of gram
+            link (bytes | None): raw next link of non-zeroth gram. None when
+                zeroth.
+        """
+        links = self.links.setdefault(mid, dict())
+        pends = self.pends.setdefault(mid, dict())
+        if not gn:  # zeroth so root is link of gram 1
+            links[1] = self.roots[mid]
+            bodies = [(gn, body)]
+        elif gn in links:
+            if self._link(body, link) != links[gn]:
+                logger.error("Invalid Memoer chained gram %s of %s from %s "
+                             "dropped.", gn, mid, self.sources.get(mid))
+                return []
+            links[gn + 1] = link
+            del links[gn]
+            bodies = [(gn, body)]
+        else:  # link unknown so pend
+            candidates = pends.setdefault(gn, [])
+            if (body, link) not in candidates:
+                candidates.append((body, link))
+                self._charge(mid, len(body))
+            return []
+
+        gn += 1
+        while (candidates := pends.pop(gn, None)) is not None:
+            self._charge(mid, -sum(len(body) for body, _ in candidates))
+            for body, link in candidates:
+                if self._link(body, link) == links[gn]:
+                    links[gn + 1] = link
+                    del links[gn]
+                    bodies.append((gn, body))
+                    break
+            else:
+                logger.error("Invalid Memoer chained gram %s of %s from %s "
+                             "dropped.", gn, mid, self.sources.get(mid))
+                break
+            gn += 1
+
+        return bodies
+
+
+    def _charge(self, mid, size):
+        """Charge size bytes of received body of memo mid to .rxsize and to the
+        loads of its source in .rxloads and .rxsizes
+
+        Parameters:
+            mid (str): memo ID of partial memo in .rxgs
+            size (int): bytes of body added to .rxgs
+        """
+        src = self.sources.get(mid)
+        loads = self.rxloads.get(src)
+        if loads is None or mid not in loads:  # not accounted such as preloaded
+            return
+        loads[mid] += size
+        self.rxsizes[src] += size
+        self.rxsize += size
+
+
+    def _rehome(self, mid, src):
+        """Move partial memo mid and its load in .rxloads and .rxsizes to
+        source src such as when its first gram was an unauthenticated chained
+        gram from another source.
+
+        Parameters:
+            mid (str): memo ID of partial memo in .rxgs
+            src (str | tuple): source of authenticated zeroth gram
+        """
+        size = self._release(mid)
+        self.sources[mid] = src
+        self.rxloads.setdefault(src, dict())[mid] = size
+        self.rxsizes[src] = self.rxsizes.get(src, 0) + size
+        self.rxsize += size
+
+
+    def _release(self, mid):
+        """Returns size of load of memo mid after removing it from .rxloads,
+        .rxsizes, and .rxsize. Zero when not accounted.
+
+        Parameters:
+            mid (str): memo ID of memo in .rxgs
+        """
+        src = self.sources.get(mid)
+        loads = self.rxloads.get(src)
+        if loads is None or mid not in loads:
+            return 0
+        size = loads.pop(mid)
+        self.rxsize -= size
+        self.rxsizes[src] -= size
+        if not loads:  # no partial memos from src
+            del self.rxloads[src]
+            del self.rxsizes[src]
+        return size
+
+
+    def _evict(self, mid, reason):
+        """Evict partial memo mid from reassembly state and count reason
+        in .stats
+
+        Parameters:
+            mid (str): memo ID of partial memo in .rxgs
+            reason (str): key of .stats one of "rxtymeout", "rxcap", "srccap"
+        """
+        logger.info("Memoer %s evicted partial memo %s from %s for %s.",
+                    self.name, mid, self.sources.get(mid), reason)
+        self._forget(mid)
+        self.stats[reason] += 1
+
+
+    def _forget(self, mid):
+        """Remove memo mid from reassembly state in .rxgs .counts .sources
+        .vids .roots .chained .links .pends and .rxtymers and release its load
+
+        Parameters:
+            mid (str): memo ID of memo in .rxgs
+        """
+        self.rxgs.pop(mid, None)
+        self.counts.pop(mid, None)
+        self.vids.pop(mid, None)
+        self.roots.pop(mid, None)
+        self.chained.discard(mid)
+        self.links.pop(mid, None)
+        self.pends.pop(mid, None)
+        self.rxtymers.pop(mid, None)
+        self.sacks.pop(mid, None)
+        self._release(mid)
+        self.sources.pop(mid, None)
+
+
     def serviceReceivesOnce(self, *, echoic=False):
         """Service receives once (non-greedy) and queue up
 
@@ -1633,7 +2447,8 @@ class Memoer(Tymee):
 
 
     def serviceReceives(self, *, echoic=False):
-        """Service all receives (greedy) and queue up
+        """Service all receives (greedy) and queue up. When .budget then stops
+        once budget is spent and resumes on next call.
 
         Parameters:
             echoic (bool): True means use .echos in .receive debugging purposes
@@ -1641,9 +2456,16 @@ class Memoer(Tymee):
                            False means do not use .echos default is duple that
                             indicates nothing to receive of form (b'', None)
         """
+        budget = self.budget
+        if budget is not None:
+            budget.start()
         while self.opened:
             if not self._serviceOneReceived(echoic=echoic):
                 break
+            if budget is not None and budget.spent:
+                if self.pending(echoic=echoic):  # stopped with grams left
+                    budget.stop()
+                break  # resume on next call
 
 
     def fuse(self, grams, cnt):
@@ -1651,7 +2473,8 @@ class Memoer(Tymee):
         grams are missing then returns None.
 
         Returns:
-            memo (str or None): fused memo or None if incomplete.
+            memo (str or bytes or None): fused memo or None if incomplete.
+                bytes when .bytic otherwise str decoded as utf-8.
 
         Override in subclass
 
@@ -1663,49 +2486,59 @@ class Memoer(Tymee):
         if len(grams) < cnt:  # must be missing one or more grams
             return None
 
-        memo = bytearray()
-        for i in range(cnt):  # iterate in numeric order, items are insertion ordered
-            memo.extend(grams[i])  # extend memo with gram body part at gram i
-
-        return memo.decode()  # convert bytearray to str
+        memo = b''.join([grams[i] for i in range(cnt)])  # in gram number order
+        return memo if self.bytic else memo.decode()
 
 
 
     def _serviceOnceRxGrams(self):
-        """Service one pass over .rxgs dict for each unique mid in .rxgs
-
-        Deleting an item from a dict at a key (since python dicts are key
-        insertion ordered) means that the next time an item is created it will
-        be last.
+        """Service one pass over the complete memos in .readies. Each mid was
+        queued once by ._serviceOneReceived when its last missing gram
+        arrived so partial memos in .rxgs are never rescanned.
         """
-        for i, mid in enumerate(list(self.rxgs.keys())):  # items may be deleted in loop
-            # if mid then grams dict at mid must not be empty
-            if not mid in self.counts:  # missing first gram so skip
+        while self.readies:
+            mid = self.readies.popleft()
+            if mid not in self.rxgs or mid not in self.counts:  # already gone
                 continue
             memo = self.fuse(self.rxgs[mid], self.counts[mid])
             if memo is not None:  # allows for empty "" memo for some src
                 self.rxms.append((memo, self.sources[mid], self.vids[mid]))
-                del self.rxgs[mid]
-                del self.counts[mid]
-                del self.sources[mid]
-                del self.vids[mid]
+                if mid in self.sacks:  # sure so ack complete from now on
+                    self._cache(self.dones, mid, (self.counts[mid], self.vids[mid]))
+                self._forget(mid)
+
+
+    def _serviceRxTymers(self):
+        """Evict partial memos whose reassembly tymers in .rxtymers have
+        expired. Tymers share one duration so expire in creation order and
+        the scan stops at the first unexpired tymer.
+        """
+        while self.rxtymers:
+            mid, tymer = next(iter(self.rxtymers.items()))
+            if not tymer.expired:
+                break
+            self._evict(mid, "rxtymeout")
 
 
     def serviceRxGramsOnce(self):
-        """Service one pass (non-greedy) over all unique sources in .rxgs
-        dict if any for received incoming grams.
+        """Service one pass (non-greedy) over complete memos in .readies
+        if any for received incoming grams.
         """
-        if self.rxgs:
+        if self.readies:
             self._serviceOnceRxGrams()
+        if self.rxtymers:
+            self._serviceRxTymers()
 
 
     def serviceRxGrams(self):
-        """Service one pass (non-greedy) over all unique sources in .rxgs
-        dict if any for received incoming grams.  No different from
-        serviceRxGramsOnce because service all mids each pass.
+        """Service one pass (non-greedy) over complete memos in .readies
+        if any for received incoming grams.  No different from
+        serviceRxGramsOnce because service all ready mids each pass.
         """
-        if self.rxgs:
+        if self.readies:
             self._serviceOnceRxGrams()
+        if self.rxtymers:
+            self._serviceRxTymers()
 
 
     def _serviceOneRxMemo(self):
@@ -1741,11 +2574,291 @@ class Memoer(Tymee):
             self.inbox.append(self._serviceOneRxMemo())
 
 
+    def serviceAcks(self):
+        """Queue one ack gram at front of .txgs for each sure memo in .acks
+        that received grams since the last pass. A fused memo is acked with
+        its gram count as cumulative. The ranges above the cumulative are
+        limited to those that fit in one gram.
+        """
+        if not self.acks:
+            return
+        code = AckDex.AckAuth if self.vid else AckDex.Ack
+        oz = self._layout(code, self.curt)[0]
+        limit = max(0, (self.size - oz) // 6)  # ranges per ack
+        for mid, src in self.acks.items():
+            if mid in self.dones:  # complete
+                cum, ranges = self.dones[mid][0], []
+            else:
+                cum, above = self.sacks.get(mid) or (0, ())  # evicted when None
+                ranges = []
+                for gn in sorted(above):
+                    if ranges and ranges[-1][1] == gn:
+                        ranges[-1][1] = gn + 1
+                    elif len(ranges) < limit:
+                        ranges.append([gn, gn + 1])
+                    else:
+                        break
+            try:
+                gram = self.rendAck(mid, cum, ranges)
+            except hioing.MemoerError as ex:
+                logger.error("Memoer %s failed ack of %s.\n %s.", self.name, mid, ex)
+                continue
+            self.txgs.appendleft((gram, src))
+        self.acks.clear()
+
+
+    def rendAck(self, mid, cum, ranges=()):
+        """Returns ack gram for sure memo mid with header encoded per .curt.
+        Signed as AckAuth with .vid when .vid else unsigned Ack.
+
+        Parameters:
+            mid (str): memo ID of acked memo
+            cum (int): cumulative gram number. All gram numbers below received
+            ranges (Iterable): received gram number ranges above cum each of
+                form (start, end) end exclusive
+        """
+        code = AckDex.AckAuth if self.vid else AckDex.Ack
+        bz, nz, mz, vz, az = self.Sizes[code]  # bz nz mz vz az
+        codeb = code.encode()
+        neck = cum.to_bytes(3 * nz // 4)
+        midb = mid.encode()
+        vidb = self.vid.encode() if vz else b''
+        if self.curt:  # header in base2
+            codeb = decodeB64(codeb)
+            midb = decodeB64(midb)
+            vidb = decodeB64(vidb)
+        else:
+            neck = encodeB64(neck)
+        body = b''.join(start.to_bytes(3) + end.to_bytes(3) for start, end in ranges)
+        gram = b''.join((codeb, neck, midb, vidb, body))
+        if az:  # signed ack, .sign returns proper sig format when .curt
+            gram += self.sign(self.vid, gram)  # raises MemoerError if invalid
+        return gram
+
+
+    def _acked(self, mid, cum, body, src, vid):
+        """Apply ack of sure memo mid being sent. Releases acked grams from
+        flight, samples round trip time, deems lost the grams in flight sent
+        before an acked gram and queues them first for retransmit. Ends the
+        delivery once all grams are acked.
+
+        Ignores the ack unless it is from the destination of the memo and,
+        when the memo is signed, is signed by its expected vid.
+
+        Parameters:
+            mid (str): memo ID of acked memo
+            cum (int): cumulative gram number. All gram numbers below received
+            body (memoryview): ranges above cum as 3 byte pairs
+            src (str | tuple): source address of ack
+            vid (str | None): verified vid of AckAuth. None when unsigned Ack
+        """
+        delivery = self.deliveries.get(mid)
+        if delivery is None:  # already ended or unknown
+            return
+        dst = delivery.dst
+        if src != dst or (delivery.ackvid is not None and vid != delivery.ackvid):
+            logger.error("Unexpected Memoer ack of %s from %s with %s "
+                         "ignored.", mid, src, vid)
+            return
+        n = delivery.rended  # only pulled grams were sent
+        acked = []
+        if cum > delivery.cum:
+            acked.extend(range(delivery.cum, min(cum, n)))
+            delivery.cum = min(cum, n)
+        for i in range(0, len(body) - 5, 6):
+            start = int.from_bytes(body[i:i+3])
+            end = min(int.from_bytes(body[i+3:i+6]), n)
+            acked.extend(range(start, end))
+
+        mark = None  # latest send tyme of newly acked grams
+        sample = None  # latest send tyme of newly acked grams sent once
+        count = 0  # newly acked grams in flight
+        for gn in acked:
+            if delivery.grams.pop(gn, None) is None:  # already acked
+                continue
+            sent = delivery.inflight.pop(gn, None)
+            if sent is not None:
+                self.flights[dst] -= 1
+                count += 1
+                tyme, first = sent
+                mark = tyme if mark is None else max(mark, tyme)
+                if first:
+                    sample = tyme if sample is None else max(sample, tyme)
+        if count:
+            self._grow(dst, count)
+
+        if delivery.rended == delivery.count and not delivery.grams:  # all acked
+            self._deliver(delivery, True)
+            return
+
+        if mark is None:  # no progress
+            return
+        if sample is not None and self.tymth:
+            self._sample(dst, self.tyme - sample)
+        lost = sorted(gn for gn, (tyme, first) in delivery.inflight.items()
+                      if tyme < mark)  # sent before an acked gram
+        if lost:
+            self._shrink(dst, max(delivery.inflight[gn][0] for gn in lost))
+            self._requeue(delivery, lost)
+        delivery.tries = 0
+        if (tymer := self.tymers.get(mid)) is not None:
+            tymer.start(duration=self._rto(dst))
+
+
+    def _requeue(self, delivery, lost):
+        """Take lost grams of delivery out of flight and queue them first for
+        retransmit
+
+        Parameters:
+            delivery (Delivery): sure memo being sent
+            lost (list[int]): gram numbers in flight in ascending order
+        """
+        for gn in lost:
+            del delivery.inflight[gn]
+            delivery.retried.add(gn)
+        self.flights[delivery.dst] -= len(lost)
+        delivery.queue.extendleft(reversed(lost))
+
+
+    def _deliver(self, delivery, delivered):
+        """End delivery of sure memo and append its Outcome to .outcomes
+
+        Parameters:
+            delivery (Delivery): sure memo being sent
+            delivered (bool): True when all grams acked. False when failed
+        """
+        self.deliveries.pop(delivery.mid, None)
+        self.tymers.pop(delivery.mid, None)
+        if delivery.inflight:
+            self.flights[delivery.dst] -= len(delivery.inflight)
+            delivery.inflight.clear()
+        if not delivered:
+            logger.error("Memoer %s failed delivery of %s to %s.", self.name,
+                         delivery.mid, delivery.dst)
+        self.outcomes.append(Outcome(mid=delivery.mid, dst=delivery.dst,
+                                     memo=delivery.memo, delivered=delivered))
+
+
+    def _congestion(self, dst):
+        """Returns Congestion of dst from .congs made with initial window
+        .Cwnd when none
+
+        Parameters:
+            dst (str): destination address
+        """
+        cong = self.congs.get(dst)
+        if cong is None:
+            cong = self.congs[dst] = Congestion(cwnd=min(self.Cwnd, self.window))
+        return cong
+
+
+    def _grow(self, dst, count):
+        """Grow congestion window of dst on count newly acked grams by count
+        in slow start below ssthresh otherwise by count / cwnd (additive
+        increase). Never above .window.
+
+        Parameters:
+            dst (str): destination address
+            count (int): newly acked grams
+        """
+        cong = self._congestion(dst)
+        if cong.cwnd < cong.ssthresh:  # slow start
+            cong.cwnd += count
+        else:  # congestion avoidance
+            cong.cwnd += count / cong.cwnd
+        cong.cwnd = min(cong.cwnd, self.window)
+
+
+    def _shrink(self, dst, sent):
+        """Halve congestion window of dst on loss of gram sent at tyme sent
+        (multiplicative decrease). Losses of grams sent before the last
+        reduction are of the same window so do not reduce it again.
+
+        Parameters:
+            dst (str): destination address
+            sent (float): latest send tyme of lost grams
+        """
+        cong = self._congestion(dst)
+        if cong.recover is not None and sent <= cong.recover:
+            return
+        cong.ssthresh = max(cong.cwnd / 2, 2.0)
+        cong.cwnd = cong.ssthresh
+        cong.recover = self.tyme if self.tymth else sent
+
+
+    def _collapse(self, dst):
+        """Collapse congestion window of dst to one gram on retry tymeout
+        and restart slow start up to half the window.
+
+        Parameters:
+            dst (str): destination address
+        """
+        cong = self._congestion(dst)
+        cong.ssthresh = max(cong.cwnd / 2, 2.0)
+        cong.cwnd = 1.0
+        cong.recover = self.tyme if self.tymth else cong.recover
+
+
+    def _refill(self, dst, cong, tyme):
+        """Refill pacing tokens of Congestion cong of dst at tyme. Rate is
+        cwnd over smoothed round trip time capped by .rate. Tokens are capped
+        at the larger of .Burst and cwnd so an idle destination can not burst
+        more than a window. Unpaced, tokens are unlimited, until there is a
+        rate and a tyme.
+
+        Parameters:
+            dst (str): destination address
+            cong (Congestion): of dst
+            tyme (float or None): current tyme. None means no tymth
+        """
+        rtt = self.rtts.get(dst)
+        rate = cong.cwnd / rtt[0] if rtt and rtt[0] else math.inf
+        if self.rate is not None:
+            rate = min(rate, self.rate)
+        if tyme is None or rate == math.inf:  # unpaced
+            cong.tokens = math.inf
+        else:
+            elapsed = tyme - cong.tyme if cong.tyme is not None else 0.0
+            cong.tokens = min(cong.tokens + rate * elapsed,
+                              max(self.Burst, cong.cwnd))
+        cong.tyme = tyme
+
+
+    def _sample(self, dst, rtt):
+        """Update round trip estimate of dst with sample rtt as per RFC 6298
+
+        Parameters:
+            dst (str): destination address
+            rtt (float): round trip time sample in seconds
+        """
+        srtt, rttvar, rto = self.rtts.get(dst) or (None, None, None)
+        if srtt is None:  # first sample
+            srtt, rttvar = rtt, rtt / 2
+        else:
+            rttvar = 0.75 * rttvar + 0.25 * abs(srtt - rtt)
+            srtt = 0.875 * srtt + 0.125 * rtt
+        rto = min(max(srtt + 4 * rttvar, self.MinRto), self.MaxRto)
+        self.rtts[dst] = [srtt, rttvar, rto]
+
+
+    def _rto(self, dst):
+        """Returns retry tymeout for dst from its round trip estimate or
+        initial tymeout when none
+
+        Parameters:
+            dst (str): destination address
+        """
+        if (rtt := self.rtts.get(dst)) is not None:
+            return rtt[2]
+        return self.tymeout if self.tymeout else self.Rto
+
+
     def serviceAllRxOnce(self):
         """Service receive side of stack once (non-greedy)
         """
         self.serviceReceivesOnce()
         self.serviceRxGramsOnce()
+        self.serviceAcks()
         self.serviceRxMemosOnce()
 
 
@@ -1754,6 +2867,7 @@ class Memoer(Tymee):
         """
         self.serviceReceives()
         self.serviceRxGrams()
+        self.serviceAcks()
         self.serviceRxMemos()
 
 
@@ -1761,7 +2875,8 @@ class Memoer(Tymee):
         """Append (memo, dst, vid) tuple to .txms deque
 
         Parameters:
-            memo (str): to be segmented and packed into gram(s)
+            memo (str | bytes | mmap | BinaryIO): to be segmented and packed
+                into gram(s). See .rendStream.
             dst (str): address of remote destination of memo
             vid (str or None): verifier ID for verifying signature on grams
         """
@@ -1793,18 +2908,23 @@ class Memoer(Tymee):
         if hasattr(vid, "decode"):  # bytes
             vid = vid.decode()  # make str
 
-        if vid not in self.keep:
+        if (keyage := self.keep.get(vid)) is None:
             raise hioing.MemoerError(f"Invalid {vid=} for signing")
 
-        qvk, qss = self.keep[vid]
-        sigseed, code = self._decodeQSS(qss)  # raises MemoerError if problem
-        if code not in ('A'):
-            raise hioing.MemoerError(f"Invalid sigseed algorithm type {code=}")
+        cached = self._sigkeys.get(vid)
+        if cached is not None and cached[1] is keyage:  # not stale
+            sigkey = cached[0]
+        else:  # expand and cache
+            qvk, qss = keyage
+            sigseed, code = self._decodeQSS(qss)  # raises MemoerError if problem
+            if code not in ('A'):
+                raise hioing.MemoerError(f"Invalid sigseed algorithm type {code=}")
+            verkey, sigkey = pysodium.crypto_sign_seed_keypair(sigseed)
+            self._cache(self._sigkeys, vid, (sigkey, keyage))
 
         if hasattr(ser, "encode"):  # str
             ser = ser.encode()  # make bytes
 
-        verkey, sigkey = pysodium.crypto_sign_seed_keypair(sigseed)
         raw = pysodium.crypto_sign_detached(ser, sigkey)  # raw sig
         sig = self._encodeSGN(raw).encode()  # raise MemoerError if problem
 
@@ -1814,104 +2934,232 @@ class Memoer(Tymee):
         return sig
 
 
-    def rend(self, memo, vid=None):
+    def _template(self, code, curt):
+        """Returns header template tuple for rending grams with zeroth gram
+        code and header encoding curt. Templates are computed once per
+        (code, curt) and cached in ._templates.
+
+        Template tuple of form:
+            (zcodeb, ncodeb, znz, zvz, nvz, zoz, noz, zsz, nsz) where:
+            zcodeb is zeroth gram code bytes in qb64b or qb2 when curt,
+            ncodeb is non-zeroth gram code bytes in qb64b or qb2 when curt,
+            znz is neck size in chars or bytes when curt,
+            zvz is zeroth vid part size in chars or bytes when curt,
+            nvz is non-zeroth vid part size in chars,
+            zoz is zeroth gram overhead in chars or bytes when curt,
+            noz is non-zeroth gram overhead in chars used to size bodies,
+            zsz, nsz are zeroth and non-zeroth signature sizes in chars or
+                bytes when curt.
+
+        Parameters:
+            code (str): zeroth gram code
+            curt (bool): True means base2 header. False means base64 header.
+        """
+        template = self._templates.get((code, curt))
+        if template is not None:
+            return template
+
+        zbz, znz, zmz, zvz, zaz = self.Sizes[code]  # bz nz mz vz az
+        zoz =  zbz + znz + zmz + zvz + zaz  # overhead on zeroth gram
+        zsz = zaz - self.Roots.get(code, 0)  # signature part of auth part
+        ncode = self.Pairs[code]  # non-zeroth gram code
+        nbz, nnz, nmz, nvz, naz = self.Sizes[ncode] # bz nz mz vz az
+        noz =  nbz + nnz + nmz + nvz + naz  # overhead on non-zeroth grams
+        nsz = naz - self.Roots.get(ncode, 0)  # signature part of auth part
+        zcodeb = code.encode()  # make bytes
+        ncodeb = ncode.encode()  # make bytes
+
+        if curt:  # rend header parts in base2 instead of base64
+            # encoding b2 means head part sizes smaller by 3/4
+            znz = 3 * znz // 4
+            zvz = 3 * zvz // 4
+            zoz = 3 * zoz // 4
+            zsz = 3 * zsz // 4
+            nsz = 3 * nsz // 4
+            zcodeb = decodeB64(zcodeb)  # convert to base2 bytes
+            ncodeb = decodeB64(ncodeb)  # convert to base2 bytes
+
+        template = (zcodeb, ncodeb, znz, zvz, nvz, zoz, noz, zsz, nsz)
+        self._templates[(code, curt)] = template
+        return template
+
+
+    def rend(self, memo, vid=None, mid=None):
         """Partition memo into packed grams with headers.
 
         Returns:
             grams (list[bytes]): list of grams with headers.
 
         Parameters:
-            memo (str): to be partitioned into grams with headers
+            memo (str | bytes | bytearray | memoryview | mmap | BinaryIO): to be
+                partitioned into grams with headers. See .rendStream.
             vid (str or None): verifier ID when gram is to be signed, used to
                               lookup sigkey to sign.
                               None means not signable
+            mid (str or None): memo ID. None means make new one
+        """
+        return list(self.rendStream(memo, vid=vid, mid=mid))
 
-        Note zeroth gram assumes gram num is zero and neck is gram count whereas
-        non-zeroth gram uses neck for gram num.
+
+    def rendStream(self, memo, vid=None, mid=None):
+        """Returns lazy generator of packed grams with headers partitioned
+        from memo. See ._rendStream.
+
+        Returns:
+            grams (Generator[bytes]): grams with headers
+
+        Parameters:
+            memo (str | bytes | bytearray | memoryview | mmap | BinaryIO): to be
+                partitioned into grams with headers.
+            vid (str or None): verifier ID when gram is to be signed
+            mid (str or None): memo ID. None means make new one
         """
-        grams = []
-        memo = bytearray(memo.encode()) # convert and copy to bytearray
+        return self._rendStream(memo, vid=vid, mid=mid)[1]
 
-        zcode = self.code  # zeroth gram code
-        zbz, znz, zmz, zvz, zaz = self.Sizes[zcode]  # bz nz mz vz az
-        zoz =  zbz + znz + zmz + zvz + zaz  # overhead on zeroth gram
 
-        ncode = self.Pairs[zcode]  # non-zeroth gram code
-        nbz, nnz, nmz, nvz, naz = self.Sizes[ncode] # bz nz mz vz az
-        noz =  nbz + nnz + nmz + nvz + naz  # overhead on non-zeroth grams
+    def _rendStream(self, memo, vid=None, mid=None):
+        """Returns duple of form (count: int, grams: Generator) of gram count
+        and lazy generator of packed grams with headers partitioned
+        from memo. Headers are validated and sized now. Each gram is made only
+        when the generator is advanced so a huge memo is never held as grams.
 
+        Partitions in a single linear pass over a memoryview of the memo
+        without copying the remainder. Each gram is joined once at its final
+        size from its header parts and a zero copy slice of its body. Header
+        parts come from the cached template for .code and .curt.
+
+        A memo that is a binary file like object is read one gram body at a
+        time from its current position to its end so it is never loaded whole.
+        It must be seekable. When chained the bodies are first read once in
+        reverse to compute the signed root and the next link of each gram so
+        one 32 byte link per gram is held.
+
+        Returns:
+            result (tuple): duple of form (count: int, grams: Generator[bytes])
+                of gram count and grams with headers
+
+        Parameters:
+            memo (str | bytes | bytearray | memoryview | mmap | BinaryIO): to be
+                partitioned into grams with headers. A str is encoded as utf-8.
+                A bytes like object such as an mmap is sliced without copy.
+                Otherwise an object with .read is read as a seekable binary file.
+            vid (str or None): verifier ID when gram is to be signed, used to
+                              lookup sigkey to sign.
+                              None means not signable
+            mid (str or None): memo ID. None means make new one
+
+        Note zeroth gram assumes gram num is zero and neck is gram count whereas
+        non-zeroth gram uses neck for gram num.
+        """
+        (zcodeb, ncodeb, znz, zvz, nvz,
+                zoz, noz, zsz, nsz) = self._template(self.code, self.curt)
+
+        _, _, zmz, vz, _ = self.Sizes[self.code]  # bz nz mz vz az
         vid = vid if vid is not None else self.vid
-        if zvz and (not vid or len(vid) != zvz):
-            raise hioing.MemoerError(f"Missing or invalid {vid=} for {zvz=}")
+        if vz and (not vid or len(vid) != vz):
+            raise hioing.MemoerError(f"Missing or invalid {vid=} for {vz=}")
 
-        mid = self.makeMID()
+        mid = mid if mid is not None else self.makeMID()
         if len(mid) != zmz:
             raise hioing.MemoerError(f"Invalid {mid=} for {zmz=}")
 
-        zcodeb = zcode.encode()  # make bytes
-        ncodeb = ncode.encode()  # make bytes
         vidb = vid.encode() if vid else b''  # convert to bytes
         midb = mid.encode() # convert to bytes
-
         if self.curt:  # rend header parts in base2 instead of base64
-            # encoding b2 means head part sizes smaller by 3/4
-            zbz = 3 * zbz // 4
-            znz = 3 * znz // 4
-            zmz = 3 * zmz // 4
-            zvz = 3 * zvz // 4
-            zaz = 3 * zaz // 4
-            zoz = 3 * zoz // 4
-            zcodeb = decodeB64(zcodeb)  # convert to base2 bytes
-            ncodeb = decodeB64(ncodeb)  # convert to base2 bytes
             midb = decodeB64(midb)  # convert to base2 bytes
             vidb = decodeB64(vidb)  # convert to base2 bytes
 
+        if hasattr(memo, "encode"):  # str
+            memo = memo.encode()
+        try:
+            view = memoryview(memo).cast("B")  # zero copy slices of memo
+        except TypeError:  # not bytes like so binary file like
+            if not hasattr(memo, "read"):
+                raise hioing.MemoerError(f"Unsupported memo type {type(memo)}.")
+            read, ml = self._reader(memo)
+        else:
+            read = lambda i, n: view[i:i+n]
+            ml = len(view)
+
         # self.size is min-max gram size computed on zeroth gram
         zbz = (self.size - zoz)  # max zeroth gram body size >=1
         nbz = (self.size - noz)  # max non-zeroth gram body size >=1
-        ml = len(memo)
         gc = math.ceil((ml+nbz-zbz)/nbz)
         mms = min(self.MaxMemoSize, (nbz*(self.MaxGramCount-1) + zbz))  # max memo payload
         if ml > mms:
             raise hioing.MemoerError(f"Memo length={ml} exceeds max={mms}")
 
+        # neck is 3 bytes of int so its b64 is the b64 of its 3 bytes
+        kz = znz if self.curt else 3 * znz // 4  # neck size in bytes
         if self.curt:
-            gcnt = gc.to_bytes(znz)  # gcnt as b2 bytes
+            gcnt = gc.to_bytes(kz)  # gcnt as b2 bytes
         else:
-            gcnt = helping.intToB64b(gc, l=znz)  # gcnt as b64 bytes
+            gcnt = encodeB64(gc.to_bytes(kz))  # gcnt as b64 bytes
+
+        rootb = b''
+        links = None
+        if self.code in self.Roots:  # chained so sign root over non-zeroth bodies
+            links = [bytes(32)]  # next link of last gram
+            for i in reversed(range(zbz, ml, nbz)):
+                links.append(self._link(read(i, nbz), links[-1]))
+            links.reverse()  # links[gn] is next link of gram gn and root first
+            rootb = self._encodeDIG(links[0]).encode()
+            if self.curt:
+                rootb = decodeB64(rootb)  # convert to base2 bytes
+
+        def grams():
+            """Generator of grams. Each gram is joined once at its final size
+            from its parts."""
+            if not ml:  # empty memo has no grams
+                return
+
+            gram = b''.join((zcodeb, gcnt, midb, vidb if zvz else b'',
+                             read(0, zbz), rootb))
+            if zsz:  # signed gram, .sign returns proper sig format when .curt
+                gram += self.sign(vid, gram) # raises MemoerError if invalid
+            yield gram
+
+            nvidb = vidb if nvz else b''
+            for gn, i in enumerate(range(zbz, ml, nbz), start=1):
+                gnum = gn.to_bytes(kz)  # gnum as b2 bytes
+                if not self.curt:
+                    gnum = encodeB64(gnum)  # gnum as b64 bytes
+                gram = b''.join((ncodeb, gnum, midb, nvidb, read(i, nbz)))
+                if links is not None:  # chained so next link ends gram
+                    linkb = self._encodeDIG(links[gn]).encode()
+                    gram += decodeB64(linkb) if self.curt else linkb
+                if nsz:  # signed gram, .sign returns proper sig format when .curt
+                    gram += self.sign(vid, gram) # raises MemoerError if invalid
+                yield gram
+
+        return (gc if ml else 0, grams())
+
+
+    @staticmethod
+    def _reader(memo):
+        """Returns duple (read, ml) for seekable binary file like memo where
+        read(i, n) returns up to n bytes at offset i from the current position
+        of memo and ml is the number of bytes from the current position to end.
 
-        gn = 0
-        while memo:
+        Parameters:
+            memo (BinaryIO): seekable binary file like object
+        """
+        try:
+            start = memo.tell()
+            ml = memo.seek(0, 2) - start  # seek to end
+        except (AttributeError, OSError, ValueError) as ex:
+            raise hioing.MemoerError("Memo file not seekable.") from ex
 
-            if gn == 0:
-                head = zcodeb + gcnt + midb
-                if zvz:
-                    head += vidb
-                gram = head + memo[:zbz]  # copy slice past end just copies to end
-                del memo[:zbz]  # del slice past end just deletes to end
-                if zaz:  # signed gram, .sign returns proper sig format when .curt
-                    sig = self.sign(vid, gram) # raises MemoerError if invalid
-                    gram = gram + sig
+        def read(i, n):
+            n = min(n, ml - i)
+            if memo.tell() != start + i:
+                memo.seek(start + i)
+            data = memo.read(n)
+            if len(data) != n:
+                raise hioing.MemoerError(f"Short read of memo file at {i}.")
+            return data
 
-            else:
-                if self.curt:
-                    gnum = gn.to_bytes(znz)  # gnum as b2 bytes
-                else:
-                    gnum = helping.intToB64b(gn, l=znz)  # gnum as b64 bytes
-
-                head = ncodeb + gnum + midb
-                if nvz:
-                    head += vidb
-                gram = head + memo[:nbz]  # copy slice past end just copies to end
-                del memo[:nbz]  # del slice past end just deletes to end
-                if naz:  # signed gram, .sign returns proper sig format when .curt
-                    sig = self.sign(vid, gram) # raises MemoerError if invalid
-                    gram = gram + sig
-
-            grams.append(gram)
-            gn += 1
-
-        return grams
+        return read, ml
 
 
     def send(self, gram, dst, *, echoic=False) -> int:
@@ -1960,11 +3208,62 @@ class Memoer(Tymee):
         indicated.
 
         Appends (gram, dst) duple to .txgs deque.
-        """
-        memo, dst, vid = self.txms.popleft()  # raises IndexError if empty deque
 
-        for gram in self.rend(memo, vid):  # partition memo into gram parts with head
-            self.txgs.append((gram, dst))  # append duples (gram: bytes, dst: str)
+        When .hwm streams instead. Calls .rendStream for a lazy generator of the
+        grams of the memo kept in .txgen and appends its grams to .txgs only
+        while .txgs holds fewer than .hwm grams. The rest of the memo is
+        partitioned on later calls as sends drain .txgs. Raises IndexError when
+        nothing to stream and .txms is empty.
+
+        When .code is sure the lazy generator of the grams is kept in a
+        Delivery in .deliveries instead and its grams are pulled into .txgs by
+        ._serviceDeliveries as the window of the destination allows. Only the
+        zeroth gram is made now so signing errors raise here.
+
+        Returns:
+            done (bool): True means memo fully partitioned into .txgs.
+                False means blocked at .hwm with grams left in .txgen.
+        """
+        if self.code in self.Sudex:  # sure so keep grams until acked
+            memo, dst, vid = self.txms.popleft()  # raises IndexError if empty deque
+            mid = self.makeMID()
+            count, stream = self._rendStream(memo, vid, mid=mid)
+            ackvid = None
+            if self.code in self.Audex:  # signed so acks must be signed
+                ackvid = self.ackvids.get(dst, vid if vid is not None else self.vid)
+            delivery = Delivery(mid=mid, dst=dst, memo=memo, stream=stream,
+                                count=count, ackvid=ackvid)
+            if count:
+                delivery.grams[0] = next(stream)  # raises MemoerError if unsignable
+                delivery.rended = 1
+                delivery.queue.append(0)
+                if count == 1:  # exhausted
+                    delivery.stream = None
+                self.deliveries[mid] = delivery
+            else:  # empty memo has no grams to ack
+                self._deliver(delivery, True)
+            return True
+
+        if self.hwm is None:  # eager
+            memo, dst, vid = self.txms.popleft()  # raises IndexError if empty deque
+
+            for gram in self.rend(memo, vid):  # partition memo into gram parts with head
+                self.txgs.append((gram, dst))  # append duples (gram: bytes, dst: str)
+            return True
+
+        if self.txgen is None:  # start streaming next memo
+            memo, dst, vid = self.txms.popleft()  # raises IndexError if empty deque
+            self.txgen = (self.rendStream(memo, vid), dst)
+
+        grams, dst = self.txgen
+        while len(self.txgs) < self.hwm:
+            try:
+                gram = next(grams)
+            except StopIteration:
+                self.txgen = None
+                return True
+            self.txgs.append((gram, dst))
+        return False
 
 
     def serviceTxMemosOnce(self):
@@ -1975,13 +3274,61 @@ class Memoer(Tymee):
             self._serviceOneTxMemo()
         except IndexError:
             pass
+        if self.deliveries:
+            self._serviceDeliveries()
 
 
     def serviceTxMemos(self):
-        """Service all outgoing memos in .txms deque if any (greedy)
-        """
-        while self.txms:
-            self._serviceOneTxMemo()
+        """Service all outgoing memos in .txms deque if any (greedy). When .hwm
+        stops once .txgs is at its high water mark.
+        """
+        while self.txms or self.txgen is not None:
+            if not self._serviceOneTxMemo():
+                break  # backpressure resume when sends drain .txgs
+        if self.deliveries:
+            self._serviceDeliveries()
+
+
+    def _serviceDeliveries(self):
+        """Move grams of sure memos in .deliveries into .txgs while fewer than
+        the congestion window of their destination are in flight, its pacing
+        tokens last, and .txgs is below .hwm when .hwm. Queued resends go
+        first then new grams are pulled from the stream of the memo. Starts
+        the retry tymer of a memo once it has grams in flight.
+        """
+        tyme = self.tyme if self.tymth else None
+        refilled = set()
+        for mid, delivery in self.deliveries.items():
+            dst = delivery.dst
+            cong = self._congestion(dst)
+            if dst not in refilled:  # once per pass
+                self._refill(dst, cong, tyme)
+                refilled.add(dst)
+            limit = max(1, int(cong.cwnd))
+            flight = self.flights.get(dst, 0)
+            while (flight < limit and cong.tokens >= 1
+                    and (self.hwm is None or len(self.txgs) < self.hwm)):
+                if delivery.queue:
+                    gn = delivery.queue.popleft()
+                    if gn not in delivery.grams or gn in delivery.inflight:
+                        continue  # acked or resent meanwhile
+                elif delivery.rended < delivery.count:  # pull next new gram
+                    gn = delivery.rended
+                    delivery.grams[gn] = next(delivery.stream)
+                    delivery.rended += 1
+                    if delivery.rended == delivery.count:  # exhausted
+                        delivery.stream = None
+                else:
+                    break
+                self.txgs.append((delivery.grams[gn], dst))
+                delivery.inflight[gn] = (tyme if tyme is not None else 0.0,
+                                         gn not in delivery.retried)
+                cong.tokens -= 1
+                flight += 1
+            self.flights[dst] = flight
+            if delivery.inflight and mid not in self.tymers and self.tymth:
+                self.tymers[mid] = Tymer(tymth=self.tymth,
+                                         duration=self._rto(dst))
 
 
     def gramit(self, gram, dst):
@@ -2224,7 +3571,8 @@ class MemoerDoer(doing.Doer):
 
     def recur(self, tyme):
         """Run one service cycle for the peer."""
-        self.peer.service()
+        with self.trace("service", cat="transport"):
+            self.peer.service()
 
 
     def exit(self):
@@ -2308,6 +3656,69 @@ class AuthMemoer(Memoer):
         tymeout (float): default timeout for retry tymer(s) if any
         tymers (dict): keys are tid and values are Tymers for retry tymers for
                        each inflight tx
+        budget (Budget or None): bounds each greedy serviceReceives call by
+            count of grams, bytes, or microseconds so a flood can not starve
+            other doers. Remaining grams are received on the next call.
+            None means unbounded.
+        hwm (int or None): high water mark of grams in .txgs. When not None
+            memos are streamed lazily into .txgs only while it holds fewer
+            grams so sending throttles partitioning. None means each memo is
+            partitioned whole into .txgs.
+        txgen (tuple or None): duple of form (grams: Generator, dst: str) of
+            memo being streamed into .txgs when .hwm. None means none.
+        bytic (bool): True means fused rx memos in .rxms are bytes without
+            utf-8 decode such as binary CESR. False means str.
+        roots (dict): keyed by mid (memoID) that holds the raw root digest
+            from the verified zeroth chained gram for the memo. The root is
+            the link of gram 1.
+        chained (set): mids of partial memos with chained grams. Only grams
+            authenticated by their links are saved in .rxgs for these.
+        links (dict): keyed by mid of dicts of the raw authenticated link of
+            each chained gram not yet received keyed by gram number.
+        pends (dict): keyed by mid of dicts of lists of (body, link) duples
+            of chained grams received before their links were known keyed by
+            gram number. Pending bodies count against the caps.
+        readies (deque): mids of complete memos in .rxgs ready to be fused.
+            A mid is queued once when its last missing gram is received.
+        rxtymeout (float or None): seconds a partial memo may wait for its
+            missing grams before it is evicted. None means no timeout.
+            Tymers only run once .tymth is injected.
+        rxcap (int or None): max total bytes of bodies of partial memos.
+            Oldest partial memos are evicted first. None means unbounded.
+        srccap (int or None): max bytes of bodies of partial memos from any
+            one source so a flooding source only evicts its own oldest
+            partial memos. None means unbounded.
+        rxtymers (dict): reassembly Tymers keyed by mid of partial memos in
+            creation order.
+        rxloads (dict): keyed by src with value dict of bytes of bodies held
+            keyed by mid of partial memo from src in creation order.
+        rxsizes (dict): total bytes of bodies held keyed by src.
+        rxsize (int): total bytes of bodies of partial memos held.
+        stats (dict): counts of evicted partial memos keyed by reason
+            "rxtymeout", "rxcap", or "srccap".
+        window (int): max sure grams in flight per destination
+        retries (int): max consecutive retry tymer expiries without progress
+            before a sure memo fails
+        deliveries (dict): Delivery of each sure memo being sent keyed by mid
+        ackvids (dict): vid expected to sign the acks of each destination
+            keyed by dst when sure code is signed. Missing means the vid that
+            signed the memo.
+        flights (dict): count of sure grams in flight keyed by dst
+        rtts (dict): round trip estimate keyed by dst with value list of form
+            [srtt: float or None, rttvar: float or None, rto: float]
+        outcomes (deque): Outcome of each sure memo sent once delivered or
+            failed
+        rate (float or None): max pacing rate of sure grams per second per
+            destination. None means paced only by congestion window over
+            smoothed round trip time.
+        congs (dict): Congestion of each destination keyed by dst
+        acks (dict): src keyed by mid of sure memos to be acked on next pass
+        sacks (dict): keyed by mid of sure memos in .rxgs with value list of
+            form [cum: int, above: set] where cum is the cumulative gram number
+            and above holds the received gram numbers above cum
+        dones (dict): keyed by mid of recently fused sure memos with value
+            duple of form (gc: int, vid: str or None) so retransmits are
+            verified and acked again but not delivered twice
 
     Inherited Properties (Tymee)::
 
@@ -2452,7 +3863,8 @@ class AuthMemoerDoer(doing.Doer):
 
     def recur(self, tyme):
         """Run one service cycle for the peer."""
-        self.peer.service()
+        with self.trace("service", cat="transport"):
+            self.peer.service()
 
 
     def exit(self):
@@ -8,6 +8,7 @@ import sys
 import os
 import errno
 import platform
+import selectors
 from collections import deque
 
 
@@ -228,6 +229,9 @@ class ConsoleDoer(doing.Doer):
     Attributes:
        .console is serial Console instance
 
+    When injected .waker then watches its console except on Windows.
+    See doing.Waker
+
     """
 
     def __init__(self, console, **kwa):
@@ -256,15 +260,21 @@ class ConsoleDoer(doing.Doer):
         """
         # inject temp into file resources here if any
         result = self.console.reopen(temp=temp)
+        if (self.waker is not None and self.console.fd is not None
+                and platform.system() != 'Windows'):  # woken when receivable
+            self.waker.watch(self.console.fd, selectors.EVENT_READ, self)
 
 
     def recur(self, tyme):
         """"""
-        self.console.service()
+        with self.trace("service", cat="transport"):
+            self.console.service()
 
 
     def exit(self):
         """"""
+        if self.waker is not None and self.console.fd is not None:
+            self.waker.unwatch(self.console.fd)
         self.console.close()
 
 
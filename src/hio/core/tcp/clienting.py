@@ -7,6 +7,7 @@ import sys
 import os
 import errno
 import socket
+import selectors
 import ssl
 
 from contextlib import contextmanager
@@ -75,6 +76,7 @@ class Client(tyming.Tymee):
                  txbs=None,
                  rxbs=None,
                  wl=None,
+                 budget=None,
                  **kwa):
         """
         Initialization method for instance.
@@ -91,6 +93,7 @@ class Client(tyming.Tymee):
             txbs = bytearray of data to send
             rxbs = bytearray of data received
             wl = WireLog object if any
+            budget = Budget object if any that bounds serviceReceives
         """
         super(Client, self).__init__(**kwa)
         self.tymeout = tymeout if tymeout is not None else self.Tymeout
@@ -113,6 +116,7 @@ class Client(tyming.Tymee):
         self.txbs = txbs if txbs is not None else bytearray()  # byte array of data to send
         self.rxbs = rxbs if rxbs is not None else bytearray()  # byte array of data recieved
         self.wl = wl
+        self.budget = budget
 
 
     @property
@@ -400,13 +404,20 @@ class Client(tyming.Tymee):
 
     def serviceReceives(self):
         """
-        Service receives until no more
+        Service receives until no more or .budget if any is spent
         """
+        budget = self.budget
+        if budget is not None:
+            budget.start()
         while self.connected and not self.cutoff:
             data = self.receive()
             if not data:
                 break
             self.rxbs.extend(data)
+            if budget is not None and budget.spend(len(data)):
+                if coring.pending(self.cs):  # stopped with data left
+                    budget.stop()
+                break  # resume on next call
 
 
     def serviceReceiveOnce(self):
@@ -755,6 +766,11 @@ class ClientDoer(doing.Doer):
     Attributes:
        .client is TCP Client instance
 
+    When injected .waker then watches its connection socket. See doing.Waker
+
+    Hidden:
+        ._watched is socket watched with .waker if any
+
     """
 
     def __init__(self, client, **kwa):
@@ -766,6 +782,7 @@ class ClientDoer(doing.Doer):
         """
         super(ClientDoer, self).__init__(**kwa)
         self.client = client
+        self._watched = None
 
 
 
@@ -793,13 +810,37 @@ class ClientDoer(doing.Doer):
         if self.tymth:  # Doist or DoDoer winds is doers on enter
             self.client.wind(self.tymth)
         self.client.reopen()
+        self.watch()
 
 
     def recur(self, tyme):
         """"""
-        self.client.service()
+        with self.trace("service", cat="transport"):
+            self.client.service()
+        self.watch()
 
 
     def exit(self):
         """"""
+        if self.waker is not None and self._watched is not None:
+            self.waker.unwatch(self._watched)
+            self._watched = None
         self.client.close()
+
+
+    def watch(self):
+        """Watch connection socket for receives with .waker if any. Also watch
+        for sends when not yet connected or when transmits are pending.
+        """
+        if self.waker is None:
+            return
+        if self._watched is not None and self._watched is not self.client.cs:
+            self.waker.unwatch(self._watched)  # closed or replaced on reconnect
+            self._watched = None
+        if not self.client.cs:
+            return
+        events = selectors.EVENT_READ
+        if not self.client.connected or self.client.txbs:
+            events |= selectors.EVENT_WRITE
+        self.waker.watch(self.client.cs, events, self)
+        self._watched = self.client.cs
@@ -16,6 +16,7 @@ import sys
 import os
 import errno
 import socket
+import selectors
 import ssl
 from collections import deque
 from contextlib import contextmanager
@@ -220,6 +221,10 @@ class Server(Acceptor):
         tymeout (float): timeout in seconds for connection refresh
         wl (WireLog | None): WireLog instance if any
         ixes (dict): incoming connections indexed by remote (host, port) duple
+        budget (Budget | None): bounds each serviceReceivesAllIx call by count
+            of receptions, bytes, or microseconds across all ixes which are
+            serviced round robin one reception at a time. Next call resumes
+            after the last ix serviced. None means greedy per ix.
     """
 
     Tymeout = 1.0  # tymeout in seconds virtual tyme
@@ -230,6 +235,7 @@ class Server(Acceptor):
                  port=56000,
                  tymeout=None,
                  wl=None,
+                 budget=None,
                  **kwa):
         """
         Initialization method for instance.
@@ -240,12 +246,15 @@ class Server(Acceptor):
             port is default TCP/IP port
             tymeout is default tymeout for to pass to remoters for incoming connections
             wl is WireLog instance if any
+            budget is Budget instance if any that bounds serviceReceivesAllIx
         """
         ha = ha or (host, port)
         super(Server, self).__init__(ha=ha, **kwa)
         self.tymeout = tymeout if tymeout is not None else self.Tymeout
         self.wl = wl
         self.ixes = dict()  # ready to rx tx incoming connections, Remoter instances
+        self.budget = budget
+        self._turn = None  # ca of last ix serviced under budget
 
 
     def wind(self, tymth):
@@ -377,7 +386,14 @@ class Server(Acceptor):
     def serviceReceivesAllIx(self):
         """
         Service receives for all remoters in .ixes
+        When .budget then service round robin one reception per ix at a time
+        until all are empty or budget is spent. Next call resumes after the
+        last ix serviced so a flood on one ix can not starve the others.
         """
+        if self.budget is not None:
+            self._serviceReceivesAllIxBudget(self.budget)
+            return
+
         for ca, ix in list(self.ixes.items()):  # list so can remove while iterating
             try:
                 ix.serviceReceives()
@@ -386,6 +402,40 @@ class Server(Acceptor):
                 self.removeIx(ca=ca)  # also closes ix
 
 
+    def _serviceReceivesAllIxBudget(self, budget):
+        """
+        Service receives round robin for all remoters in .ixes until all are
+        empty or budget is spent starting after .ixes[._turn].
+
+        Parameters:
+            budget (Budget): budget of this call
+        """
+        budget.start()
+        cas = list(self.ixes.keys())
+        if self._turn in self.ixes:  # resume after last serviced
+            i = cas.index(self._turn) + 1
+            cas = cas[i:] + cas[:i]
+
+        while cas:
+            for ca in list(cas):  # list so can remove while iterating
+                ix = self.ixes[ca]
+                try:
+                    count = ix.serviceReceiveOnce()
+                except OSError as ex:
+                    logger.error("Closing incoming socket on %s.\n%s\n", ix.cs.getpeername(), ex)
+                    self.removeIx(ca=ca)  # also closes ix
+                    cas.remove(ca)
+                    continue
+                if not count:  # empty so done with ix this call
+                    cas.remove(ca)
+                    continue
+                self._turn = ca
+                if budget.spend(count):
+                    if any(coring.pending(self.ixes[ca].cs) for ca in cas):
+                        budget.stop()  # stopped with data left
+                    return  # resume after ._turn on next call
+
+
 
 
     def transmitIx(self, data, ca):
@@ -609,6 +659,7 @@ class Remoter(tyming.Tymee):
                  refreshable=True,
                  bs=8096,
                  wl=None,
+                 budget=None,
                  **kwa
                 ):
 
@@ -619,6 +670,7 @@ class Remoter(tyming.Tymee):
            cs is connection socket object. tymeout is tymeout for .tymer.
            refreshable True means tx/rx activity refreshes timer.
            bs is buffer size. wl is WireLog object if any.
+           budget is Budget object if any that bounds serviceReceives.
         """
         super(Remoter, self).__init__(**kwa)
         self.ha = ha  # connection address of server
@@ -634,6 +686,7 @@ class Remoter(tyming.Tymee):
         self.txbs = bytearray()  # bytearray of data to send
         self.rxbs = bytearray()  # bytearray of data received
         self.wl = wl
+        self.budget = budget
 
 
     def wind(self, tymth):
@@ -741,23 +794,33 @@ class Remoter(tyming.Tymee):
 
     def serviceReceives(self):
         """
-        Service receives until no more
+        Service receives until no more or .budget if any is spent
         """
+        budget = self.budget
+        if budget is not None:
+            budget.start()
         while not self.cutoff:
             data = self.receive()
             if not data:
                 break
             self.rxbs.extend(data)
+            if budget is not None and budget.spend(len(data)):
+                if coring.pending(self.cs):  # stopped with data left
+                    budget.stop()
+                break  # resume on next call
 
 
     def serviceReceiveOnce(self):
         '''
         Retrieve from server only one reception
+        Returns count of bytes received
         '''
         if not self.cutoff:
             data = self.receive()
             if data:
                 self.rxbs.extend(data)
+                return len(data)
+        return 0
 
 
     def clearRxbs(self):
@@ -1018,6 +1081,12 @@ class ServerDoer(doing.Doer):
 
     Properties:
 
+    When injected .waker then watches its listen and connection sockets.
+    See doing.Waker
+
+    Hidden:
+        ._watched is set of sockets watched with .waker
+
     """
 
     def __init__(self, server, **kwa):
@@ -1029,6 +1098,7 @@ class ServerDoer(doing.Doer):
         """
         super(ServerDoer, self).__init__(**kwa)
         self.server = server
+        self._watched = set()
 
 
     def wind(self, tymth):
@@ -1056,18 +1126,60 @@ class ServerDoer(doing.Doer):
         if self.tymth:
             self.server.wind(self.tymth)
         self.server.reopen(temp=temp)
+        self.watch()
 
 
     def recur(self, tyme):
         """"""
-        self.server.service()
+        with self.trace("service", cat="transport"):
+            self.server.service()
+        self.watch()
 
 
     def exit(self):
         """"""
+        self.unwatch()
         self.server.close()
 
 
+    def watch(self):
+        """Watch listen socket for accepts and connection sockets for receives
+        with .waker if any. Also watch for sends when transmits are pending or
+        when handshakes are in progress.
+        """
+        if self.waker is None:
+            return
+        watched = set()
+        if self.server.ss:
+            self.waker.watch(self.server.ss, selectors.EVENT_READ, self)
+            watched.add(self.server.ss)
+        for ix in self.server.ixes.values():
+            if not ix.cs:  # closed
+                continue
+            events = selectors.EVENT_READ
+            if ix.txbs:
+                events |= selectors.EVENT_WRITE
+            self.waker.watch(ix.cs, events, self)
+            watched.add(ix.cs)
+        for cx in getattr(self.server, "cxes", {}).values():  # tls handshakes
+            if not cx.cs:  # closed
+                continue
+            self.waker.watch(cx.cs, selectors.EVENT_READ | selectors.EVENT_WRITE, self)
+            watched.add(cx.cs)
+        for sock in self._watched - watched:  # removed or closed since
+            self.waker.unwatch(sock)
+        self._watched = watched
+
+
+    def unwatch(self):
+        """Unwatch listen socket and connection sockets with .waker if any."""
+        if self.waker is None:
+            return
+        for sock in self._watched:
+            self.waker.unwatch(sock)
+        self._watched = set()
+
+
 class EchoServerDoer(ServerDoer):
     """
     Echo TCP Server
@@ -1081,13 +1193,16 @@ class EchoServerDoer(ServerDoer):
     """
     def recur(self, tyme):
         """"""
-        self.server.service()
+        with self.trace("service", cat="transport"):
+            self.server.service()
         for ca, ix in self.server.ixes.items():
             if ix.rxbs:
                 ix.tx(bytes(ix.rxbs))  # echo back
                 ix.clearRxbs()
+        self.watch()
 
 
     def exit(self):
         """"""
+        self.unwatch()
         self.server.close()
@@ -18,6 +18,12 @@ class PeerMemoer(Peer, Memoer):
     """Class for sending memograms over UXD transport
     Mixin base classes Peer and Memoer to attain memogram over uxd transport.
 
+    Reliable delivery: with a sure gram code such as MemoDex.GramSureZero the
+    receiver selectively acks the grams of each memo and the sender keeps at
+    most .window grams in flight per destination and retransmits only lost
+    grams. Retry tymers need an injected tymth so use SafePeerMemoerDoer which
+    winds its peer. Each sure memo sent ends with an Outcome in .outcomes.
+
 
     Inherited Class Attributes:
         MaxGramSize (int): max gram bytes for this transport
@@ -84,6 +90,9 @@ class PeerMemoer(Peer, Memoer):
         tymeout (float): default timeout for retry tymer(s) if any
         tymers (dict): keys are tid and values are Tymers for retry tymers for
                        each inflight tx
+        deliveries (dict): Delivery of each sure memo being sent keyed by mid
+        outcomes (deque): Outcome of each sure memo sent once delivered or
+            failed
 
 
     Inherited Properties:
@@ -192,6 +201,8 @@ class PeerMemoerDoer(doing.Doer):
     Attributes:
        .peer (PeerMemoerDoer): underlying transport instance subclass of Memoer
 
+    When injected .waker then its peer watches its socket. See Memoer.watch
+
     """
 
     def __init__(self, peer, **kwa):
@@ -218,15 +229,19 @@ class PeerMemoerDoer(doing.Doer):
         """
         # inject temp into file resources here if any
         self.peer.reopen(temp=temp)
+        self.peer.watch(self.waker, self)
 
 
     def recur(self, tyme):
         """"""
-        self.peer.service()
+        with self.trace("service", cat="transport"):
+            self.peer.service()
+        self.peer.watch(self.waker, self)
 
 
     def exit(self):
         """"""
+        self.peer.unwatch(self.waker)
         self.peer.close()
 
 
@@ -240,6 +255,8 @@ class SafePeerMemoerDoer(doing.Doer):
     Attributes:
        .peer (PeerMemoerDoer): underlying transport instance subclass of Memoer
 
+    When injected .waker then its peer watches its socket. See Memoer.watch
+
     """
 
     def __init__(self, peer, **kwa):
@@ -276,13 +293,17 @@ class SafePeerMemoerDoer(doing.Doer):
             self.peer.wind(self.tymth)
         # inject temp into file resources here if any
         self.peer.reopen(temp=temp)
+        self.peer.watch(self.waker, self)
 
 
     def recur(self, tyme):
         """"""
-        self.peer.service()
+        with self.trace("service", cat="transport"):
+            self.peer.service()
+        self.peer.watch(self.waker, self)
 
 
     def exit(self):
         """"""
+        self.peer.unwatch(self.waker)
         self.peer.close()
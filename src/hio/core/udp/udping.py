@@ -7,6 +7,7 @@ import platform
 import os
 import errno
 import socket
+import selectors
 from contextlib import contextmanager
 
 from ... import hioing
@@ -242,6 +243,13 @@ class Peer(hioing.Mixin):
         return (data, sa)
 
 
+    def pending(self, **kwa):
+        """Returns True when a datagram is waiting to be received on .ls
+        without receiving it. See coring.pending
+        """
+        return coring.pending(self.ls)
+
+
     def send(self, data, dst, **kwa):
         """Perform non blocking send on  socket.
 
@@ -348,6 +356,8 @@ class PeerDoer(doing.Doer):
         """
         # inject temp into file resources here if any
         self.peer.reopen(temp=temp)
+        if self.waker is not None and self.peer.ls:  # woken when receivable
+            self.waker.watch(self.peer.ls, selectors.EVENT_READ, self)
 
 
     def recur(self, tyme):
@@ -359,4 +369,6 @@ class PeerDoer(doing.Doer):
 
     def exit(self):
         """Close peer resources."""
+        if self.waker is not None and self.peer.ls:
+            self.waker.unwatch(self.peer.ls)
         self.peer.close()
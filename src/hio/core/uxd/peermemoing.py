@@ -108,6 +108,8 @@ class PeerMemoerDoer(doing.Doer):
     Attributes:
        .peer (PeerMemoerDoer): underlying transport instance subclass of Memoer
 
+    When injected .waker then its peer watches its socket. See Memoer.watch
+
     """
 
     def __init__(self, peer, **kwa):
@@ -134,13 +136,17 @@ class PeerMemoerDoer(doing.Doer):
         """
         # inject temp into file resources here if any
         self.peer.reopen(temp=temp)
+        self.peer.watch(self.waker, self)
 
 
     def recur(self, tyme):
         """"""
-        self.peer.service()
+        with self.trace("service", cat="transport"):
+            self.peer.service()
+        self.peer.watch(self.waker, self)
 
 
     def exit(self):
         """"""
+        self.peer.unwatch(self.waker)
         self.peer.close(clear=True)
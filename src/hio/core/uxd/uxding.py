@@ -8,6 +8,7 @@ import os
 import stat
 import errno
 import socket
+import selectors
 import tempfile
 import shutil
 from contextlib import contextmanager
@@ -15,6 +16,7 @@ from contextlib import contextmanager
 
 from ... import help
 from ... import hioing
+from .. import coring
 from ...base import doing, filing
 
 logger = help.ogler.getLogger()
@@ -290,6 +292,13 @@ class Peer(filing.Filer):
         return (data, src)
 
 
+    def pending(self, **kwa):
+        """Returns True when a datagram is waiting to be received on .ls
+        without receiving it. See coring.pending
+        """
+        return coring.pending(self.ls)
+
+
     def send(self, data, dst, **kwa):
         """Perform non blocking send on socket.
 
@@ -418,6 +427,8 @@ class PeerDoer(doing.Doer):
         """
         # inject temp into file resources here if any
         self.peer.reopen(temp=temp)
+        if self.waker is not None and self.peer.ls:  # woken when receivable
+            self.waker.watch(self.peer.ls, selectors.EVENT_READ, self)
 
 
     def recur(self, tyme):
@@ -427,4 +438,6 @@ class PeerDoer(doing.Doer):
 
     def exit(self):
         """"""
+        if self.waker is not None and self.peer.ls:
+            self.waker.unwatch(self.peer.ls)
         self.peer.close(clear=True)
@@ -18,8 +18,8 @@ from .helping import isNonStringIterable, isNonStringSequence, isIterator, Reat
 from .helping import NonStringIterable, NonStringSequence
 from .decking import Deck
 from .hicting import Hict, Mict
-from .timing import (Timer, MonoTimer, TimerError, RetroTimerError,
-                     nowIso8601, toIso8601, fromIso8601)
+from .timing import (Timer, MonoTimer, NanoTimer, Budget, TimerError,
+                     RetroTimerError, nowIso8601, toIso8601, fromIso8601)
 
 from .naming import Namer
 from .doming import (MapDom, IceMapDom, modify, modize, RawDom, IceRawDom,
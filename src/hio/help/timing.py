@@ -188,6 +188,139 @@ class MonoTimer(Timer):
         return self._last
 
 
+class NanoTimer(Timer):
+    """Class to manage real elapsed time using the monotonic clock in integer
+    nanoseconds. Start and stop are absolute integer deadlines on
+    time.monotonic_ns so lossless restarts never accumulate float error and
+    the clock is never retrograded. Supports precise waits that sleep until
+    a short final slice before the deadline and then busy spin to it.
+
+    Attributes:
+        ._begin is int start time in nanoseconds of time.monotonic_ns
+        ._end is int stop time in nanoseconds of time.monotonic_ns
+
+    Properties:
+        .duration is float time duration in seconds of timer from start to stop
+        .elaspsed is float time elasped in seconds since start
+        .remaining is float time remaining in seconds until stop
+        .expired is boolean True if expired, False otherwise, i.e. time >= stop
+        .latest is float latest measured time in seconds of monotonic clock
+        .deadline is int stop time in nanoseconds of monotonic clock
+
+    Methods:
+        - start: start timer at current time and return start time
+        - restart: restart timer at last stop with no time lost, returns start time
+        - wait: sleep then spin until expired and return lateness
+    """
+
+    def __init__(self, duration=0.0, start=None, **kwa):
+        """Initialization method for instance.
+        Parameters:
+            duration is float duration of timer in seconds (fractional)
+            start is float optional start time in seconds of monotonic clock
+               allows starting before or after current time
+        """
+        self._begin = time.monotonic_ns()
+        self._end = self._begin + round(float(duration) * 1e9)
+        self.start(duration=duration, start=start)
+
+
+    @property
+    def duration(self):
+        """duration property getter, float seconds from start to stop
+        """
+        return (self._end - self._begin) / 1e9
+
+
+    @property
+    def elapsed(self):
+        """elapsed time property getter,
+        Returns elapsed time in seconds (fractional) since start.
+        """
+        return (time.monotonic_ns() - self._begin) / 1e9
+
+
+    @property
+    def remaining(self):
+        """remaining time property getter,
+        Returns remaining time in seconds (fractional) before stop.
+        """
+        return (self._end - time.monotonic_ns()) / 1e9
+
+
+    @property
+    def expired(self):
+        """Returns True if timer has expired, False otherwise.
+        time.monotonic_ns() >= stop
+        """
+        return (time.monotonic_ns() >= self._end)
+
+
+    @property
+    def latest(self):
+        """latest measured time property getter,
+        Returns latest measured time in seconds of monotonic clock.
+        """
+        return time.monotonic_ns() / 1e9
+
+
+    @property
+    def deadline(self):
+        """deadline property getter,
+        Returns int stop time in nanoseconds of monotonic clock.
+        """
+        return self._end
+
+
+    def start(self, duration=None, start=None):
+        """Starts Timer of duration secs at start time start secs of monotonic
+        clock. If duration not provided then uses current duration.
+        If start not provided then starts at current time.
+        Returns float start time in seconds.
+        """
+        span = (round(float(duration) * 1e9) if duration is not None
+                else self._end - self._begin)
+        self._begin = (round(float(start) * 1e9) if start is not None
+                       else time.monotonic_ns())
+        self._end = self._begin + span
+        return self._begin / 1e9
+
+
+    def restart(self, duration=None):
+        """Lossless restart of Timer at start = stop for duration if provided,
+        Otherwise current duration. Exact in integer nanoseconds.
+        Returns float start time in seconds.
+        """
+        span = (round(float(duration) * 1e9) if duration is not None
+                else self._end - self._begin)
+        self._begin = self._end
+        self._end = self._begin + span
+        return self._begin / 1e9
+
+
+    def wait(self, spin=0.0):
+        """Wait until timer expires. Sleeps in time.sleep until spin seconds
+        before the stop deadline and then busy spins on time.monotonic_ns
+        until the deadline so sleep wakeup jitter does not make it late.
+        Each sleep is recomputed from the absolute deadline so an early or
+        interrupted sleep loses no time.
+
+        Returns:
+            late (float): seconds past the stop deadline when wait ended
+
+        Parameters:
+            spin (float): seconds of final slice to busy spin. Zero means
+                sleep only.
+        """
+        end = self._end
+        lead = round(float(spin) * 1e9)
+        while (left := end - time.monotonic_ns()) > lead:
+            time.sleep((left - lead) / 1e9)
+        while (now := time.monotonic_ns()) < end:
+            pass  # busy spin final slice
+        return (now - end) / 1e9
+
+
 class AsyncTimer(Timer):
     """Class to manage real elaspsed time using asyncio event loop time.
     Namely asyncio.get_event_loop().time()
@@ -274,6 +407,100 @@ class AsyncTimer(Timer):
         return self.start(duration=duration, start=self._stop)
 
 
+class Budget(hioing.Mixin):
+    """Class to bound one call of a greedy service loop such as a transport
+    serviceReceives by a maximum count of items, bytes, or microseconds so a
+    flood on one transport can not blow the tick and starve other doers.
+    Any limit of None is unbounded. The loop calls .start on entry, .spend
+    after each item, and stops when .spent. When it stops with work still
+    pending it calls .stop to count the stop. Whatever is left is serviced on
+    the next call i.e. the next tick.
+
+    Attributes:
+        .items is int max count of items per call or None
+        .size is int max count of bytes per call or None
+        .micros is float max microseconds per call or None
+        .count is int count of items spent since start
+        .total is int count of bytes spent since start
+        .stops is int count of calls stopped by the budget with work left
+        ._begin is int start time in nanoseconds of time.perf_counter_ns
+
+    Properties:
+        .elapsed is float microseconds elapsed since start
+        .spent is boolean True when any limit reached, False otherwise
+
+    Methods:
+        - start: start budget of new call
+        - spend: spend item of size bytes and return True when spent
+        - stop: count call stopped by the budget with work left
+    """
+
+    def __init__(self, items=None, size=None, micros=None, **kwa):
+        """Initialization method for instance.
+        Parameters:
+            items is int max count of items per call or None means unbounded
+            size is int max count of bytes per call or None means unbounded
+            micros is float max microseconds per call or None means unbounded
+        """
+        super(Budget, self).__init__(**kwa)  # Mixin for Mult-inheritance MRO
+        self.items = items
+        self.size = size
+        self.micros = micros
+        self.stops = 0
+        self.start()
+
+
+    def __repr__(self):
+        return (f"Budget(items={self.items}, size={self.size}, "
+                f"micros={self.micros})")
+
+
+    @property
+    def elapsed(self):
+        """elapsed property getter
+        .elapsed is float microseconds elapsed since start
+        """
+        return (time.perf_counter_ns() - self._begin) / 1e3
+
+
+    @property
+    def spent(self):
+        """spent property getter
+        .spent is True when any limit is reached, False otherwise
+        """
+        return ((self.items is not None and self.count >= self.items) or
+                (self.size is not None and self.total >= self.size) or
+                (self.micros is not None and self.elapsed >= self.micros))
+
+
+    def start(self):
+        """Start budget of new service call. Resets spent counts and time."""
+        self.count = 0
+        self.total = 0
+        self._begin = time.perf_counter_ns()
+
+
+    def spend(self, size=0, items=1):
+        """Spend items of size bytes. Returns True when spent so caller should
+        stop and resume on its next call.
+
+        Parameters:
+            size is int count of bytes of items
+            items is int count of items
+        """
+        self.count += items
+        self.total += size
+        return self.spent
+
+
+    def stop(self):
+        """Count call stopped by the budget in .stops. Caller calls .stop only
+        when it stops with work still pending so a budget that is spent on the
+        last item does not count as a stop.
+        """
+        self.stops += 1
+
+
 # datetime utilities
 def nowUTC():
     """Returns timezone aware datetime of current UTC time
@@ -12,7 +12,7 @@ import os
 from inspect import isgeneratorfunction
 
 from hio import hioing
-from hio.base import Tymist, Doist
+from hio.base import Tymist, Doist, Tracer
 from hio.base.hier import (Hold, Nabes, Rexcnt, Rexlps, Rexrlp, Bag, Can,
                            Box, Boxer, BoxerDoer, Boxery,
                            ActBase, Act, EndAct,
@@ -673,6 +673,41 @@ def test_boxer_run_on_update():
     """Done Test"""
 
 
+def test_boxer_doer_trace():
+    """Test BoxerDoer traces boxer nabe phases with injected Tracer"""
+
+    def fun(H, bx, go, do, on, at, be, *pa):
+        bx(name='top')
+        go('done', on("lapse >= 2.0"))
+        bx(name='done', over=None)
+        do('end')
+
+    tock = 1.0
+    tracer = Tracer()
+    doist = Doist(tock=tock, temp=True, tracer=tracer)
+    boxer = Boxer(fun=fun)
+    assert boxer.tracer is None
+    doer = BoxerDoer(boxer=boxer, tock=tock)
+    doist.do(doers=[doer], limit=10.0)
+    assert doist.tyme == 4.0
+    assert boxer.tracer is tracer
+
+    nabes = [event for event in tracer.events if event["cat"] == "nabe"]
+    names = [event["name"] for event in nabes]
+    assert names[:3] == ['boxer.predo', 'boxer.rendo', 'boxer.endo']
+    assert {'boxer.redo', 'boxer.afdo', 'boxer.godo', 'boxer.exdo',
+            'boxer.rexdo'} <= set(names)
+    redo = nabes[3]
+    assert redo["name"] == 'boxer.redo'
+    assert redo["args"] == dict(box='top')
+
+    deeds = [event for event in tracer.events if event["cat"] == "deed"]
+    assert deeds[0]["name"] == "BoxerDoer"
+    start, stop = deeds[0]["ts"], deeds[0]["ts"] + deeds[0]["dur"]
+    assert start <= redo["ts"] and redo["ts"] + redo["dur"] <= stop  # nested
+    """Done Test"""
+
+
 def test_boxer_run_on_change():
     """Test make method of Boxer with on verb special need change
     """
@@ -658,6 +658,37 @@ def test_dodoer():
 
     """End Test """
 
+def test_dodoer_heap():
+    """
+    Test DoDoer class with heap scheduled deeds nested in Doist
+    """
+    with pytest.raises(TypeError):
+        doing.DoDoer(heap=True).deeds = doing.deque()
+
+    states = []
+    for heap in (False, True):
+        doist = doing.Doist(tock=0.03125)
+        doer0 = doing.ExDoer(tock=0.0)
+        doer1 = doing.ExDoer(tock=0.0625)
+        doer2 = doing.ExDoer(tock=0.125)
+        dodoer = doing.DoDoer(doers=[doer0, doer1, doer2], heap=heap)
+        assert dodoer.heap == heap
+        assert isinstance(dodoer.deeds, list if heap else doing.deque)
+        doist.do(doers=[dodoer], limit=0.375)
+        assert doist.tyme == 0.375
+        assert dodoer.done == False  # forced close by limit
+        assert doer0.done == doer1.done == True
+        assert doer2.done == False
+        assert not dodoer.deeds
+        states.append([doer0.states, doer1.states, doer2.states])
+
+    assert states[0] == states[1]
+    assert states[1][2][-2:] == [State(tyme=0.375, context='cease', feed=None, count=4),
+                                 State(tyme=0.375, context='exit', feed=None, count=5)]
+
+    """End Test """
+
+
 def test_dodoer_always():
     """
     Test DoDoer class with tryDoer and always
@@ -1089,6 +1120,61 @@ def test_dodoer_remove_own_doer():
     """Done Test"""
 
 
+def test_dodoer_remove_bulk():
+    """
+    Test .remove of many doers keeps .doers a list in order in one pass
+    """
+    doers = [TryDoer(stop=1) for i in range(1000)]
+    dodoer = doing.DoDoer(doers=list(doers))
+    dodoer.deeds = dodoer.enter()  # enter all doers so remove closes them
+    dodoer.remove(doers[::2])
+    assert type(dodoer.doers) is list
+    assert dodoer.doers == doers[1::2]
+    assert list(dodoer._dogs) == doers[1::2]
+    dodoer.exit()
+
+    doer = TryDoer(stop=1)
+    doist = doing.Doist(doers=[doer, doers[0], doer])  # duplicates kept
+    assert len(doist.doers) == 3
+    doist.remove([doer, doers[1]])  # first instance only and not listed
+    assert doist.doers == [doers[0], doer]
+    """Done Test """
+
+
+def test_dodoer_spawn():
+    """
+    Test .spawn and lazily tombstoned .remove of DoDoer
+    """
+    tock = 1.0
+    dodoer = doing.DoDoer(tock=tock, always=True)
+    doist = doing.Doist(tock=tock, limit=5.0, doers=[dodoer])
+    doist.enter()
+    assert dodoer.spawn([]) == []
+
+    doers = dodoer.spawn(TryDoer(stop=3) for i in range(4))
+    assert dodoer.doers == doers
+    assert len(dodoer.deeds) == 4
+    assert dodoer.spawn(doers) == []  # already spawned
+
+    dodoer.remove([doers[1]])  # tombstoned
+    assert dodoer.doers == [doers[0], doers[2], doers[3]]
+    assert len(dodoer.deeds) == 4
+    assert doers[1].states[-1].context == 'exit'
+    doist.recur()  # purged when it comes up to run
+    assert len(dodoer.deeds) == 3
+    assert len(doers[1].states) == 3  # enter cease exit
+
+    doist.recur()
+    doist.recur()
+    doist.recur()
+    assert not dodoer.deeds
+    assert doers[0].done == doers[2].done == doers[3].done == True
+    assert doers[1].done == False  # forced exit
+    assert dodoer.done  # all its doers completed
+    assert doist.deeds  # but keeps running since always
+    """Done Test"""
+
+
 def test_exDo():
     """
     Test exDo generator function non-class based
@@ -1628,6 +1714,69 @@ def test_decoration():
     """Done Test"""
 
 
+def test_offload():
+    """Test offload of blocking calls to thread pool"""
+    import time
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    def block(secs, value):
+        time.sleep(secs)
+        return value
+
+    def fail():
+        raise ValueError("Bad call")
+
+    results = []
+    tymes = []
+
+    def offloadDo(tymth=None, tock=0.0, **opts):
+        tyme = yield tock  # enter
+        tymes.append(tyme)
+        results.append((yield from doing.offload(block, 0.05, value="done")))
+        try:
+            yield from doing.offload(fail)
+        except ValueError as ex:
+            results.append(str(ex))
+        return True
+
+    def tickDo(tymth=None, tock=0.0, **opts):
+        """Runs every tock while offload blocks"""
+        while True:
+            tymes.append((yield tock))
+
+    tock = 0.03125
+    doist = doing.Doist(tock=tock, limit=0.25, real=True)
+    ticker = doing.doify(tickDo, tock=tock)
+    offloader = doing.doify(offloadDo)
+    doist.do(doers=[offloader, ticker])
+    assert results == ["done", "Bad call"]
+    assert offloader.done
+    assert len(tymes) > 3  # loop kept running while blocking call ran
+    assert doing.threadPool() is doing.threadPool()  # shared
+
+    # closing doer while waiting cancels call not yet started
+    executor = ThreadPoolExecutor(max_workers=1)
+    event = threading.Event()
+    busy = executor.submit(event.wait)  # occupies only worker
+    ran = []
+
+    def waitDo(tymth=None, tock=0.0, **opts):
+        tyme = yield tock
+        yield from doing.offload(ran.append, True, executor=executor)
+        return True
+
+    doist = doing.Doist(tock=tock, limit=tock * 4)
+    waiter = doing.doify(waitDo)
+    doist.do(doers=[waiter])
+    assert not waiter.done  # closed by limit
+    event.set()
+    executor.shutdown(wait=True)
+    assert busy.result() is True
+    assert ran == []  # cancelled before it started
+    """Done Test"""
+
+
 if __name__ == "__main__":
     test_generator_play()
     test_deed()
@@ -1642,6 +1791,8 @@ if __name__ == "__main__":
     test_dodoer_remove()
     test_dodoer_remove_by_own_doer()
     test_dodoer_remove_own_doer()
+    test_dodoer_remove_bulk()
+    test_dodoer_spawn()
     test_exDo()
     test_trydoer_break()
     test_trydoer_close()
@@ -1649,3 +1800,4 @@ if __name__ == "__main__":
     test_trydo_break()
     test_trydo_close()
     test_trydo_throw()
+    test_offload()
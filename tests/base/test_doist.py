@@ -4,6 +4,9 @@ tests.base.test_doist module
 
 """
 import platform
+import socket
+import selectors
+import threading
 import inspect
 import asyncio
 from datetime import datetime
@@ -975,6 +978,556 @@ def test_nested_doers():
     """Done Test """
 
 
+def test_doist_heap():
+    """
+    Test Doist with heap scheduled deeds matches round robin deque deeds
+    """
+    tock = 0.25
+    doist = doing.Doist(tock=tock, heap=True)
+    assert doist.heap == True
+    assert doist.deeds == []
+
+    doer0 = doing.ExDoer(tock=0.25, tymth=doist.tymen())
+    doer1 = doing.ExDoer(tock=0.5, tymth=doist.tymen())
+    doers = [doer0, doer1]
+
+    doist.doers = doers
+    doist.enter()
+    assert len(doist.deeds) == 2
+    assert [deed[0] for deed in doist.deeds] == [0.0, 0.0]  # retymes
+    assert [deed[1] for deed in doist.deeds] == [0, 1]  # insertion order
+
+    doist.recur()
+    assert doist.tyme == 0.25
+    assert sorted(deed[0] for deed in doist.deeds) == [0.25, 0.5]
+    assert doist.deeds[0][3] is doer0  # earliest retyme at top of heap
+    doist.recur()
+    doist.recur()
+    doist.recur()
+    assert doist.tyme == 1.0
+    assert len(doist.deeds) == 1
+    assert doist.deeds[0][3] is doer1
+    assert doer0.done == True
+    assert doer0.states[-1] == State(tyme=0.75, context='exit', feed=None, count=5)
+    assert doer1.states == [State(tyme=0.0, context='enter', feed=0.0, count=0),
+                            State(tyme=0.0, context='recur', feed=0.0, count=1),
+                            State(tyme=0.5, context='recur', feed=0.5, count=2)]
+    doist.exit()
+    assert not doist.deeds
+    assert doer1.done == False
+    assert doer1.states[-1] == State(tyme=1.0, context='exit', feed=None, count=4)
+
+    # run order of ready deeds matches deque including unaligned tocks
+    def logDo(tymth, tock=0.0, log=None, label="", stop=6, **opts):
+        count = 0
+        while count < stop:
+            tyme = yield tock
+            count += 1
+            log.append((tyme, label))
+        return True
+
+    logs = []
+    for heap in (False, True):
+        log = []
+        doers = [doing.doify(logDo, name=label, tock=dtock, log=log, label=label)
+                 for label, dtock in (("a", 0.3), ("b", 0.0), ("c", 0.5),
+                                      ("d", 0.25), ("e", 0.1))]
+        doist = doing.Doist(tock=tock, heap=heap)
+        doist.do(doers=doers, limit=4.0)
+        assert all(doer.done for doer in doers)
+        logs.append(log)
+
+    assert logs[0] == logs[1]
+    assert logs[1][:7] == [(0.0, 'a'), (0.0, 'b'), (0.0, 'c'), (0.0, 'd'),
+                           (0.0, 'e'), (0.25, 'b'), (0.25, 'd')]
+    assert (0.5, 'a') in logs[1] and logs[1].index((0.5, 'a')) < logs[1].index((0.5, 'b'))
+
+    # extend and remove with heap
+    doer0 = TryDoer(stop=3)
+    doer1 = TryDoer(stop=3)
+    doer2 = TryDoer(stop=3)
+    doist = doing.Doist(tock=1.0, heap=True, doers=[doer0, doer1])
+    doist.enter()
+    doist.recur()
+    doist.extend(doers=[doer2])
+    assert doist.doers == [doer0, doer1, doer2]
+    assert [deed[1] for deed in sorted(doist.deeds, key=lambda d: d[1])] == [0, 1, 2]
+    doist.remove(doers=[doer1])
+    assert doist.doers == [doer0, doer2]
+    assert doer1.done == False  # forced exit
+    assert doer1.states[-1].context == 'exit'
+    doist.recur()  # tombstoned deed of doer1 purged lazily when ready
+    assert [deed[3] for deed in sorted(doist.deeds, key=lambda d: d[1])] == [doer0, doer2]
+    doist.recur()
+    doist.recur()
+    assert doist.tyme == 4.0
+    assert len(doist.deeds) == 1  # doer2 added one pass later
+    assert doer0.done == True
+    doist.recur()
+    assert not doist.deeds
+    assert doer2.done == True
+
+    """Done Test """
+
+
+def test_doist_heap_remove_ready():
+    """
+    Test Doist with heap where doer removes other doers ready in same pass
+    """
+    doist = doing.Doist(tock=1.0, heap=True)
+
+    @doing.doize(tock=0.0, doist=doist)
+    def removeDo(tymth=None, tock=0.0, doist=None, **opts):
+        yield  # enter context
+        doist.remove([doer for doer in doist.doers if doer != removeDo])
+        yield
+        return True
+
+    doer0 = TryDoer(stop=3)
+    doer1 = TryDoer(stop=3)
+    doist.doers = [removeDo, doer0, doer1]  # others ready after removeDo
+    doist.enter()
+    doist.recur()
+    assert doist.doers == [removeDo]
+    assert len(doist.deeds) == 1
+    assert doer0.done == doer1.done == False  # forced exit before running
+    assert doer0.states[-1].context == doer1.states[-1].context == 'exit'
+    assert [state.context for state in doer0.states] == ['enter', 'cease', 'exit']
+    doist.recur()
+    assert not doist.deeds
+    assert removeDo.done
+
+    """Done Test """
+
+
+def test_doist_heap_woken():
+    """
+    Test Doist with heap runs woken deeds from copies without rebuilding heap
+    """
+    doist = doing.Doist(tock=1.0, heap=True, select=True)
+    doer0 = TryDoer(stop=2, tock=100.0)
+    doer1 = TryDoer(stop=3, tock=100.0)
+    doist.doers = [doer0, doer1]
+    doist.enter()
+    doist.recur()  # first recur of each
+    heap = list(doist.deeds)
+    doist.waker.wake(doer0)
+    heapify = doing.heapq.heapify
+    try:
+        doing.heapq.heapify = None  # woken deeds must not rebuild heap
+        doist.recur()
+        assert doist.deeds == heap  # heap deeds stay put with their retymes
+        assert doer0.states[-1].context == 'recur'
+        assert doer1.states[-1].context == 'recur'
+        assert len(doer0.states) == len(doer1.states) + 1  # only doer0 ran
+        doist.waker.wake(doer0)
+        doist.recur()  # doer0 completes so its heap deed is tombstoned
+        assert doer0.done == True
+        assert doist.deeds == heap
+        assert doist._tombs == set([heap[0][2]])
+    finally:
+        doing.heapq.heapify = heapify
+    doist.remove([doer1])  # only tombs left so purged at once
+    assert not doist.deeds
+    assert not doist._tombs
+
+    """Done Test """
+
+
+def test_doist_spawn():
+    """
+    Test Doist.spawn bulk spawn and .remove with lazily tombstoned deeds
+    """
+    for heap in (False, True):
+        doist = doing.Doist(tock=1.0, heap=heap)
+        doist.enter()
+        doers = doist.spawn(TryDoer(stop=3) for i in range(8))  # generator
+        assert len(doers) == 8
+        assert doist.doers == doers
+        assert len(doist.deeds) == 8
+        assert doist.spawn(doers[:2]) == []  # already spawned so skipped
+        assert doist.doers == doers
+
+        doist.recur()
+        doist.remove(doers[:3])  # fewer than half so tombstoned lazily
+        assert doist.doers == doers[3:]
+        assert len(doist.deeds) == 8
+        assert len(doist._tombs) == 3
+        for doer in doers[:3]:
+            assert doer.done == False  # forced exit at once
+            assert doer.states[-1].context == 'exit'
+        doist.recur()  # tombstoned deeds purged when they come up to run
+        assert len(doist.deeds) == 5
+        assert not doist._tombs
+        assert [len(doer.states) for doer in doers[:3]] == [4, 4, 4]  # not run
+
+        doist.remove(doers[3:6])  # half or more so purged at once
+        assert doist.doers == doers[6:]
+        assert len(doist.deeds) == 2
+        assert not doist._tombs
+
+        doist.remove([doers[0], TryDoer()])  # not registered so ignored
+        assert doist.doers == doers[6:]
+
+        doist.recur()
+        doist.recur()
+        assert not doist.deeds
+        assert doers[6].done == doers[7].done == True
+        doist.remove([doers[6]])  # complete so only removed from .doers
+        assert doist.doers == [doers[7]]
+        doist.exit()
+        assert not doist._dogs
+
+    # done once live deeds complete though tombstones of removed deeds remain
+    for heap in (False, True):
+        a = TryDoer(stop=3, tock=1.0)
+        b = TryDoer(stop=3, tock=1.0)
+        c = TryDoer(stop=3, tock=100.0)
+
+        def removeDo(tymth=None, tock=0.0, doist=None, **opts):
+            yield tock
+            doist.remove([c])  # tombstoned since fewer than half of deeds
+            return True
+
+        doist = doing.Doist(tock=1.0, heap=heap, limit=1000.0)
+        remover = doing.doify(removeDo, tock=1.0)
+        remover.opts["doist"] = doist
+        doist.do(doers=[a, b, c, remover])
+        assert doist.done == True
+        assert a.done == b.done == True
+        assert c.done == False
+        assert doist.tyme == 4.0  # not 101.0 when tombstone comes due
+
+        # nested heap dodoer too
+        a = TryDoer(stop=3, tock=1.0)
+        b = TryDoer(stop=3, tock=1.0)
+        c = TryDoer(stop=3, tock=100.0)
+        dodoer = doing.DoDoer(heap=heap)
+        remover = doing.doify(removeDo, tock=1.0)
+        remover.opts["doist"] = dodoer
+        dodoer.doers = [a, b, c, remover]
+        doist = doing.Doist(tock=1.0, limit=1000.0)
+        doist.do(doers=[dodoer])
+        assert dodoer.done == True
+        assert doist.tyme == 4.0  # not 101.0 when tombstone comes due
+        assert not dodoer.deeds
+
+    """Done Test """
+
+
+def test_doist_tickless(monkeypatch):
+    """
+    Test Doist.earliest, Doist.skip and tickless real time .do
+    """
+    tock = 0.03125
+    doist = doing.Doist(tock=tock)
+    assert doist.tickless == False
+    assert doist.earliest() is None
+
+    doer0 = doing.ExDoer(tock=tock * 4)
+    doer1 = doing.ExDoer(tock=tock * 8)
+    doer2 = doing.ExDoer(tock=tock * 2)
+    dodoer = doing.DoDoer(doers=[doer2])  # plain zero tock dodoer seen through
+    doist.doers = [doer0, doer1, dodoer]
+    doist.enter()
+    assert doist.earliest() == 0.0
+    doist.recur()
+    assert doist.tyme == tock
+    assert doist.earliest() == tock * 2  # doer2 nested in dodoer
+    assert dodoer.earliest() == tock * 2
+    assert doist.skip() == 1
+    assert doist.tyme == tock * 2
+    assert doist.skip() == 0  # already due
+    doist.recur()
+    assert doist.earliest() == tock * 4
+    assert doist.skip() == 1
+    doist.exit()
+
+    # dodoer subclass overriding recur is due at its own retyme
+    class BusyDoDoer(doing.DoDoer):
+        def recur(self, tyme, deeds=None):
+            return super().recur(tyme=tyme, deeds=deeds)
+
+    doist = doing.Doist(tock=tock, heap=True)
+    doist.doers = [doing.ExDoer(tock=tock * 8),
+                   BusyDoDoer(doers=[doing.ExDoer(tock=tock * 4)])]
+    doist.enter()
+    doist.recur()
+    assert doist.earliest() == tock  # busy dodoer runs every tock
+    doist.exit()
+
+    # tickless real time gives same results as ticking every tock
+    sleep = doing.time.sleep
+    sleeps = []
+    def countingSleep(secs):
+        sleeps[-1] += 1
+        sleep(secs)
+
+    monkeypatch.setattr(doing.time, "sleep", countingSleep)
+    states = []
+    for tickless in (False, True):
+        sleeps.append(0)
+        doer0 = doing.ExDoer(tock=tock * 4)
+        doer1 = doing.ExDoer(tock=tock * 6)
+        doist = doing.Doist(tock=tock, real=True, limit=tock * 20,
+                            tickless=tickless)
+        assert doist.tickless == tickless
+        doist.do(doers=[doer0, doer1])
+        assert doist.tyme == tock * 19  # all done before limit
+        states.append([doer0.states, doer1.states])
+
+    assert states[0] == states[1]
+    assert states[1][1][-1] == State(tyme=0.5625, context='exit', feed=None, count=5)
+    assert sleeps[1] < sleeps[0] // 2  # far fewer wakeups
+
+    """Done Test """
+
+
+def test_doist_fast_forward():
+    """
+    Test tickless non real Doist fast forwards .tyme over idle tocks with
+    identical results
+    """
+    tock = 0.03125
+    results = []
+    for tickless in (False, True):
+        doer0 = doing.ExDoer(tock=60.0)
+        doer1 = doing.ExDoer(tock=90.0)
+        doer2 = doing.ExDoer(tock=tock * 3)
+        dodoer = doing.DoDoer(doers=[doing.ExDoer(tock=45.0)])
+        doist = doing.Doist(tock=tock, limit=3600.0, tickless=tickless)
+        recurs = []
+        recur = doist.recur
+        def countingRecur(deeds=None):
+            recurs.append(doist.tyme)
+            recur(deeds=deeds)
+
+        doist.recur = countingRecur
+        doist.do(doers=[doer0, doer1, doer2, dodoer])
+        assert doist.done == True
+        results.append((doist.tyme, doer0.states, doer1.states, doer2.states,
+                        dodoer.doers[0].states))
+        if tickless:
+            assert len(recurs) < 20  # only tocks where some deed is due
+            assert recurs[:6] == [0.0, 0.09375, 0.1875, 0.28125, 45.0, 60.0]
+        else:
+            assert len(recurs) == 270 * 32 + 1
+
+    assert results[0] == results[1]
+    assert results[1][0] == 270.03125
+    assert results[1][2][-1] == State(tyme=270.0, context='exit', feed=None, count=5)
+
+    # identical tymes with tock not exact in binary floating point
+    def tymer(tymth=None, tock=0.0, tymes=None, **opts):
+        for i in range(5):
+            tymes.append(tymth())
+            yield tock
+        return True
+
+    results = []
+    for tickless in (False, True):
+        tymes = []
+        doist = doing.Doist(tock=0.1, real=False, limit=100, tickless=tickless)
+        doist.do(doers=[doing.doify(tymer, tock=1.0, tymes=tymes)])
+        results.append((tymes, doist.tyme))
+    assert results[0] == results[1]
+    assert results[1][0] == [0.0, 0.0, 1.0999999999999999, 2.0000000000000004,
+                             3.0000000000000013]  # not 1.0, 2.0, 3.0
+    assert results[1][1] == 4.100000000000001
+
+    # limit still honored when fast forwarding
+    doer = doing.ExDoer(tock=100.0)
+    doist = doing.Doist(tock=tock, limit=150.0, tickless=True)
+    doist.do(doers=[doer])
+    assert doist.tyme == 150.0
+    assert doer.states[-2:] == [State(tyme=150.0, context='cease', feed=None, count=3),
+                                State(tyme=150.0, context='exit', feed=None, count=4)]
+
+    # long idle gap with small tock skipped without a tick per tock
+    doist = doing.Doist(tock=0.001, tickless=True)
+    doist.doers = [doing.ExDoer(tock=1e6)]
+    doist.enter()
+    doist.recur()
+    assert doist.idle() == doist.idle(stop=2e6) == 999999981  # float drift
+    assert doist.idle(stop=1.0) == 999
+    assert doist.skip(most=9) == 9
+    assert doist.skip() == 999999972
+    assert doist.tyme == pytest.approx(1e6)
+    assert doist.earliest() <= doist.tyme  # landed on due tock
+    assert doist.skip() == 0
+    doist.exit()
+
+    """Done Test """
+
+
+def test_doist_waker():
+    """
+    Test Waker I/O readiness registry and Doist select wakes
+    """
+    tock = 0.03125
+    waker = doing.Waker()
+    assert waker.wakes == set()
+    assert waker.woken == set()
+    assert waker.wait(timeout=0.0) == 0  # no selector yet
+
+    class ReadDoer(doing.Doer):
+        """Reads socket when woken. Watches socket with its .waker"""
+        def __init__(self, sock, **kwa):
+            super().__init__(**kwa)
+            self.sock = sock
+            self.tymes = []
+            self.rxbs = bytearray()
+
+        def enter(self, *, temp=None):
+            if self.waker is not None:
+                self.waker.watch(self.sock, selectors.EVENT_READ, self)
+
+        def recur(self, tyme):
+            self.tymes.append(tyme)
+            try:
+                self.rxbs.extend(self.sock.recv(1024))
+            except BlockingIOError:
+                pass
+            return len(self.rxbs) >= 4
+
+        def exit(self):
+            if self.waker is not None:
+                self.waker.unwatch(self.sock)
+
+    a, b = socket.socketpair()
+    a.setblocking(False)
+    b.setblocking(False)
+    try:
+        doer = ReadDoer(sock=a, tock=1.0)
+        dodoer = doing.DoDoer(doers=[doer])
+        waker.parents[doer] = dodoer
+        assert waker.watch(a, selectors.EVENT_READ, doer)
+        assert waker.wait(timeout=0.0) == 0
+        b.send(b"ab")
+        assert waker.wait(timeout=1.0) == 2  # doer and its parent
+        assert waker.wakes == {doer, dodoer}
+        waker.turn()
+        assert waker.woken == {doer, dodoer}
+        assert waker.wakes == set()
+        waker.turn()
+        assert waker.woken == set()
+        assert a.recv(1024) == b"ab"
+        waker.unwatch(a)
+        waker.unwatch(a)  # not registered
+        assert not waker.watch(a, 0, doer)
+        waker.close()
+        assert waker.wakes == set()
+
+        # simulated time doist polls so woken doer runs early on next pass
+        # keeping its retyme
+        def writeDo(tymth=None, tock=0.0, **opts):
+            tyme = yield
+            while tyme < tock * 8:
+                tyme = yield
+            b.send(b"ab")
+            tyme = yield
+            while tyme < tock * 40:
+                tyme = yield
+            b.send(b"cd")
+            return True
+
+        for heap in (False, True):
+            doer = ReadDoer(sock=a, tock=1.0)
+            doist = doing.Doist(tock=tock, limit=3.0, select=True, heap=heap)
+            assert isinstance(doist.waker, doing.Waker)
+            doist.do(doers=[doer, doing.doify(writeDo, tock=tock)])
+            assert doer.waker is doist.waker
+            assert doer.rxbs == b"abcd"
+            assert doer.tymes == [0.0, tock * 9, 1.0, tock * 41]
+            assert doist.tyme == tock * 42
+
+        # nested doer wakes its dodoer
+        doer = ReadDoer(sock=a, tock=1.0)
+        dodoer = doing.DoDoer(doers=[doer], tock=2.0)
+        doist = doing.Doist(tock=tock, limit=3.0, select=True, tickless=True)
+        doist.do(doers=[dodoer, doing.doify(writeDo, tock=tock)])
+        assert doer.waker is doist.waker
+        assert doist.waker.parents[doer] is dodoer
+        assert doer.rxbs == b"abcd"
+        assert doer.tymes == [0.0, tock * 9, tock * 41]
+
+        # real time tickless doist wakes early from select when ready
+        doer = ReadDoer(sock=a, tock=2.0)
+        doist = doing.Doist(tock=tock, real=True, limit=1.0, select=True,
+                            tickless=True)
+        timer = threading.Timer(0.25, b.send, args=(b"abcd", ))
+        timer.start()
+        doist.do(doers=[doer])
+        timer.join()
+        assert doer.rxbs == b"abcd"
+        assert len(doer.tymes) == 2
+        assert 0.0 < doer.tymes[1] < 0.75  # woken well before its retyme
+    finally:
+        a.close()
+        b.close()
+
+    """Done Test """
+
+
+def test_doist_waker_ready():
+    """
+    Test real time Doist watching a file object that stays ready keeps .tyme
+    in step with real time
+    """
+    import time
+
+    class ReadyDoer(doing.Doer):
+        """Watches socket that stays readable since never read"""
+        def __init__(self, sock, **kwa):
+            super().__init__(**kwa)
+            self.sock = sock
+            self.tymes = []
+
+        def enter(self, *, temp=None):
+            self.waker.watch(self.sock, selectors.EVENT_READ, self)
+
+        def recur(self, tyme):
+            self.tymes.append(tyme)
+            return False
+
+        def exit(self):
+            self.waker.unwatch(self.sock)
+
+    a, b = socket.socketpair()
+    a.setblocking(False)
+    b.setblocking(False)
+    try:
+        b.send(b"unread")
+        for tickless in (False, True):
+            tock = 0.03125
+            limit = 0.25
+            doer = ReadyDoer(sock=a, tock=1.0)
+            doist = doing.Doist(tock=tock, real=True, limit=limit,
+                                select=True, tickless=tickless)
+            start = time.perf_counter()
+            doist.do(doers=[doer])
+            assert time.perf_counter() - start >= limit - tock
+            assert doist.tyme == limit
+            assert len(doer.tymes) > limit / tock  # woken within tocks
+            assert max(doer.tymes) <= limit
+            assert doer.tymes == sorted(doer.tymes)
+
+            # asyncio too
+            doer = ReadyDoer(sock=a, tock=1.0)
+            doist = doing.Doist(tock=tock, real=True, limit=limit,
+                                select=True, tickless=tickless)
+            start = time.perf_counter()
+            asyncio.run(doist.ado(doers=[doer]))
+            assert time.perf_counter() - start >= limit - tock
+            assert doist.tyme == limit
+            assert max(doer.tymes) <= limit
+    finally:
+        a.close()
+        b.close()
+
+    """Done Test """
+
+
 def test_doist_asyncio():
     """Test asyncio aware support in doist via .ado and .__call__"""
 
@@ -1448,6 +2001,275 @@ def test_doist_asyncio():
     #assert True
 
 
+def test_doist_async_doers():
+    """
+    Test async def doers run as asyncio tasks by Doist.ado
+    """
+    from hio.base.profiling import Profiler
+
+    events = []
+
+    async def fetch(tymth=None, tock=0.0, delay=0.1, **opts):
+        """Awaits real asyncio I/O like sleep and returns done state"""
+        events.append(("fetch start", tymth()))
+        await asyncio.sleep(delay)
+        events.append(("fetch end", tymth()))
+        return True
+
+    def tickDo(tymth=None, tock=0.0, count=3, **opts):
+        """Generator doer alongside async def doer"""
+        tyme = yield tock
+        for i in range(count):
+            events.append(("tick", tyme))
+            tyme = yield tock
+        return True
+
+    # not real without waker polls task every tock alongside generator doer
+    fetcher = doing.doify(fetch, delay=0.05)
+    ticker = doing.doify(tickDo, tock=0.5, count=2)
+    assert inspect.iscoroutinefunction(fetcher)
+    doist = Doist(tock=0.25)
+    asyncio.run(doist.ado(doers=[fetcher, ticker]))
+    assert doist.done
+    assert fetcher.done is True
+    assert ticker.done is True
+    assert events[:3] == [("tick", 0.0), ("fetch start", 0.25), ("tick", 0.5)]
+    assert events[3][0] == "fetch end"
+
+    # not real with waker awaits task instead of spinning
+    events.clear()
+    fetcher = doing.doify(fetch, delay=0.05)
+    profiler = Profiler()
+    doist = Doist(tock=0.25, select=True, profiler=profiler)
+    asyncio.run(doist.ado(doers=[fetcher]))
+    assert doist.done
+    assert fetcher.done is True
+    assert events == [("fetch start", 0.25), ("fetch end", 0.25)]
+    assert profiler.laps.count == 2  # start pass and done pass only
+    assert doist.waker.tasks == set()
+
+    # real tickless with waker sleeps until task done
+    events.clear()
+    fetcher = doing.doify(fetch, delay=0.2)
+    nested = doing.DoDoer(doers=[fetcher])
+    profiler = Profiler()
+    doist = Doist(tock=0.03125, real=True, tickless=True, limit=2.0,
+                  select=True, profiler=profiler)
+    asyncio.run(doist.ado(doers=[nested]))
+    assert doist.done
+    assert fetcher.done is True
+    assert nested.done is True
+    assert profiler.laps.count <= 4  # not one pass per tock
+    assert 0.15 <= doist.tyme <= 0.4  # tyme kept in step with real time
+
+    # exit cancels running task
+    cancels = []
+
+    async def hang(tymth=None, tock=0.0, **opts):
+        try:
+            await asyncio.sleep(10.0)
+        except asyncio.CancelledError:
+            cancels.append(tymth())
+            raise
+        return True
+
+    hanger = doing.doify(hang)
+    doist = Doist(tock=0.03125, real=True, limit=0.125, select=True)
+    asyncio.run(doist.ado(doers=[hanger]))
+    assert not doist.done
+    assert hanger.done is False
+    assert len(cancels) == 1
+
+    # not real with waker still stops at limit while task pending
+    cancels.clear()
+    hanger = doing.doify(hang)
+    doist = Doist(tock=0.03125, limit=0.125, select=True)
+    asyncio.run(asyncio.wait_for(doist.ado(doers=[hanger]), timeout=3.0))
+    assert not doist.done
+    assert doist.tyme == 0.125
+    assert hanger.done is False
+    assert len(cancels) == 1
+
+    # async def doers need running event loop
+    hanger = doing.doify(hang)
+    doist = Doist(tock=0.03125, limit=0.125)
+    with pytest.raises(RuntimeError):
+        doist.do(doers=[hanger])
+    """Done Test """
+
+
+def test_doist_priority():
+    """
+    Test priority ranks and pass budget of heap deeds with aging
+    """
+    import time
+
+    runs = []
+
+    class RunDoer(Doer):
+        """Records its name each run and sleeps delay"""
+
+        def __init__(self, name, delay=0.0, **kwa):
+            super(RunDoer, self).__init__(**kwa)
+            self.name = name
+            self.delay = delay
+
+        def recur(self, tyme):
+            runs.append((tyme, self.name))
+            if self.delay:
+                time.sleep(self.delay)
+            return False
+
+    def lowDo(tymth=None, tock=0.0, **opts):
+        """Generator function doer with priority from opts"""
+        assert opts["priority"] == -1
+        tyme = yield tock
+        while True:
+            runs.append((tyme, "low"))
+            tyme = yield tock
+
+    # priorities order ready deeds with ties in insertion order
+    low = doing.doify(lowDo, priority=-1)
+    doers = [low, RunDoer("mid"), RunDoer("high", priority=1), RunDoer("mid2")]
+    assert doers[2].priority == 1
+    assert doers[1].priority == 0
+    doist = Doist(tock=1.0, limit=2.0, heap=True)
+    doist.do(doers=doers)
+    assert runs == [(0.0, "high"), (0.0, "mid"), (0.0, "mid2"), (0.0, "low"),
+                    (1.0, "high"), (1.0, "mid"), (1.0, "mid2"), (1.0, "low")]
+
+    # deque deeds keep round robin order and warn that priority is ignored
+    runs.clear()
+    doers = [RunDoer("mid"), RunDoer("high", priority=1)]
+    doist = Doist(tock=1.0, limit=1.0)
+    with pytest.warns(RuntimeWarning, match="ignored without heap"):
+        doist.do(doers=doers)
+    assert runs == [(0.0, "mid"), (0.0, "high")]
+
+    # budget requires heap
+    with pytest.raises(ValueError):
+        Doist(tock=1.0, budget=0.005)
+    with pytest.raises(ValueError):
+        doing.DoDoer(budget=0.005)
+
+    # spent budget defers low priority deeds which age so never starve
+    runs.clear()
+    doers = [RunDoer("control", priority=1), RunDoer("bulk1", delay=0.01),
+             RunDoer("bulk2", delay=0.01), RunDoer("bulk3", opts=dict(priority=-1))]
+    doist = Doist(tock=1.0, limit=4.0, heap=True, budget=0.005)
+    assert doist.budget == 0.005
+    doist.do(doers=doers)
+    assert runs == [(0.0, "control"), (0.0, "bulk1"),  # bulk2 bulk3 deferred
+                    (1.0, "control"), (1.0, "bulk2"),  # bulk2 aged first
+                    (2.0, "control"), (2.0, "bulk1"),  # bulk3 deferred again
+                    (3.0, "bulk3"),  # deferred three passes so ranks first
+                    (3.0, "control"), (3.0, "bulk2")]
+
+    # sustained overload defers each default priority deed many passes
+    runs.clear()
+    doers = [RunDoer("bulk{}".format(i), delay=0.01) for i in range(4)]
+    doist = Doist(tock=1.0, limit=8.0, heap=True, budget=0.005)
+    doist.do(doers=doers)
+    assert runs == [(float(i), "bulk{}".format(i % 4)) for i in range(8)]
+
+    # nested heap dodoer with budget
+    runs.clear()
+    doers = [RunDoer("bulk1", delay=0.01), RunDoer("bulk2", delay=0.01)]
+    dodoer = doing.DoDoer(doers=doers, heap=True, budget=0.005)
+    assert dodoer.budget == 0.005
+    doist = Doist(tock=1.0, limit=3.0)
+    doist.do(doers=[dodoer])
+    assert runs == [(0.0, "bulk1"), (1.0, "bulk2"), (2.0, "bulk1")]
+    """Done Test """
+
+
+def test_doist_spin():
+    """
+    Test precise real time tocks with final busy spin and jitter
+    """
+    tymes = []
+
+    def tickDo(tymth=None, tock=0.0, **opts):
+        while True:
+            tymes.append((yield tock))
+
+    doist = Doist(tock=0.001, real=True, limit=0.05)
+    assert doist.spin is None
+    assert doist.jitter is None
+
+    doist = Doist(tock=0.001, real=True, limit=0.05, spin=0.0005)
+    assert doist.spin == 0.0005
+    assert doist.timer.duration == 0.001
+    doist.do(doers=[doing.doify(tickDo)])
+    assert len(tymes) == 50
+    assert doist.jitter.count == 50
+    spun = doist.jitter
+
+    # zero spin sleeps only so its jitter is sleep wakeup jitter
+    tymes.clear()
+    doist = Doist(tock=0.001, real=True, limit=0.05, spin=0.0)
+    doist.do(doers=[doing.doify(tickDo)])
+    assert doist.jitter.count == 50
+    slept = doist.jitter
+    assert spun.percentile(50) <= slept.percentile(50)  # spin absorbs sleep jitter
+    assert spun.percentile(50) < 0.01  # loose bound for loaded machines
+
+    # tickless with waker still spins to each deadline
+    tymes.clear()
+    doist = Doist(tock=0.001, real=True, limit=0.02, spin=0.0005,
+                  tickless=True, select=True)
+    doist.do(doers=[doing.doify(tickDo, tock=0.005)])
+    assert tymes == pytest.approx([0.0, 0.005, 0.01, 0.015])
+    assert doist.jitter.count == 4
+    """Done Test """
+
+
+def test_doist_collector():
+    """
+    Test garbage collection managed between passes
+    """
+    import gc
+
+    states = []
+
+    def litterDo(tymth=None, tock=0.0, **opts):
+        """Makes cyclic garbage each pass"""
+        tyme = yield tock
+        while True:
+            states.append((gc.isenabled(), gc.get_freeze_count() > 0))
+            for i in range(2000):
+                cycle = []
+                cycle.append(cycle)
+            tyme = yield tock
+
+    enabled = gc.isenabled()
+    doist = Doist(tock=0.01, limit=0.5)
+    assert doist.collector is False
+    assert doist.pauses is None
+
+    doist = Doist(tock=0.01, limit=0.5, collector=True)
+    assert doist.collector is True
+    doist.do(doers=[doing.doify(litterDo)])
+    assert set(states) == {(False, True)}  # frozen with automatic gc off
+    assert gc.isenabled() == enabled  # restored on exit
+    assert gc.get_freeze_count() == 0
+    assert doist.pauses.count > 2  # freeze plus collections between passes
+
+    # real tickless collects in slack
+    states.clear()
+    doist = Doist(tock=0.01, limit=0.2, real=True, tickless=True, collector=True)
+    doist.do(doers=[doing.doify(litterDo, tock=0.05)])
+    assert len(states) == 4
+    assert doist.pauses.count > 1
+    assert gc.isenabled() == enabled
+    assert gc.get_freeze_count() == 0
+
+    # collect runs nothing when no generation due
+    gc.collect()
+    assert doist.collect() is None
+    """Done Test """
+
+
 if __name__ == "__main__":
     test_doist_basic()
     test_doist_once()
@@ -1457,5 +2279,12 @@ if __name__ == "__main__":
     test_doist_remove()
     test_doist_remove_own_doer()
     test_doist_remove_by_own_doer()
+    test_doist_heap_woken()
+    test_doist_spawn()
     test_nested_doers()
+    test_doist_waker_ready()
     test_doist_asyncio()
+    test_doist_async_doers()
+    test_doist_priority()
+    test_doist_spin()
+    test_doist_collector()
@@ -0,0 +1,131 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.base.test_metering module
+
+"""
+import tracemalloc
+from collections import deque
+
+from hio.base import doing, Meter
+
+
+class LeakDoer(doing.Doer):
+    """Leaks a block of memory each recur"""
+
+    def __init__(self, **kwa):
+        super(LeakDoer, self).__init__(**kwa)
+        self.leaks = []
+
+    def recur(self, tyme):
+        self.leaks.append(bytearray(4096))  # leaked block
+        return False
+
+
+class Remote:
+    """Remoter like component with rx tx byte buffers"""
+
+    def __init__(self, rx=b"", tx=b""):
+        self.rxbs = bytearray(rx)
+        self.txbs = bytearray(tx)
+
+
+class Serve:
+    """Server like component with remoters in .ixes"""
+
+    def __init__(self):
+        self.ixes = dict(a=Remote(b"abc"), b=Remote(b"de", b"fghi"))
+
+
+class Peer:
+    """Memoer like component with gram and memo buffers"""
+
+    def __init__(self):
+        self.rxgs = dict(src=deque([b"g0", b"g1"]))
+        self.txgs = deque([(b"gram", "dst")])
+        self.rxms = deque([("memo", "src", None)])
+        self.servant = Serve()
+
+
+class PeerDoer(doing.Doer):
+    """Doer holding transport component"""
+
+    def __init__(self, **kwa):
+        super(PeerDoer, self).__init__(**kwa)
+        self.peer = Peer()
+
+
+def test_meter_buffers():
+    """
+    Test Meter buffer sizes and sample without tracing
+    """
+    meter = Meter(period=0.0, size=2)
+    assert meter.period == 0.0
+    assert meter.latest is None
+
+    doer = PeerDoer()
+    dodoer = doing.DoDoer(doers=[doer])
+    sizes = meter.buffers(list(meter._walk([dodoer])))
+    assert sizes == {"PeerDoer.peer.rxgs": 1,
+                     "PeerDoer.peer.txgs": 1,
+                     "PeerDoer.peer.rxms": 1,
+                     "PeerDoer.peer.servant.ixes.rxbs": 5,
+                     "PeerDoer.peer.servant.ixes.txbs": 4}
+
+    assert not tracemalloc.is_tracing()
+    sample = meter.sample([dodoer], tyme=1.0)
+    assert sample.tyme == 1.0
+    assert sample.current == sample.peak == 0
+    assert sample.doers == {}
+    assert sample.buffers == sizes
+    assert meter.latest is sample
+
+    for i in range(3):
+        meter.sample([dodoer])
+    assert len(meter.samples) == 2  # bounded
+
+    meter = Meter(period=60.0)
+    meter.start()
+    meter.stop()
+    assert meter.update([doer]) is None  # period not yet elapsed
+    assert not tracemalloc.is_tracing()
+    assert Meter.label(doer) == "PeerDoer"
+    """Done Test """
+
+
+def test_meter_doist():
+    """
+    Test Meter started by Doist attributes leak to doer class
+    """
+    samples = []
+    meter = Meter(period=0.0, callback=samples.append)
+    leak = LeakDoer(tock=0.0)
+    dodoer = doing.DoDoer(doers=[leak, PeerDoer()])
+    doist = doing.Doist(tock=0.03125, limit=0.25, meter=meter)
+    assert doist.meter is meter
+    doist.do(doers=[dodoer])
+
+    assert not tracemalloc.is_tracing()  # stopped on exit
+    assert len(samples) == 8  # one each pass
+    assert samples[-1] is meter.latest
+    assert [sample.tyme for sample in samples][:2] == [0.03125, 0.0625]
+    label = f"{LeakDoer.__module__}.LeakDoer"
+    first = samples[0].doers[label]
+    last = samples[-1].doers[label]
+    assert last - first >= 4096 * 6  # grows with each leaked block
+    assert samples[-1].current >= last
+    assert samples[-1].buffers["PeerDoer.peer.servant.ixes.rxbs"] == 5
+
+    # meter leaves tracing started elsewhere running
+    tracemalloc.start()
+    try:
+        doist = doing.Doist(tock=0.03125, limit=0.0625, meter=Meter(period=0.0))
+        doist.do(doers=[LeakDoer()])
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+    """Done Test """
+
+
+if __name__ == "__main__":
+    test_meter_buffers()
+    test_meter_doist()
@@ -0,0 +1,181 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.base.test_pooling module
+
+"""
+import os
+import sys
+import hashlib
+import pickle
+import time
+
+import pytest
+
+from hio import hioing
+from hio.base import doing
+from hio.base.pooling import Pool, Shared
+
+
+def square(x):
+    """Returns square of x and pid of worker"""
+    return (x * x, os.getpid())
+
+
+def nap(secs):
+    """Returns secs after sleeping secs"""
+    time.sleep(secs)
+    return secs
+
+
+def fail():
+    raise ValueError("Bad call")
+
+
+def digest(data, salt=b""):
+    """Returns blake2b digest of data and its type name"""
+    return (hashlib.blake2b(salt + data).digest(), type(data).__name__)
+
+
+class SquareDoer(doing.Doer):
+    """Offloads squares to pool"""
+
+    def __init__(self, values, **kwa):
+        super(SquareDoer, self).__init__(**kwa)
+        self.values = values
+        self.results = []
+        self.outstanding = []
+        self.error = None
+
+    def recur(self, tock=None):
+        for value in self.values:
+            self.results.append((yield from self.pool.offload(square, value)))
+            self.outstanding.append(len(self.pool.futures))
+        try:
+            yield from self.pool.offload(fail)
+        except ValueError as ex:
+            self.error = str(ex)
+        return True
+
+
+def test_pool_doist():
+    """
+    Test Pool opened closed and injected by Doist
+    """
+    pool = Pool(workers=2, limit=1)
+    assert not pool.opened
+    assert pool.futures == set()
+
+    gen = pool.offload(square, 2)  # not opened
+    with pytest.raises(hioing.MultiError):
+        next(gen)
+
+    tock = 0.03125
+    doer = SquareDoer(values=[1, 2, 3], tock=0.0)
+    dodoer = doing.DoDoer(doers=[doer])
+    doist = doing.Doist(tock=tock, real=True, limit=10.0, pool=pool)
+    assert doist.pool is pool
+    doist.do(doers=[dodoer])
+    assert doist.done
+    assert doer.done
+    assert dodoer.pool is pool
+    assert doer.pool is pool  # nested dodoer injects
+    assert [result for result, pid in doer.results] == [1, 4, 9]
+    assert all(pid != os.getpid() for result, pid in doer.results)
+    assert all(count <= 1 for count in doer.outstanding)  # bounded by limit
+    assert doer.error == "Bad call"
+    assert not pool.opened  # closed on exit
+    assert pool.futures == set()
+
+    # doist without pool does not inject
+    doer = doing.Doer(tock=tock)
+    doist = doing.Doist(tock=tock, limit=tock * 4)
+    assert doist.pool is None
+    doist.do(doers=[doer])
+    assert doer.pool is None
+    """Done Test """
+
+
+def test_pool_cancel():
+    """
+    Test closing offload while waiting on limit or call
+    """
+    pool = Pool(workers=1, limit=1)
+    pool.open()
+    assert pool.opened
+
+    first = pool.offload(nap, 0.25)
+    assert next(first) == 0.0
+    assert len(pool.futures) == 1
+    second = pool.offload(square, 4)
+    assert next(second) == 0.0  # waits for free slot
+    assert len(pool.futures) == 1
+    second.close()  # closed before submit
+    assert len(pool.futures) == 1
+
+    while True:
+        try:
+            next(first)
+        except StopIteration as ex:
+            assert ex.value == 0.25
+            break
+
+    pool.close()
+    assert not pool.opened
+    assert pool.futures == set()
+    """Done Test """
+
+
+@pytest.mark.skipif(sys.version_info < (3, 13),
+                    reason="SharedMemory track parameter requires 3.13")
+def test_pool_shared():
+    """
+    Test large arguments passed in shared memory
+    """
+    from multiprocessing import shared_memory
+
+    shared = Shared("psm_abc", 5)
+    assert pickle.loads(pickle.dumps(shared)).name == "psm_abc"
+    assert repr(shared) == "Shared(name='psm_abc', size=5)"
+
+    data = os.urandom(4096)
+    salt = b"salt"
+    pool = Pool(workers=1, share=1024)
+    pool.open()
+
+    def run(gen):
+        while True:
+            try:
+                next(gen)
+            except StopIteration as ex:
+                return ex.value
+
+    # small argument is pickled as is
+    assert run(pool.offload(digest, salt, salt=b"")) == \
+        (hashlib.blake2b(salt).digest(), "bytes")
+
+    # large arguments are passed as memoryview of shared memory
+    assert run(pool.offload(digest, data, salt=salt)) == \
+        (hashlib.blake2b(salt + data).digest(), "memoryview")
+    assert run(pool.offload(digest, bytearray(data))) == \
+        (hashlib.blake2b(data).digest(), "memoryview")
+
+    # existing shared memory is passed without copy
+    block = shared_memory.SharedMemory(create=True, size=len(data))
+    try:
+        block.buf[:len(data)] = data
+        result, kind = run(pool.offload(digest, block))
+        assert kind == "memoryview"
+        assert result == hashlib.blake2b(bytes(block.buf)).digest()
+    finally:
+        block.close()
+        block.unlink()
+
+    pool.close()
+    assert pool.futures == set()
+    """Done Test """
+
+
+if __name__ == "__main__":
+    test_pool_doist()
+    test_pool_cancel()
+    test_pool_shared()
@@ -0,0 +1,142 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.base.test_profiling module
+
+"""
+import time
+
+import pytest
+
+from hio.base import doing
+from hio.base.profiling import Profiler, Stat
+
+
+def test_stat():
+    """
+    Test Stat class
+    """
+    stat = Stat(size=4)
+    assert stat.count == 0
+    assert stat.total == 0.0
+    assert stat.max == 0.0
+    assert stat.overruns == 0
+    assert stat.mean == 0.0
+    assert stat.percentile(50) == 0.0
+
+    for elapsed in (0.5, 0.1, 0.3, 0.2):
+        stat.add(elapsed)
+    stat.add(0.4, overrun=True)
+    assert stat.count == 5
+    assert stat.total == pytest.approx(1.5)
+    assert stat.max == 0.5
+    assert stat.overruns == 1
+    assert stat.mean == pytest.approx(0.3)
+    assert list(stat.samples) == [0.1, 0.3, 0.2, 0.4]  # most recent size
+    assert stat.percentile(0) == 0.1
+    assert stat.percentile(50) == 0.2
+    assert stat.percentile(75) == 0.3
+    assert stat.percentile(100) == 0.4
+    assert repr(stat) == "Stat(count=5, total=1.500000, max=0.500000, overruns=1)"
+
+    """Done Test """
+
+
+def test_profiler_doist():
+    """
+    Test Profiler with Doist and nested DoDoer
+    """
+    tock = 0.03125
+    profiler = Profiler()
+    assert profiler.budget is None
+    assert profiler.stats == {}
+    assert profiler.laps.count == 0
+
+    class SlowDoer(doing.Doer):
+        """Takes longer than budget on every third recur"""
+        def __init__(self, **kwa):
+            super().__init__(**kwa)
+            self.count = 0
+
+        def recur(self, tyme):
+            self.count += 1
+            if self.count % 3 == 0:
+                time.sleep(0.002)
+            return self.count >= 6
+
+    records = []
+    def callback(doer, stat, elapsed):
+        records.append((doer, stat.count, elapsed))
+
+    profiler.callback = callback
+    slow = SlowDoer(tock=tock)
+    fast = doing.ExDoer(tock=tock * 2)
+    dodoer = doing.DoDoer(doers=[fast])
+    doist = doing.Doist(tock=tock, limit=tock * 8, profiler=profiler)
+    assert doist.profiler is profiler
+    assert profiler.budget == tock  # defaults to doist tock
+
+    profiler.budget = 0.001
+    doist.do(doers=[slow, dodoer])
+    assert slow.profiler is profiler
+    assert fast.profiler is profiler  # injected by nested dodoer
+
+    stat = profiler.stat(slow)
+    assert stat.count == 6
+    assert stat.overruns == 2
+    assert stat.max >= 0.002
+    assert stat.percentile(100) == stat.max
+    assert profiler.stat(fast).count == 4  # nested deeds are profiled
+    assert profiler.stat(dodoer).count == 7
+    assert doist.tyme == tock * 7
+    assert profiler.laps.count == 7  # one lap per recur pass
+    assert profiler.laps.overruns >= 2
+
+    assert len(records) == 6 + 4 + 7
+    assert records[0][0] is slow
+    assert records[0][1] == 1
+
+    report = profiler.report()
+    assert report[0][0] is slow  # most total time first
+    assert [doer for doer, stat in report[1:]] == [dodoer, fast]  # dodoer inclusive
+    report = profiler.report(key=lambda stat: stat.count)
+    assert report[0][0] is dodoer
+    assert Profiler.label(slow).endswith("SlowDoer")
+    assert Profiler.label(doing.tryDo) == "tryDo"
+
+    profiler.clear()
+    assert profiler.stats == {}
+    assert profiler.laps.count == 0
+
+    # heap mode profiles too and doist without profiler does not
+    slow = SlowDoer(tock=tock)
+    doist = doing.Doist(tock=tock, limit=tock * 8, heap=True, profiler=profiler)
+    doist.do(doers=[slow])
+    assert profiler.stat(slow).count == 6
+    assert profiler.laps.count == 6
+
+    slow = SlowDoer(tock=tock)
+    doist = doing.Doist(tock=tock, limit=tock * 8)
+    assert doist.profiler is None
+    doist.do(doers=[slow])
+    assert slow.profiler is None
+    assert profiler.stat(slow) is None
+
+    # stats do not keep churned doers alive
+    import gc
+    profiler.clear()
+    profiler.callback = None  # records keeps doers alive
+    doers = [doing.ExDoer(tock=tock) for i in range(8)]
+    doist = doing.Doist(tock=tock, limit=tock * 8, profiler=profiler)
+    doist.do(doers=doers)
+    assert len(profiler.stats) == 8
+    doist.doers = []
+    doers.clear()
+    gc.collect()
+    assert len(profiler.stats) == 0
+    assert profiler.stats == {}
+
+    """Done Test """
+
+
+if __name__ == "__main__":
+    test_profiler_doist()
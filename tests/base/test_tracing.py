@@ -0,0 +1,127 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.base.test_tracing module
+
+"""
+import io
+import os
+import json
+
+import pytest
+
+from hio.base import doing
+from hio.base.tracing import Tracer, NullContext
+
+
+def test_tracer():
+    """
+    Test Tracer class
+    """
+    tracer = Tracer(size=4, pid=1, tid=2)
+    assert tracer.size == 4
+    assert tracer.pid == 1
+    assert tracer.tid == 2
+    assert tracer.drops == 0
+    assert not tracer.events
+
+    with tracer.span("outer", cat="test", x=1):
+        with tracer.span("inner"):
+            pass
+    assert len(tracer.events) == 2
+    inner, outer = tracer.events  # inner completes first
+    assert inner["name"] == "inner"
+    assert inner["cat"] == "doer"
+    assert outer["name"] == "outer"
+    assert outer["cat"] == "test"
+    assert outer["args"] == dict(x=1)
+    assert outer["ph"] == inner["ph"] == "X"
+    assert outer["pid"] == 1 and outer["tid"] == 2
+    assert outer["ts"] <= inner["ts"]
+    assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+
+    tracer.mark("here", cat="test")
+    assert tracer.events[-1]["ph"] == "i"
+    for i in range(3):  # ring buffer drops oldest
+        tracer.mark("again")
+    assert len(tracer.events) == 4
+    assert tracer.drops == 2
+    assert tracer.events[0]["name"] == "here"
+
+    buf = io.StringIO()
+    trace = tracer.flush(buf)
+    assert len(trace["traceEvents"]) == 4
+    assert trace["otherData"] == dict(drops=2)
+    assert json.loads(buf.getvalue()) == trace
+    assert not tracer.events
+    assert tracer.drops == 0
+
+    def gen():
+        tyme = yield 0.0
+        return True
+
+    dog = gen()
+    next(dog)
+    with pytest.raises(StopIteration):
+        tracer.send(dog, 1.0, gen)
+    assert tracer.events[-1]["name"] == "test_tracer.<locals>.gen"
+    assert tracer.events[-1]["cat"] == "deed"
+    assert tracer.events[-1]["args"] == dict(tyme=1.0)
+
+    doer = doing.Doer()
+    assert doer.tracer is None
+    assert doer.trace("service") is NullContext
+    doer.tracer = tracer
+    with doer.trace("service", cat="transport"):
+        pass
+    assert tracer.events[-1]["name"] == "Doer.service"
+    assert tracer.events[-1]["cat"] == "transport"
+
+    """Done Test """
+
+
+def test_tracer_doist(tmp_path):
+    """
+    Test Tracer with Doist and nested DoDoer
+    """
+    tock = 0.03125
+    tracer = Tracer()
+    doer0 = doing.ExDoer(tock=tock)
+    doer1 = doing.ExDoer(tock=tock * 2)
+    dodoer = doing.DoDoer(doers=[doer1])
+    doist = doing.Doist(tock=tock, limit=tock * 4, tracer=tracer)
+    assert doist.tracer is tracer
+    doist.do(doers=[doer0, dodoer])
+    assert doer0.tracer is tracer
+    assert doer1.tracer is tracer  # injected by nested dodoer
+
+    events = list(tracer.events)
+    ticks = [event for event in events if event["cat"] == "tick"]
+    deeds = [event for event in events if event["cat"] == "deed"]
+    assert len(ticks) == 4
+    assert [tick["args"]["tyme"] for tick in ticks] == [0.0, tock, tock * 2, tock * 3]
+    assert all(tick["name"] == "doist" for tick in ticks)
+    assert len(deeds) == 4 + 4 + 2
+    names = [deed["name"] for deed in deeds]
+    assert names[:3] == ["ExDoer", "ExDoer", "DoDoer"]  # nested completes first
+
+    nested, outer = deeds[1], deeds[2]  # nested doer1 send inside dodoer send
+    assert outer["ts"] <= nested["ts"]
+    assert nested["ts"] + nested["dur"] <= outer["ts"] + outer["dur"]
+    assert deeds[0]["ts"] + deeds[0]["dur"] <= ticks[0]["ts"] + ticks[0]["dur"]
+
+    path = os.path.join(tmp_path, "doist.trace.json")
+    trace = tracer.flush(path)
+    with open(path) as f:
+        assert json.load(f) == trace
+    assert not tracer.events
+
+    # heap mode traces too
+    doist = doing.Doist(tock=tock, limit=tock * 4, heap=True, tracer=tracer)
+    doist.do(doers=[doing.ExDoer(tock=tock)])
+    assert len([event for event in tracer.events if event["cat"] == "deed"]) == 4
+
+    """Done Test """
+
+
+if __name__ == "__main__":
+    test_tracer_doist()
@@ -0,0 +1,86 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.base.test_watching module
+
+"""
+import time
+
+from hio.base import doing
+from hio.base.watching import Watchdog
+
+
+class StallDoer(doing.Doer):
+    """Blocks in a sync call on its first recur"""
+
+    def __init__(self, delay=0.25, **kwa):
+        super(StallDoer, self).__init__(**kwa)
+        self.delay = delay
+
+    def recur(self, tyme):
+        time.sleep(self.delay)  # blocks the doist
+        return True
+
+
+def test_watchdog_check():
+    """
+    Test Watchdog begin end and check without watcher thread
+    """
+    stalls = []
+    watchdog = Watchdog(threshold=0.01,
+                        callback=lambda doer, elapsed, stack:
+                            stalls.append((doer, elapsed, stack)))
+    assert watchdog.threshold == 0.01
+    assert watchdog.interval == 0.0025
+    assert not watchdog.started
+    assert watchdog.check() is None  # no send
+
+    doer = StallDoer()
+    assert watchdog.ident is None  # no watched thread so empty stack
+    watchdog.begin(doer)
+    assert watchdog.check() is None  # not yet stalled
+    time.sleep(0.02)
+    elapsed = watchdog.check()
+    assert elapsed > 0.01
+    assert watchdog.stalls == 1
+    assert stalls == [(doer, elapsed, "")]
+    assert watchdog.check() is None  # reported once
+    watchdog.end()
+    assert watchdog.check() is None
+    assert Watchdog.label(doer) == "StallDoer"
+    """Done Test """
+
+
+def test_watchdog_doist():
+    """
+    Test Watchdog started by Doist reports stalled nested send with stack
+    """
+    stalls = []
+    watchdog = Watchdog(threshold=0.05,
+                        callback=lambda doer, elapsed, stack:
+                            stalls.append((doer, elapsed, stack)))
+    stall = StallDoer(delay=0.25)
+    quick = doing.Doer(tock=0.0)
+    dodoer = doing.DoDoer(doers=[stall, quick])
+    doist = doing.Doist(tock=0.03125, limit=0.125, watchdog=watchdog)
+    doist.do(doers=[dodoer])
+
+    assert not watchdog.started  # stopped on exit
+    assert dodoer.watchdog is watchdog
+    assert stall.watchdog is watchdog  # nested dodoer injects
+    assert watchdog.stalls == 1
+    doer, elapsed, stack = stalls[0]
+    assert doer is stall  # innermost send reported not its dodoer
+    assert elapsed > 0.05
+    assert "time.sleep(self.delay)" in stack
+
+    # doist without watchdog does not inject
+    doer = doing.Doer()
+    doist = doing.Doist(tock=0.03125, limit=0.0625)
+    doist.do(doers=[doer])
+    assert doer.watchdog is None
+    """Done Test """
+
+
+if __name__ == "__main__":
+    test_watchdog_check()
+    test_watchdog_doist()
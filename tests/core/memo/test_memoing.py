@@ -3,6 +3,10 @@
 tests.core.test_memoing module
 
 """
+import math
+import mmap
+import tempfile
+
 from collections import deque
 from dataclasses import asdict
 from base64 import urlsafe_b64encode as encodeB64
@@ -14,11 +18,12 @@ import blake3
 import pytest
 
 from hio.hioing import MemoerError, MemoerVerifyError
-from hio.help import helping
+from hio.help import helping, Budget
 from hio.base import doing, tyming
 from hio.core.memo import memoing
-from hio.core.memo import (Versionage, Sizage, Keyage,
+from hio.core.memo import (Versionage, Sizage, Keyage, Outcome, Congestion,
                            MemoDex, ZeroDex, GramDex, AuthDex, SureDex, AckDex,
+                           ChainDex,
                            Memoer, AuthMemoer, openMemoer, openAM,
                            MemoerDoer, AuthMemoerDoer)
 
@@ -108,7 +113,9 @@ def test_memoing_codices():
         'GramSureAuthZero': 'bAAG',
         'GramSureAuth': 'bAAH',
         'Ack': 'bAAI',
-        'AckAuth': 'bAAJ'
+        'AckAuth': 'bAAJ',
+        'GramChainZero': 'bAAK',
+        'GramChain': 'bAAL'
     }
 
     assert asdict(ZeroDex) == \
@@ -117,6 +124,7 @@ def test_memoing_codices():
         'GramAuthZero': 'bAAC',
         'GramSureZero': 'bAAE',
         'GramSureAuthZero': 'bAAG',
+        'GramChainZero': 'bAAK',
     }
 
     assert asdict(GramDex) == \
@@ -125,6 +133,7 @@ def test_memoing_codices():
         'GramAuth': 'bAAD',
         'GramSure': 'bAAF',
         'GramSureAuth': 'bAAH',
+        'GramChain': 'bAAL',
     }
 
     assert asdict(AuthDex) == \
@@ -134,6 +143,8 @@ def test_memoing_codices():
         'GramSureAuthZero': 'bAAG',
         'GramSureAuth': 'bAAH',
         'AckAuth': 'bAAJ',
+        'GramChainZero': 'bAAK',
+        'GramChain': 'bAAL',
     }
 
     assert asdict(SureDex) == \
@@ -150,6 +161,12 @@ def test_memoing_codices():
         'AckAuth': 'bAAJ'
     }
 
+    assert asdict(ChainDex) == \
+    {
+        'GramChainZero': 'bAAK',
+        'GramChain': 'bAAL',
+    }
+
 
     """Done Test"""
 
@@ -170,7 +187,9 @@ def test_memoer_class():
         'GramSureAuthZero': 'bAAG',
         'GramSureAuth': 'bAAH',
         'Ack': 'bAAI',
-        'AckAuth': 'bAAJ'
+        'AckAuth': 'bAAJ',
+        'GramChainZero': 'bAAK',
+        'GramChain': 'bAAL'
     }
 
     # Codes table with sizes of code (hard) and full primitive material
@@ -185,7 +204,9 @@ def test_memoer_class():
         'bAAG': Sizage(bz=4, nz=4, mz=24, vz=44, az=88),
         'bAAH': Sizage(bz=4, nz=4, mz=24, vz=0, az=88),
         'bAAI': Sizage(bz=4, nz=4, mz=24, vz=0, az=0),
-        'bAAJ': Sizage(bz=4, nz=4, mz=24, vz=44, az=88)
+        'bAAJ': Sizage(bz=4, nz=4, mz=24, vz=44, az=88),
+        'bAAK': Sizage(bz=4, nz=4, mz=24, vz=44, az=132),
+        'bAAL': Sizage(bz=4, nz=4, mz=24, vz=0, az=44)
     }
     #  verify Sizes and Codes
     for code, val in Memoer.Sizes.items():
@@ -224,7 +245,9 @@ def test_memoer_class():
         'bAAG': 'GramSureAuthZero',
         'bAAH': 'GramSureAuth',
         'bAAI': 'Ack',
-        'bAAJ': 'AckAuth'
+        'bAAJ': 'AckAuth',
+        'bAAK': 'GramChainZero',
+        'bAAL': 'GramChain'
     }
 
     assert Memoer.Zedex == ZeroDex
@@ -247,6 +270,15 @@ def test_memoer_class():
     assert Memoer.Pairs[MemoDex.GramAuthZero] == MemoDex.GramAuth
     assert Memoer.Pairs[MemoDex.GramSureZero] == MemoDex.GramSure
     assert Memoer.Pairs[MemoDex.GramSureAuthZero] == MemoDex.GramSureAuth
+    assert Memoer.Pairs[MemoDex.GramChainZero] == MemoDex.GramChain
+    assert Memoer.Roots == {MemoDex.GramChainZero: 44, MemoDex.GramChain: 44}
+
+    raw = bytes(range(32))
+    dig = Memoer._encodeDIG(raw)
+    assert dig[0] == 'F'
+    assert len(dig) == 44 == Memoer.Roots[MemoDex.GramChainZero]
+    assert Memoer._decodeDIG(dig) == (raw, 'F')
+    assert Memoer._chain([]) == bytes(32)
 
     # Base2 Binary index representation of Text Base64 Char Codes
     #assert Memoer.Bodes == {b'\xff\xf0': '__', b'\xff\xe0': '_-'}
@@ -393,6 +425,85 @@ def test_memoer_sign_verify():
 
 
 
+def test_memoer_key_caches():
+    """Test Memoer caches of signing keys, verification keys, and unknown vids
+    """
+    salt = b"ABCDEFGHIJKLMNOP"
+    try:
+        keep = _setupKeep(salt=salt)
+    except MemoerError as ex:
+        return
+
+    nvid, tvid, dvid = list(keep.keys())  # nontrans, trans, digest vids
+    peer = Memoer(code=MemoDex.GramAuthZero, keep=keep, vid=tvid)
+    assert peer._sigkeys == peer._verkeys == peer._unknowns == {}
+
+    sgram = b"bAAC0AD5s502N14R8bWw8qyvRW-SAAAB" + tvid.encode() + b"Hello There"
+    sig = peer.sign(tvid, sgram)
+    sigkey, keyage = peer._sigkeys[tvid]
+    assert keyage is keep[tvid]
+    assert peer.sign(tvid, sgram) == sig  # from cache
+    assert peer._sigkeys[tvid][0] is sigkey
+
+    assert peer.verify(tvid, sig, sgram)
+    verkey, keyage = peer._verkeys[tvid]
+    assert keyage is keep[tvid]
+    assert peer.verify(tvid.encode(), sig, sgram)  # from cache
+    assert peer._verkeys[tvid][0] is verkey
+
+    # nontransferable verkey cached without keyage so not looked up in keep
+    nsig = peer.sign(nvid, sgram)
+    assert peer.verify(nvid, nsig, sgram)
+    assert peer._verkeys[nvid][1] is None
+
+    # replacing keyage in keep invalidates cached keys
+    other = _setupKeep(salt=b"abcdefghijklmnop")
+    okeyage = list(other.values())[1]
+    keep[tvid] = okeyage
+    osig = peer.sign(tvid, sgram)
+    assert osig != sig
+    assert peer._sigkeys[tvid][1] is okeyage
+    assert peer.verify(tvid, osig, sgram)
+    assert peer._verkeys[tvid][1] is okeyage
+    with pytest.raises(MemoerVerifyError):
+        peer.verify(tvid, sig, sgram)  # old signature fails on new key
+
+    # unknown vid is negatively cached until added to keep
+    del keep[tvid]
+    with pytest.raises(MemoerVerifyError):
+        peer.verify(tvid, osig, sgram)
+    assert tvid in peer._unknowns
+    assert tvid not in peer._verkeys
+    with pytest.raises(MemoerVerifyError):
+        peer.verify(tvid, osig, sgram)  # rejected from negative cache
+    with pytest.raises(MemoerError):
+        peer.sign(tvid, sgram)
+    keep[tvid] = okeyage
+    assert peer.verify(tvid, osig, sgram)
+    assert tvid not in peer._unknowns
+
+    # undecodable vid is negatively cached
+    bogus = "X" * 44
+    with pytest.raises(MemoerVerifyError):
+        peer.verify(bogus, osig, sgram)
+    assert bogus in peer._unknowns
+
+    # cache is bounded with oldest evicted first
+    peer.CacheSize = 2
+    for i in range(3):
+        with pytest.raises(MemoerVerifyError):
+            peer.verify(f"{i}" * 44, osig, sgram)
+    assert list(peer._unknowns) == ["1" * 44, "2" * 44]
+
+    # assigning keep flushes caches
+    peer.keep = other
+    assert peer.keep is other
+    assert peer._sigkeys == peer._verkeys == peer._unknowns == {}
+    peer.keep = None
+    assert peer.keep == {}
+    """Done Test """
+
+
 def test_memoer_basic():
     """Test Memoer class basic
     """
@@ -739,6 +850,144 @@ def test_memoer_small_gram_size():
     """ End Test """
 
 
+def test_memoer_rend_linear():
+    """Test Memoer rend of str and bytes like memos from header templates
+    """
+    memo = "Hello There! " * 4000  # 52000 chars
+    for curt in (False, True):
+        peer = Memoer(size=300, curt=curt, echoic=True)
+        peer.reopen()
+        assert not peer._templates
+        for source in (memo, memo.encode(), bytearray(memo.encode()),
+                       memoryview(memo.encode())):
+            grams = peer.rend(source)
+            assert all(isinstance(gram, bytes) for gram in grams)
+            assert len(grams) > 100
+            for gram in grams:
+                peer.echos.append((gram, "beta"))
+            peer.serviceAllRx()
+            assert peer.inbox.popleft() == (memo, "beta", None)
+        assert list(peer._templates) == [(MemoDex.GramZero, curt)]
+
+    assert Memoer().rend("") == []
+    assert Memoer().rend(b"") == []
+    """Done Test """
+
+
+def test_memoer_stream_hwm():
+    """Test Memoer streaming memos into .txgs bounded by high water mark
+    from str, file, and mmap sources
+    """
+    memo = "Hello There! " * 4000  # 52000 chars
+    peer = Memoer(size=300, hwm=8, echoic=True)
+    peer.reopen()
+    assert peer.hwm == 8
+    assert peer.txgen is None
+    assert Memoer().hwm is None
+
+    peer.memoit(memo, "beta")
+    peer.memoit("Bye", "beta")
+    peer.serviceTxMemos()
+    assert len(peer.txgs) == 8  # blocked at high water mark
+    assert peer.txgen is not None
+    assert len(peer.txms) == 1
+
+    passes = 0
+    while peer.txgs or peer.txgen is not None or peer.txms:
+        peer.serviceTxMemos()
+        assert len(peer.txgs) <= 8
+        peer.serviceTxGramsOnce(echoic=True)  # drain one gram per pass
+        passes += 1
+    assert passes > 100
+    peer.serviceAllRx()
+    assert peer.inbox.popleft() == (memo, "beta", None)
+    assert peer.inbox.popleft() == ("Bye", "beta", None)
+
+    # file like and mmap sources are read one body at a time
+    with tempfile.TemporaryFile() as f:
+        f.write(b"prefix" + memo.encode())
+        f.seek(6)  # memo from current position
+        grams = peer.rend(f)
+        f.seek(6)
+        for code in (MemoDex.GramZero, MemoDex.GramChainZero):
+            if code == MemoDex.GramChainZero:
+                try:
+                    keep = _setupKeep()
+                except MemoerError as ex:
+                    break
+                peer = Memoer(code=code, size=300, hwm=4, keep=keep,
+                              vid=list(keep)[0], echoic=True)
+                peer.reopen()
+            f.seek(6)
+            peer.memoit(f, "beta")
+            while peer.txgs or peer.txgen is not None or peer.txms:
+                peer.serviceTxMemos()
+                peer.serviceTxGrams(echoic=True)
+            peer.serviceAllRx()
+            assert peer.inbox.popleft()[0] == memo
+
+        with mmap.mmap(f.fileno(), 0) as mm:
+            mgrams = peer.rend(mm)
+            assert len(mgrams) >= len(grams)
+            for gram in mgrams:
+                peer.echos.append((gram, "beta"))
+            peer.serviceAllRx()
+            assert peer.inbox.popleft()[0] == "prefix" + memo
+
+    class Pipe:
+        """Readable but not seekable"""
+        def read(self, n=-1):
+            return b""
+
+    with pytest.raises(MemoerError):
+        peer.rend(Pipe())  # not seekable
+    with pytest.raises(MemoerError):
+        peer.rend(42)  # neither bytes like nor file like
+    """Done Test """
+
+
+def test_memoer_zero_copy():
+    """Test Memoer parse of gram bodies as views without copy and fuse of
+    bytes memos
+    """
+    memo = "Hello There! " * 100
+    for curt in (False, True):
+        peer = Memoer(size=300, curt=curt, bytic=True, echoic=True)
+        peer.reopen()
+        assert peer.bytic
+        assert not peer._layouts
+        grams = peer.rend(memo)
+        gram = grams[1]
+        mid, vid, gn, gc, code, body = peer.parse(gram)
+        assert (vid, gn, gc, code) == (None, 1, None, MemoDex.Gram)
+        assert isinstance(body, memoryview)
+        assert body.obj is gram  # view into gram not copy
+        assert body == gram[len(gram) - len(body):]
+        assert list(peer._layouts) == [(MemoDex.Gram, curt)]
+
+        # pick strips header from bytearray in place
+        stripped = bytearray(gram)
+        assert peer.pick(stripped) == (mid, vid, gn, gc)
+        assert stripped == body
+        stripped.extend(b"more")  # export released so may resize
+
+        for gram in grams:
+            peer.echos.append((gram, "beta"))
+        peer.serviceReceives(echoic=True)
+        assert all(isinstance(body, memoryview) for body in peer.rxgs[mid].values())
+        peer.serviceRxGrams()
+        assert peer.rxms.popleft() == (memo.encode(), "beta", None)  # bytes
+
+    peer = Memoer(echoic=True)
+    assert not peer.bytic
+    with pytest.raises(MemoerError):
+        peer.parse(b"bZZZ" + bytes(100))  # unrecognized code
+    with pytest.raises(MemoerError):
+        peer.parse(b"")
+    assert not peer._layouts
+    """Done Test """
+
+
 def test_memoer_multiple():
     """Test Memoer class with small gram size and multiple queued memos
     """
@@ -872,6 +1121,472 @@ def test_memoer_multiple_echoic_service_tx_rx():
     """ End Test """
 
 
+def test_memoer_budget_service_rx():
+    """Test Memoer serviceReceives bounded by Budget resumes on next call
+    """
+    budget = Budget(items=2)
+    peer = memoing.Memoer(size=38, echoic=True, budget=budget)
+    assert peer.budget is budget
+    peer.reopen()
+
+    peer.memoit("Hello there.", "alpha")
+    peer.memoit("How ya doing?", "beta")
+    peer.serviceAllTx()
+    assert len(peer.echos) == 5
+
+    peer.serviceReceives()
+    assert len(peer.echos) == 3  # stopped when budget spent
+    assert budget.count == 2
+    assert budget.stops == 1
+    peer.serviceReceives()
+    assert len(peer.echos) == 1
+    peer.serviceReceives()
+    assert not peer.echos
+    assert budget.count == 1  # empty before spent
+    assert budget.stops == 2
+
+    peer.memoit("See ya.", "gamma")  # spent on last gram so not a stop
+    peer.serviceAllTx()
+    assert len(peer.echos) == 2
+    peer.serviceReceives()
+    assert not peer.echos
+    assert budget.spent
+    assert budget.stops == 2
+
+    peer.serviceAllRx()
+    assert peer.inbox[0] == ('Hello there.', 'alpha', None)
+    assert peer.inbox[1] == ('How ya doing?', 'beta', None)
+
+    peer.close()
+    """ End Test """
+
+
+def test_memoer_readies():
+    """Test Memoer queues each memo once for fuse when its last missing gram
+    arrives so partial memos are not rescanned
+    """
+    class CountMemoer(Memoer):
+        """Counts fuse calls"""
+        fuses = 0
+
+        def fuse(self, grams, cnt):
+            self.fuses += 1
+            return super().fuse(grams, cnt)
+
+    peer = CountMemoer(size=38, echoic=True)
+    peer.reopen()
+    assert not peer.readies
+    memos = [f"Memo {i} is split into many grams." for i in range(8)]
+    rended = [peer.rend(memo) for memo in memos]
+    for grams in rended:  # all but last gram of each memo
+        for gram in grams[:-1]:
+            peer.echos.append((gram, "beta"))
+    peer.serviceReceives()
+    assert len(peer.rxgs) == len(memos)
+    assert not peer.readies
+    for _ in range(10):  # idle passes do not fuse
+        peer.serviceRxGrams()
+    assert peer.fuses == 0
+
+    for grams in rended[::-1]:  # last grams out of order with replay
+        peer.echos.append((grams[-1], "beta"))
+        peer.echos.append((grams[-1], "beta"))
+    peer.serviceReceives()
+    assert len(peer.readies) == len(memos)  # queued once each
+    peer.serviceRxGrams()
+    assert peer.fuses == len(memos)
+    assert [memo for memo, src, vid in peer.rxms] == memos[::-1]
+    assert not peer.rxgs and not peer.counts and not peer.readies
+
+    # zeroth gram last drops out of range gram numbers
+    grams = rended[0]
+    mid, vid, gn, gc, code, body = peer.parse(grams[0])
+    peer.rxms.clear()
+    for gram in grams[:0:-1]:
+        peer.echos.append((gram, "beta"))
+    peer.serviceReceives()
+    peer.rxgs[mid][len(grams)] = b"bogus"  # out of range
+    peer.echos.append((grams[0], "beta"))
+    peer.serviceReceives()
+    assert list(peer.readies) == [mid]
+    assert len(peer.rxgs[mid]) == gc
+    peer.serviceRxGrams()
+    assert peer.rxms.popleft() == (memos[0], "beta", None)
+    """Done Test """
+
+
+def test_memoer_rx_eviction():
+    """Test Memoer evicts partial memos by reassembly tymer, total byte cap,
+    and per source byte cap
+    """
+    memo = "Lost grams leave partial memos behind. " * 4
+    peer = Memoer(size=38, rxtymeout=2.0, echoic=True)
+    peer.reopen()
+    tymist = tyming.Tymist(tock=1.0)
+    peer.wind(tymth=tymist.tymen())
+    assert peer.stats == dict(rxtymeout=0, rxcap=0, srccap=0)
+
+    grams = peer.rend(memo)
+    for gram in grams[:-1]:  # last gram lost
+        peer.echos.append((gram, "beta"))
+    peer.serviceReceives()
+    mid = list(peer.rxgs)[0]
+    assert list(peer.rxtymers) == [mid]
+    assert peer.rxsize == peer.rxsizes["beta"] == peer.rxloads["beta"][mid] > 0
+    tymist.tick()
+    peer.serviceRxGrams()
+    assert mid in peer.rxgs  # not yet expired
+    tymist.tick()
+    peer.serviceRxGrams()
+    assert peer.stats["rxtymeout"] == 1
+    assert not peer.rxgs and not peer.counts and not peer.sources
+    assert not peer.vids and not peer.rxtymers
+    assert not peer.rxloads and not peer.rxsizes and peer.rxsize == 0
+
+    # complete memo releases its tymer and load
+    for gram in grams:
+        peer.echos.append((gram, "beta"))
+    peer.serviceAllRx()
+    assert peer.inbox.popleft() == (memo, "beta", None)
+    assert not peer.rxtymers and peer.rxsize == 0
+
+    # flooding source evicts only its own oldest partial memos
+    rended = [peer.rend(memo) for i in range(4)]
+    peer = Memoer(size=38, srccap=200, rxcap=500, echoic=True)
+    peer.reopen()
+    for grams in rended[:3]:
+        for gram in grams[:-1]:
+            peer.echos.append((gram, "flood"))
+    for gram in rended[3][:2]:
+        peer.echos.append((gram, "beta"))
+    peer.serviceReceives()
+    assert peer.stats["srccap"] > 0
+    assert peer.rxsizes["flood"] <= 200
+    assert "beta" in peer.rxsizes  # not evicted by flood
+    assert peer.rxsize == sum(peer.rxsizes.values()) <= 500
+    mids = [peer.parse(grams[0])[0] for grams in rended]
+    assert mids[0] not in peer.rxgs  # oldest evicted first
+    assert mids[3] in peer.rxgs
+
+    # total cap evicts oldest partial memo of any source
+    peer = Memoer(size=38, rxcap=100, echoic=True)
+    peer.reopen()
+    for gram in rended[0][:-1]:
+        peer.echos.append((gram, "alpha"))
+    for gram in rended[1][:-1]:
+        peer.echos.append((gram, "beta"))
+    peer.serviceReceives()
+    assert peer.stats["rxcap"] > 0
+    assert peer.rxsize <= 100
+    assert mids[0] not in peer.rxgs
+    assert peer.rxsize == sum(peer.rxsizes.values())
+    """Done Test """
+
+
+class LossyMemoer(Memoer):
+    """Drops the first send of every fourth distinct gram or all sends when
+    .blackhole"""
+
+    def __init__(self, blackhole=False, **kwa):
+        super().__init__(**kwa)
+        self.blackhole = blackhole
+        self.seen = set()
+        self.sends = 0
+
+    def send(self, gram, dst, *, echoic=False):
+        self.sends += 1
+        gram = bytes(gram)
+        if self.blackhole:
+            return len(gram)
+        if gram not in self.seen:
+            self.seen.add(gram)
+            if len(self.seen) % 4 == 2:  # lost
+                return len(gram)
+        return super().send(gram, dst, echoic=echoic)
+
+
+def test_memoer_sure():
+    """Test Memoer sure delivery with selective acks, retransmits of lost
+    grams only, window per destination, and outcomes
+    """
+    try:
+        keep = _setupKeep()
+    except MemoerError as ex:
+        keep = None
+
+    memo = "Sure memo over a lossy link. " * 40
+    setups = [(MemoDex.GramSureZero, False, 38), (MemoDex.GramSureZero, True, 38)]
+    if keep:
+        setups.append((MemoDex.GramSureAuthZero, False, 200))
+    for code, curt, size in setups:
+        vid = list(keep)[0] if code in AuthDex else None
+        peer = LossyMemoer(code=code, curt=curt, size=size, window=8,
+                           keep=keep, vid=vid, echoic=True)
+        peer.reopen()
+        tymist = tyming.Tymist(tock=0.125)
+        peer.wind(tymth=tymist.tymen())
+
+        peer.memoit(memo, "beta")
+        peer.serviceTxMemos()
+        assert len(peer.txgs) == 4  # initial congestion window
+        mid, delivery = list(peer.deliveries.items())[0]
+        grams = peer.rend(memo, vid, mid=mid)  # same grams as delivery
+        count = delivery.count
+        assert count == len(grams) > 8
+        assert delivery.rended == 4  # pulled lazily as window opens
+        assert delivery.stream is not None
+        assert peer.flights["beta"] == 4
+        assert mid in peer.tymers
+
+        held = 0
+        for i in range(2000):
+            peer.service()
+            held = max(held, len(delivery.grams))
+            if peer.outcomes:
+                break
+            tymist.tick()
+        assert held <= 8  # only unacked grams within window are held
+        assert not delivery.grams and delivery.stream is None
+        assert peer.outcomes.popleft() == Outcome(mid=mid, dst="beta",
+                                                  memo=memo, delivered=True)
+        assert peer.inbox.popleft() == (memo, "beta", vid)
+        assert not peer.inbox
+        assert not peer.deliveries and not peer.tymers
+        assert peer.flights["beta"] == 0
+        assert peer.rtts["beta"][0] is not None  # round trip sampled
+        assert peer.dones[mid] == (count, vid)
+        datas = len([gram for gram in peer.seen if gram in grams])
+        assert datas == count
+        assert peer.sends < 3 * count  # only lost grams retransmitted
+
+        # retransmitted gram of fused memo is acked again not delivered
+        peer.echos.append((grams[1], "beta"))
+        peer.serviceAllRx()
+        assert not peer.inbox
+        assert len(peer.txgs) == 1  # ack
+        ack = peer.txgs.popleft()[0]
+        _, ackvid, cum, _, ackcode, body = peer.parse(ack)
+        assert ackcode == (AckDex.AckAuth if vid else AckDex.Ack)
+        assert (ackvid, cum, bytes(body)) == (vid, count, b"")
+
+    # sure grams are pulled only while .txgs is below .hwm
+    peer = Memoer(code=MemoDex.GramSureZero, size=38, hwm=2, echoic=True)
+    peer.reopen()
+    peer.memoit(memo, "beta")
+    peer.serviceTxMemos()
+    delivery = list(peer.deliveries.values())[0]
+    assert len(peer.txgs) == 2 == delivery.rended == len(delivery.grams)
+    peer.serviceTxGramsOnce()
+    peer.serviceTxMemos()
+    assert len(peer.txgs) == 2 and delivery.rended == 3
+
+    # selective ack ranges above cumulative
+    peer = Memoer(size=38, echoic=True)
+    ack = peer.rendAck(Memoer.makeMID(), 3, [(5, 7), (9, 10)])
+    _, _, cum, _, ackcode, body = peer.parse(ack)
+    assert (cum, ackcode) == (3, AckDex.Ack)
+    assert bytes(body) == bytes([0, 0, 5, 0, 0, 7, 0, 0, 9, 0, 0, 10])
+
+    # destination that never acks fails after retries
+    peer = LossyMemoer(blackhole=True, code=MemoDex.GramSureZero, size=38,
+                       retries=2, echoic=True)
+    peer.reopen()
+    tymist = tyming.Tymist(tock=0.125)
+    peer.wind(tymth=tymist.tymen())
+    peer.memoit("Into the void", "nowhere")
+    for i in range(200):
+        peer.service()
+        if peer.outcomes:
+            break
+        tymist.tick()
+    outcome = peer.outcomes.popleft()
+    assert (outcome.dst, outcome.memo, outcome.delivered) == \
+        ("nowhere", "Into the void", False)
+    assert peer.rtts["nowhere"][2] == 4.0  # backed off twice
+    assert peer.sends == 3 + 1 + 1  # 3 grams then window of 1 retried twice
+    assert not peer.deliveries and peer.flights["nowhere"] == 0
+    """Done Test """
+
+
+def test_memoer_sure_spoofed_ack():
+    """Test Memoer sure delivery ignores acks not from the destination or not
+    signed by the expected vid when signed
+    """
+    peer = Memoer(code=MemoDex.GramSureZero, size=38, echoic=True)
+    peer.reopen()
+    peer.memoit("Do not end me early", "beta")
+    peer.serviceTxMemos()
+    mid, delivery = list(peer.deliveries.items())[0]
+    count = delivery.count
+    assert delivery.rended == count == 4
+
+    peer.echos.append((Memoer(size=38).rendAck(mid, count), "mallory"))
+    peer.serviceReceives()
+    assert mid in peer.deliveries  # spoofed ack ignored
+    assert len(delivery.grams) == count and not delivery.cum
+    assert not peer.outcomes
+
+    peer.echos.append((Memoer(size=38).rendAck(mid, count), "beta"))
+    peer.serviceReceives()
+    assert mid not in peer.deliveries  # ack from destination
+    assert peer.outcomes.popleft().delivered
+
+    try:
+        keep = _setupKeep()
+        other = _setupKeep(salt=b"ponmlkjihgfedcba")
+    except MemoerError as ex:
+        return
+
+    vid = list(keep)[0]
+    ovid = list(other)[0]
+    keep.update(other)
+    for ackvids in (None, {"beta": ovid}):
+        peer = Memoer(code=MemoDex.GramSureAuthZero, size=200, keep=keep,
+                      vid=vid, ackvids=ackvids, echoic=True)
+        peer.reopen()
+        peer.memoit("Do not end me early", "beta")
+        peer.serviceTxMemos()
+        mid, delivery = list(peer.deliveries.items())[0]
+        count = delivery.count
+        expected = ovid if ackvids else vid
+        assert delivery.ackvid == expected
+        unexpected = vid if ackvids else ovid
+
+        peer.echos.append((Memoer(size=200).rendAck(mid, count), "beta"))
+        peer.echos.append((Memoer(size=200, keep=keep, vid=unexpected)
+                           .rendAck(mid, count), "beta"))
+        peer.echos.append((Memoer(size=200, keep=keep, vid=expected)
+                           .rendAck(mid, count), "mallory"))
+        peer.serviceReceives()
+        assert mid in peer.deliveries  # unsigned, wrong vid, or wrong src
+        assert not peer.outcomes
+
+        peer.echos.append((Memoer(size=200, keep=keep, vid=expected)
+                           .rendAck(mid, count), "beta"))
+        peer.serviceReceives()
+        assert mid not in peer.deliveries
+        assert peer.outcomes.popleft().delivered
+    """Done Test """
+
+
+class BottleMemoer(Memoer):
+    """Drops sends beyond .capacity per tyme like a bottleneck link. When
+    .blind ignores congestion and sends a full window unpaced"""
+
+    def __init__(self, capacity=8, blind=False, **kwa):
+        super().__init__(**kwa)
+        self.capacity = capacity
+        self.blind = blind
+        self.sends = 0
+        self.drops = 0
+        self.last = None
+        self.used = 0
+
+    def send(self, gram, dst, *, echoic=False):
+        self.sends += 1
+        if self.tyme != self.last:
+            self.last, self.used = self.tyme, 0
+        self.used += 1
+        if self.used > self.capacity:  # dropped at bottleneck
+            self.drops += 1
+            return len(gram)
+        return super().send(gram, dst, echoic=echoic)
+
+    def _congestion(self, dst):
+        cong = super()._congestion(dst)
+        if self.blind:
+            cong.cwnd = self.window
+        return cong
+
+    def _grow(self, dst, count):
+        if not self.blind:
+            super()._grow(dst, count)
+
+    def _shrink(self, dst, sent):
+        if not self.blind:
+            super()._shrink(dst, sent)
+
+    def _collapse(self, dst):
+        if not self.blind:
+            super()._collapse(dst)
+
+    def _refill(self, dst, cong, tyme):
+        if self.blind:
+            cong.tokens = math.inf
+        else:
+            super()._refill(dst, cong, tyme)
+
+
+def test_memoer_congestion():
+    """Test Memoer per destination congestion window and pacing of sure grams
+    """
+    peer = Memoer(code=MemoDex.GramSureZero, size=100, window=64)
+    assert peer.rate is None
+    cong = peer._congestion("beta")
+    assert cong == Congestion(cwnd=Memoer.Cwnd)
+    assert peer.congs["beta"] is cong
+
+    # slow start doubles per window then additive increase past ssthresh
+    peer._grow("beta", 4)
+    assert cong.cwnd == 8.0
+    peer._grow("beta", 8)
+    assert cong.cwnd == 16.0
+    peer._shrink("beta", 1.0)  # loss halves
+    assert cong.cwnd == cong.ssthresh == 8.0
+    assert cong.recover == 1.0
+    peer._shrink("beta", 0.5)  # same window of loss not halved again
+    assert cong.cwnd == 8.0
+    peer._grow("beta", 8)  # congestion avoidance
+    assert cong.cwnd == 9.0
+    peer._grow("beta", 10000)
+    assert cong.cwnd == peer.window  # capped at window
+    peer._collapse("beta")  # retry tymeout
+    assert cong.cwnd == 1.0
+    assert cong.ssthresh == peer.window / 2
+
+    # pacing at rate admits a burst then one gram per tick
+    memo = "Paced memo. " * 100
+    peer = Memoer(code=MemoDex.GramSureZero, size=100, window=64, rate=8.0)
+    peer.reopen()
+    tymist = tyming.Tymist(tock=0.125)
+    peer.wind(tymth=tymist.tymen())
+    peer.memoit(memo, "beta")
+    peer.serviceTxMemos()
+    assert len(peer.txgs) == Memoer.Burst
+    peer.congs["beta"].cwnd = 64.0  # window not the limit
+    peer.txgs.clear()
+    for i in range(3):
+        tymist.tick()
+        peer.serviceTxMemos()
+        assert len(peer.txgs) == 1  # 8 per second at 0.125 per tick
+        peer.txgs.clear()
+
+    # congestion control delivers through a bottleneck that blind sender floods
+    memo = "Congested memo. " * 1000
+    results = {}
+    for blind in (False, True):
+        peer = BottleMemoer(blind=blind, code=MemoDex.GramSureZero, size=100,
+                            window=256, echoic=True)
+        peer.reopen()
+        tymist = tyming.Tymist(tock=0.03125)
+        peer.wind(tymth=tymist.tymen())
+        peer.memoit(memo, "beta")
+        for i in range(500):
+            peer.service()
+            if peer.outcomes:
+                break
+            tymist.tick()
+        results[blind] = (peer.outcomes, peer.sends, peer.drops, peer.inbox)
+
+    outcomes, sends, drops, inbox = results[False]
+    assert outcomes[0].delivered
+    assert inbox.popleft() == (memo, "beta", None)
+    outs, blindSends, blindDrops, blindInbox = results[True]
+    assert not outs and not blindInbox  # flooded bottleneck never delivers
+    assert drops < blindDrops and sends < blindSends
+    """Done Test """
+
+
 def test_memoer_multiple_echoic_service_all():
     """Test Memoer class with small gram size and multiple queued memos
     Use .echoic property true so can service all
@@ -1359,6 +2074,113 @@ def test_memoer_authic():
     """ End Test """
 
 
+def test_memoer_chained():
+    """Test Memoer chained grams signed once with hash chained bodies
+    """
+    try:
+        keep = _setupKeep()
+    except MemoerError as ex:
+        return
+
+    vid = list(keep.keys())[0]
+    memo = "See ya later alligator!" * 20  # 460 chars
+    code = MemoDex.GramChainZero
+
+    for curt in (False, True):
+        peer = Memoer(code=code, curt=curt, size=240, keep=keep, vid=vid,
+                      authic=True, echoic=True)
+        peer.reopen()
+        assert peer.code == 'bAAK'
+        assert peer.Pairs[peer.code] == MemoDex.GramChain
+        grams = peer.rend(memo)
+        zoz = 208 if not curt else 156  # zeroth overhead with vid root and sig
+        noz = 76 if not curt else 57  # non-zeroth overhead with next link
+        assert len(grams[0]) == 240
+        assert all(len(gram) <= 240 for gram in grams[1:])
+        if not curt:
+            assert len(grams) == 1 + math.ceil((len(memo) - (240 - zoz)) / (240 - noz))
+        rz, sz = (44, 88) if not curt else (33, 66)
+        bodies = [bytes(gram[noz - rz:-rz]) for gram in grams[1:]]
+        root = grams[0][-(rz + sz):-sz]
+        if curt:
+            root = encodeB64(root)
+        assert Memoer._decodeDIG(root) == (Memoer._chain(bodies), 'F')
+        for gn, gram in enumerate(grams[1:], start=1):  # each ends with next link
+            assert peer._nextLink(gram) == Memoer._chain(bodies[gn:])
+
+        # deliver out of order
+        for gram in reversed(grams):
+            peer.echos.append((gram, "beta"))
+        peer.serviceReceives()
+        assert len(peer.chained) == 1
+        assert len(peer.roots) == 1
+        assert not peer.pends[list(peer.pends)[0]]  # all verified by zeroth
+        peer.serviceRxGrams()
+        assert peer.rxms.popleft() == (memo, "beta", vid)
+        assert not peer.roots and not peer.chained and not peer.rxgs
+        assert not peer.links and not peer.pends
+
+        # forged gram is dropped alone so later genuine copy is accepted
+        grams = peer.rend(memo)
+        mid = peer.parse(grams[0])[0]
+        peer.roots.clear()
+        for i in (1, 2):  # forged body and forged next link
+            forged = bytearray(grams[i])
+            forged[-1 if i == 1 else 40] ^= 0x01
+            peer.echos.append((bytes(forged), "mallory"))
+            peer.echos.append((grams[i - 1], "beta"))
+            peer.serviceReceives()
+            assert i not in peer.rxgs[mid]
+            assert not peer.pends[mid]
+        for gram in grams[1:]:
+            peer.echos.append((gram, "beta"))
+        peer.serviceReceives()
+        peer.serviceRxGrams()
+        assert peer.rxms.popleft() == (memo, "beta", vid)
+        assert not peer.rxgs and not peer.roots and not peer.chained
+
+        # forged gram before zeroth is pending and does not poison memo
+        grams = peer.rend(memo)
+        forged = bytearray(grams[2])
+        forged[-50] ^= 0x01  # in body
+        peer.echos.append((bytes(forged), "mallory"))
+        for gram in grams[1:]:
+            peer.echos.append((gram, "beta"))
+        peer.serviceReceives()
+        mid = list(peer.rxgs.keys())[0]
+        assert mid in peer.chained
+        assert not peer.rxgs[mid]  # without signed zeroth root all pending
+        assert len(peer.pends[mid][2]) == 2
+        assert peer.rxsize == sum(len(gram) - noz for gram in grams[1:]) + len(forged) - noz
+        assert mid not in peer.counts and not peer.readies
+        peer.echos.append((grams[0], "beta"))
+        peer.serviceReceives()
+        assert not peer.pends[mid]
+        assert len(peer.rxgs[mid]) == len(grams)
+        peer.serviceRxGrams()
+        assert peer.rxms.popleft() == (memo, "beta", vid)
+        assert not peer.rxgs and not peer.roots and not peer.chained
+        assert not peer.rxsize
+
+        # unchained grams of chained memo are dropped when not authic
+        grams = peer.rend(memo)
+        mid = peer.parse(grams[0])[0]
+        plain = Memoer(size=240, curt=curt).rend(memo, mid=mid)
+        other = Memoer(keep=keep, echoic=True)  # accepts unsigned grams
+        other.reopen()
+        other.echos.append((plain[1], "mallory"))  # dropped once chained
+        other.echos.append((grams[0], "beta"))
+        other.echos.append((plain[2], "mallory"))
+        for gram in grams[1:]:
+            other.echos.append((gram, "beta"))
+        other.serviceReceives()
+        other.serviceRxGrams()
+        assert other.rxms.popleft() == (memo, "beta", vid)
+        assert not other.rxms and not other.rxgs and not other.rxsize
+
+    """Done Test """
+
+
 def test_memoer_multiple_signed_verific_echoic_service_all():
     """Test Memoer class with small gram size and multiple queued memos signed
     using echos for transport
@@ -1834,14 +2656,25 @@ if __name__ == "__main__":
     test_memoer_class()
     test_setup_keep()
     test_memoer_sign_verify()
+    test_memoer_key_caches()
     test_memoer_basic()
     test_memoer_small_gram_size()
+    test_memoer_rend_linear()
+    test_memoer_stream_hwm()
+    test_memoer_zero_copy()
     test_memoer_multiple()
     test_memoer_multiple_echoic_service_tx_rx()
+    test_memoer_budget_service_rx()
+    test_memoer_readies()
+    test_memoer_rx_eviction()
+    test_memoer_sure()
+    test_memoer_sure_spoofed_ack()
+    test_memoer_congestion()
     test_memoer_multiple_echoic_service_all()
     test_memoer_basic_signed()
     test_memoer_multiple_signed()
     test_memoer_authic()
+    test_memoer_chained()
     test_memoer_multiple_signed_verific_echoic_service_all()
     test_open_memoer()
     test_memoer_doer()
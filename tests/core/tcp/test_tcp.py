@@ -15,6 +15,7 @@ import ssl
 
 from hio.base import tyming, doing
 from hio.core import tcp
+from hio.help import Budget
 
 def test_tcp_basic():
     """
@@ -577,6 +578,85 @@ def test_tcp_service():
 
     """Done Test"""
 
+
+def test_tcp_service_budget():
+    """
+    Test tcp service receives bounded by Budget and round robin across ixes
+    """
+    tymist = tyming.Tymist()
+    budget = Budget(items=3)
+    with tcp.openServer(tymth=tymist.tymen(), ha=("", 6101), bs=4,
+                        budget=budget) as server, \
+         tcp.openClient(tymth=tymist.tymen(), ha=("127.0.0.1", 6101)) as beta, \
+         tcp.openClient(tymth=tymist.tymen(), ha=("127.0.0.1", 6101)) as gamma:
+
+        assert server.budget is budget
+
+        while not (beta.connected and beta.ca in server.ixes):
+            beta.serviceConnect()
+            server.serviceConnects()
+            time.sleep(0.05)
+
+        while not (gamma.connected and gamma.ca in server.ixes):
+            gamma.serviceConnect()
+            server.serviceConnects()
+            time.sleep(0.05)
+
+        ixBeta = server.ixes[beta.ca]
+        ixGamma = server.ixes[gamma.ca]
+        assert ixBeta.bs == ixGamma.bs == 4  # one reception is 4 bytes
+
+        beta.tx(b"Beta floods Server")  # 18 bytes
+        gamma.tx(b"Gamma 8b")  # 8 bytes
+        beta.serviceSends()
+        gamma.serviceSends()
+        time.sleep(0.05)
+
+        server.serviceReceivesAllIx()  # beta, gamma, beta
+        assert bytes(ixBeta.rxbs) == b"Beta flo"
+        assert bytes(ixGamma.rxbs) == b"Gamm"
+        assert budget.count == 3
+        assert budget.stops == 1
+
+        server.serviceReceivesAllIx()  # resumes after beta so gamma, beta, beta
+        assert bytes(ixGamma.rxbs) == b"Gamma 8b"
+        assert bytes(ixBeta.rxbs) == b"Beta floods Serv"
+
+        server.serviceReceivesAllIx()  # remainder
+        assert bytes(ixBeta.rxbs) == b"Beta floods Server"
+        assert budget.count == 1
+        assert budget.stops == 2
+
+        # remoter budget bounds its own greedy service receives
+        ixBeta.clearRxbs()
+        ixBeta.budget = Budget(size=8)
+        beta.tx(b"Beta again")
+        beta.serviceSends()
+        time.sleep(0.05)
+        ixBeta.serviceReceives()
+        assert bytes(ixBeta.rxbs) == b"Beta aga"
+        assert ixBeta.budget.stops == 1
+        ixBeta.serviceReceives()
+        assert bytes(ixBeta.rxbs) == b"Beta again"
+        assert ixBeta.budget.stops == 1
+
+        # client budget bounds its greedy service receives
+        beta.budget = Budget(items=1)
+        beta.bs = 4
+        ixBeta.tx(b"to beta")
+        ixBeta.serviceSends()
+        time.sleep(0.05)
+        beta.serviceReceives()
+        assert bytes(beta.rxbs) == b"to b"
+        assert beta.budget.stops == 1
+        beta.serviceReceives()
+        assert bytes(beta.rxbs) == b"to beta"
+        assert beta.budget.spent  # spent on last reception so not a stop
+        assert beta.budget.stops == 1
+
+    """Done Test"""
+
+
 def test_client_auto_reconnect():
     """
     Test client auto reconnect when  .reconnectable
@@ -1520,5 +1600,67 @@ def test_echo_server_client_doers():
     """End Test """
 
 
+def test_server_client_doers_unwatch():
+    """
+    Test ServerDoer and ClientDoer unwatch sockets of removed connections
+    and of reconnected clients so the waker selector map does not grow
+    """
+    import selectors
+
+    tymist = tyming.Tymist()
+    waker = doing.Waker()
+    waker._selector = selectors.SelectSelector()  # fails on closed fds
+    port = 6121
+    server = tcp.Server(host="", port=port)
+    serdoer = tcp.ServerDoer(tymth=tymist.tymen(), server=server)
+    serdoer.waker = waker
+    serdoer.enter()
+    assert len(waker.selector.get_map()) == 1  # listen socket
+
+    for i in range(8):  # churn connections
+        client = tcp.Client(tymth=tymist.tymen(), host="127.0.0.1", port=port)
+        client.reopen()
+        while not (client.connected and client.ca in server.ixes):
+            client.serviceConnect()
+            serdoer.recur(tymist.tyme)
+            time.sleep(0.01)
+        assert len(waker.selector.get_map()) == 2
+        client.close()
+        server.removeIx(client.ca)  # closes connection socket
+        serdoer.recur(tymist.tyme)
+        assert len(waker.selector.get_map()) == 1
+        assert waker.wait(timeout=0.0) == 0  # no closed socket selected
+
+    # closed socket left registered is pruned when select fails
+    client = tcp.Client(tymth=tymist.tymen(), host="127.0.0.1", port=port)
+    clidoer = tcp.ClientDoer(tymth=tymist.tymen(), client=client)
+    clidoer.waker = waker
+    clidoer.enter()
+    assert len(waker.selector.get_map()) == 2
+    old = client.cs
+    client.reopen()  # reconnect with new socket
+    assert client.cs is not old
+    clidoer.watch()
+    keys = waker.selector.get_map()
+    assert len(keys) == 2
+    assert client.cs in [key.fileobj for key in keys.values()]
+
+    waker.watch(old, selectors.EVENT_READ, clidoer)
+    assert old.fileno() == -1  # closed so can not be watched
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    waker.watch(sock, selectors.EVENT_READ, clidoer)
+    sock.close()  # closed while registered
+    assert len(waker.selector.get_map()) == 3
+    waker.wait(timeout=0.0)
+    assert len(waker.selector.get_map()) == 2
+    assert waker.prune() == 0
+
+    clidoer.exit()
+    serdoer.exit()
+    assert len(waker.selector.get_map()) == 0
+    waker.close()
+    """End Test """
+
+
 if __name__ == "__main__":
     test_tcp_tls_server_with_client_abort_handshake()
@@ -319,9 +319,91 @@ def test_peermemoer_doer():
     """Done Test"""
 
 
+class LossyPeerMemoer(peermemoing.PeerMemoer):
+    """Drops the first send of every fourth distinct gram"""
+
+    def __init__(self, **kwa):
+        super().__init__(**kwa)
+        self.seen = set()
+
+    def send(self, gram, dst, *, echoic=False):
+        gram = bytes(gram)
+        if gram not in self.seen:
+            self.seen.add(gram)
+            if len(self.seen) % 4 == 2:  # lost
+                return len(gram)
+        return super().send(gram, dst, echoic=echoic)
+
+
+def test_peermemoer_sure():
+    """Test PeerMemoer sure delivery over lossy UDP with selective acks
+    """
+    tymist = tyming.Tymist(tock=0.03125)
+    memo = "Reliable memo over lossy udp. " * 100
+    alpha = LossyPeerMemoer(name="alpha", temp=True, port=6107, size=100,
+                            code=MemoDex.GramSureZero, window=16)
+    beta = peermemoing.PeerMemoer(name="beta", temp=True, port=6108, size=100)
+    alpha.wind(tymth=tymist.tymen())
+    beta.wind(tymth=tymist.tymen())
+    assert alpha.reopen() and beta.reopen()
+
+    alpha.memoit(memo, beta.path)
+    for i in range(2000):
+        alpha.service()
+        beta.service()
+        if alpha.outcomes:
+            break
+        tymist.tick()
+        time.sleep(0.001)
+
+    outcome = alpha.outcomes.popleft()
+    assert outcome.delivered
+    assert outcome.dst == beta.path
+    assert beta.inbox.popleft() == (memo, alpha.path, None)
+    assert not beta.inbox
+    assert not alpha.deliveries and alpha.flights[beta.path] == 0
+    assert not beta.rxgs and outcome.mid in beta.dones
+
+    alpha.close()
+    beta.close()
+    """Done Test"""
+
+
 if __name__ == "__main__":
     test_memoer_peer_basic()
     test_memoer_peer_open()
     test_peermemoer_doer()
+    test_peermemoer_sure()
 
 
+
+
+def test_peermemoer_doer_waker():
+    """Test PeerMemoerDoer woken by Doist .waker when socket ready
+    """
+    tock = 0.03125
+    alpha = peermemoing.PeerMemoer(name="alpha", temp=True, port=6105)
+    beta = peermemoing.PeerMemoer(name="beta", temp=True, port=6106)
+    alphaDoer = peermemoing.PeerMemoerDoer(peer=alpha, tock=1.0)
+    betaDoer = peermemoing.PeerMemoerDoer(peer=beta, tock=1.0)
+    doist = doing.Doist(tock=tock, limit=0.75, select=True)
+    tymes = []
+
+    def sendDo(tymth=None, tock=0.0, **opts):
+        tyme = yield
+        while tyme < 0.25:
+            tyme = yield
+        alpha.memoit("Hello there.", beta.path)
+        alphaDoer.waker.wake(alphaDoer)  # hand off so alpha sends next pass
+        while not beta.inbox:
+            tyme = yield
+        tymes.append(tyme)
+        return True
+
+    doist.do(doers=[alphaDoer, betaDoer, doing.doify(sendDo)])
+    assert alphaDoer.waker is betaDoer.waker is doist.waker
+    assert beta.inbox[0] == ("Hello there.", alpha.path, None)
+    assert tymes[0] < 0.5  # received well before beta's tock of 1.0
+    assert not alpha.opened
+    assert not beta.opened
+    """Done Test"""
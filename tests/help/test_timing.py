@@ -10,7 +10,7 @@ import asyncio
 import pytest
 
 from hio.help.timing import TimerError, RetroTimerError
-from hio.help.timing import Timer, MonoTimer, AsyncTimer
+from hio.help.timing import Timer, MonoTimer, NanoTimer, AsyncTimer, Budget
 from hio.help.timing import nowIso8601, fromIso8601, toIso8601
 
 
@@ -144,6 +144,88 @@ def test_monotimer():
     """End Test """
 
 
+def test_nanotimer():
+    """
+    Test NanoTimer class
+    """
+    timer = NanoTimer()
+    assert timer.duration == 0.0
+    time.sleep(0.001)
+    assert timer.elapsed > 0.0
+    assert timer.remaining < 0.0
+    assert timer.expired == True
+
+    timer.restart(duration=0.125)
+    assert timer.duration == 0.125
+    assert timer.remaining > 0.0
+    assert timer.expired == False
+    time.sleep(0.125)
+    assert timer.expired == True
+
+    timer = NanoTimer(duration=0.001)
+    begin = timer.deadline - 1_000_000
+    for i in range(1000):  # lossless restarts in integer nanoseconds
+        timer.restart()
+    assert timer.deadline == begin + 1_001_000_000
+    assert timer.duration == 0.001
+
+    timer = NanoTimer(duration=0.125, start=time.monotonic() - 0.05)
+    assert timer.duration == 0.125
+    assert 0.05 <= timer.elapsed < 0.125
+    assert timer.remaining < 0.075
+
+    # wait sleeps then spins final slice
+    timer = NanoTimer(duration=0.01)
+    late = timer.wait(spin=0.002)
+    assert timer.expired == True
+    assert 0.0 <= late < 0.002
+    assert time.monotonic_ns() >= timer.deadline
+
+    late = timer.wait()  # already expired so returns at once
+    assert late > 0.0
+    """End Test """
+
+
+def test_budget():
+    """
+    Test Budget class
+    """
+    budget = Budget()  # unbounded
+    assert repr(budget) == "Budget(items=None, size=None, micros=None)"
+    assert budget.count == budget.total == budget.stops == 0
+    for i in range(100):
+        assert budget.spend(size=1024) == False
+    assert budget.spent == False
+    assert budget.count == 100
+    assert budget.total == 102400
+
+    budget = Budget(items=2)
+    assert budget.spend(size=10) == False
+    assert budget.spend(size=10) == True
+    assert budget.spent == True
+    assert budget.stops == 0  # caller counts stop only when work is left
+    budget.stop()
+    assert budget.stops == 1
+    budget.start()
+    assert budget.spent == False
+    assert budget.count == budget.total == 0
+    assert budget.stops == 1
+
+    budget = Budget(size=16)
+    assert budget.spend(size=10) == False
+    assert budget.spend(size=10) == True
+    assert budget.total == 20
+
+    budget = Budget(micros=1000.0)
+    assert budget.spent == False
+    time.sleep(0.002)
+    assert budget.elapsed >= 1000.0
+    assert budget.spent == True
+    assert budget.spend() == True
+    assert budget.stops == 0
+    """End Test """
+
+
 def test_iso8601():
     """
     Test datetime ISO 8601 helpers
@@ -203,4 +285,6 @@ def test_iso8601():
 if __name__ == "__main__":
     test_timer()
     test_monotimer()
+    test_nanotimer()
+    test_budget()
     test_iso8601()